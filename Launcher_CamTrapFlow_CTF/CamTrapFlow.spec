@@ -1,9 +1,14 @@
 # -*- mode: python ; coding: utf-8 -*-
 """
 CamTrapFlow PyInstaller Spec File
-Configuración para generar ejecutable one-file de Launcher_CamTrapFlow.exe
+Configuración para generar la carpeta onedir de CamTrapFlow.exe
 
 Uso: python -m PyInstaller CamTrapFlow.spec --clean
+Salida: dist/CamTrapFlow/ (CamTrapFlow.exe + assets/ + config.json)
+
+Los módulos (Img2WI, WI2CamtrapDP, WIsualization) se compilan también en modo
+onedir y se copian a dist/CamTrapFlow/bin/<Módulo>/. No se empaquetan dentro del
+lanzador: así ningún ejecutable descomprime su runtime en _MEIPASS al iniciar.
 """
 
 import sys
@@ -12,7 +17,6 @@ from pathlib import Path
 # Rutas base
 SCRIPT_DIR = Path.cwd()
 ASSETS_DIR = SCRIPT_DIR / 'assets'
-BIN_DIR = SCRIPT_DIR / 'bin'
 
 # Configuración de datos empaquetados
 datas_list = []
@@ -24,15 +28,6 @@ if ASSETS_DIR.exists():
     if (ASSETS_DIR / 'logo_humboldt.png').exists():
         datas_list.append((str(ASSETS_DIR / 'logo_humboldt.png'), 'assets'))
 
-# Agregar ejecutables de módulos como data files (no como binaries)
-if BIN_DIR.exists():
-    if (BIN_DIR / 'Img2WI.exe').exists():
-        datas_list.append((str(BIN_DIR / 'Img2WI.exe'), 'bin'))
-    if (BIN_DIR / 'WI2CamtrapDP.exe').exists():
-        datas_list.append((str(BIN_DIR / 'WI2CamtrapDP.exe'), 'bin'))
-    if (BIN_DIR / 'WIsualization.exe').exists():
-        datas_list.append((str(BIN_DIR / 'WIsualization.exe'), 'bin'))
-
 # Agregar config.json si existe
 if (SCRIPT_DIR / 'config.json').exists():
     datas_list.append((str(SCRIPT_DIR / 'config.json'), '.'))
@@ -42,7 +37,7 @@ block_cipher = None
 a = Analysis(
     ['Lanzador.py'],
     pathex=[],
-    binaries=[],  # Vacío - los .exe de módulos van en datas
+    binaries=[],  # Vacío - los módulos se distribuyen en bin/ junto al .exe
     datas=datas_list,
     hiddenimports=['tkinter', 'tkinter.ttk', 'tkinter.messagebox'],
     hookspath=[],
@@ -57,25 +52,35 @@ a = Analysis(
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
+# ONE-DIR: el .exe solo contiene el bootloader y los scripts; el runtime va en COLLECT
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='CamTrapFlow',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
     upx=True,
     upx_exclude=[],
-    runtime_tmpdir=None,
     console=False,  # Sin consola - aplicación GUI
     disable_windowed_traceback=False,
     argv_emulation=False,
     target_arch=None,
     codesign_identity=None,
     entitlements_file=None,
+    contents_directory='.',  # assets/ y config.json quedan junto a CamTrapFlow.exe
     icon=str(ASSETS_DIR / 'icon.ico') if (ASSETS_DIR / 'icon.ico').exists() else None,
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name='CamTrapFlow',
+)
@@ -17,8 +17,8 @@ Características principales:
     - Sistema de diálogos de carga con feedback visual progresivo
     - Configuración externa vía JSON para duraciones y dimensiones de ventana
     - Logging dual (archivo + consola) para diagnóstico y troubleshooting
-    - Compatible con PyInstaller one-file y modo desarrollo
-    - Gestión robusta de rutas para recursos empaquetados (_MEIPASS)
+    - Compatible con PyInstaller onedir y modo desarrollo
+    - Gestión robusta de rutas para recursos empaquetados (junto al ejecutable)
 
 Módulo: Lanzador.py
 Autores: Cristian C. Acevedo & Angélica Díaz-Pulido
@@ -30,12 +30,19 @@ Licencia: Ver LICENSE
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import subprocess
+import tkinter.font as tkfont
+import itertools
+import os
+import queue
+import re
 import sys
+import threading
 import logging
-import json
+import logging.handlers
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
 
 # =============================================================================================
 # CONFIGURACIÓN Y LOGGING
@@ -46,27 +53,54 @@ def setup_logging():
     
     Crea launcher.log con nivel INFO para eventos importantes.
     Para debug detallado cambiar a level=logging.DEBUG.
+    
+    En el ejecutable empaquetado solo se escribe launcher.log si la variable
+    de entorno CTF_DEBUG está definida; en desarrollo siempre se escribe.
+    El archivo se abre al primer registro (delay=True) y las escrituras se
+    agrupan en un MemoryHandler: se vuelcan cada 64 registros, ante un
+    WARNING o superior, o al cerrar la aplicación.
     """
-    log_file = Path(__file__).parent / "launcher.log"
+    handlers = [logging.StreamHandler(sys.stdout)]
+    
+    file_handler = None
+    if os.environ.get("CTF_DEBUG") or not getattr(sys, "frozen", False):
+        log_file = Path(__file__).parent / "launcher.log"
+        file_handler = logging.handlers.MemoryHandler(
+            capacity=64,
+            flushLevel=logging.WARNING,
+            target=logging.FileHandler(log_file, encoding='utf-8', delay=True)
+        )
+        handlers.insert(0, file_handler)
     
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
+        handlers=handlers
     )
+    if file_handler is not None:
+        # basicConfig solo asigna el formato a los handlers sin formatter propio
+        file_handler.target.setFormatter(file_handler.formatter)
     
     logging.info("=== Iniciando CamTrapFlow Launcher ===")
-    logging.info(f"Python version: {sys.version}")
-    logging.info(f"Working directory: {Path.cwd()}")
-    logging.info(f"Frozen: {getattr(sys, 'frozen', False)}")
+    logging.info("Python version: %s", sys.version)
+    logging.info("Working directory: %s", Path.cwd())
+    logging.info("Frozen: %s", getattr(sys, 'frozen', False))
 
 # =============================================================================================
 # GESTIÓN DE RECURSOS
 # =============================================================================================
 
+@lru_cache(maxsize=1)
+def app_dir() -> Path:
+    """
+    Directorio base de la aplicación.
+    
+    Returns:
+        Path: Carpeta del ejecutable (PyInstaller onedir) o de __file__ (desarrollo)
+    """
+    return Path(sys.executable).parent if getattr(sys, "frozen", False) else Path(__file__).parent
+
+@lru_cache(maxsize=None)
 def resource_path(*parts: str) -> Path:
     """
     Construye rutas absolutas compatibles con PyInstaller y desarrollo.
@@ -77,10 +111,12 @@ def resource_path(*parts: str) -> Path:
     Returns:
         Path: Ruta absoluta al recurso
     
-    Usa _MEIPASS en executables PyInstaller, __file__ en desarrollo.
+    En el build onedir los recursos están junto al ejecutable (sin _MEIPASS).
     """
-    base = Path(getattr(sys, "_MEIPASS", Path(__file__).parent))
-    return base.joinpath(*parts)
+    return app_dir().joinpath(*parts)
+
+# Fuente compartida por botones y encabezados en negrita
+FONT_BOLD = ("Segoe UI", 10, "bold")
 
 def setup_ttk_styles():
     """
@@ -126,212 +162,233 @@ def setup_ttk_styles():
         'error': '#DC3545'
     }
     
-    # Estilos para tarjetas de módulos
-    style.configure("ModuleCard.TLabelframe",
-                   background=colors['surface'],
-                   borderwidth=2,
-                   relief="ridge",
-                   padding=15)
-    
-    style.configure("ModuleCard.TLabelframe.Label",
-                   background=colors['surface'],
-                   foreground=colors['primary'],
-                   font=("Segoe UI", 11, "bold"))
-    
-    style.configure("Card.TFrame",
-                   background=colors['surface'])
-    
-    style.configure("ModuleDesc.TLabel",
-                   background=colors['surface'],
-                   foreground=colors['text_secondary'],
-                   font=("Segoe UI", 10))
-    
-    # Estilo principal de botones con efectos hover
-    style.configure("Professional.TButton",
-                   font=("Segoe UI", 10, "bold"),
-                   padding=(15, 8),
-                   relief="raised",
-                   borderwidth=2,
-                   focuscolor='none',
-                   anchor='center',
-                   width=15,
-                   background=colors['primary'],
-                   foreground='white')
+    # Tabla de estilos: (nombre, opciones) aplicada en un solo recorrido
+    button_base = {
+        'font': FONT_BOLD,
+        'padding': (15, 8),
+        'borderwidth': 2,
+        'focuscolor': 'none',
+        'anchor': 'center',
+        'width': 15,
+        'foreground': 'white',
+    }
+    styles = [
+        # Tarjetas de módulos
+        ("ModuleCard.TLabelframe", {'background': colors['surface'], 'borderwidth': 2,
+                                    'relief': "ridge", 'padding': 15}),
+        ("ModuleCard.TLabelframe.Label", {'background': colors['surface'], 'foreground': colors['primary'],
+                                          'font': ("Segoe UI", 11, "bold")}),
+        ("Card.TFrame", {'background': colors['surface']}),
+        ("ModuleDesc.TLabel", {'background': colors['surface'], 'foreground': colors['text_secondary'],
+                               'font': ("Segoe UI", 10)}),
+        # Botón principal y alternativo con mayor contraste
+        ("Professional.TButton", {**button_base, 'relief': "raised", 'background': colors['primary']}),
+        ("HighContrast.TButton", {**button_base, 'relief': "solid", 'background': colors['button_bg']}),
+        # Ventana principal
+        ("Main.TFrame", {'background': colors['background']}),
+        ("Header.TLabel", {'background': colors['background'], 'foreground': colors['primary'],
+                           'font': ("Segoe UI", 20, "bold")}),
+        ("SubHeader.TLabel", {'background': colors['background'], 'foreground': colors['text_secondary'],
+                              'font': ("Segoe UI", 11)}),
+        ("Version.TLabel", {'background': colors['background'], 'foreground': colors['primary_light'],
+                            'font': ("Segoe UI", 10, "italic")}),
+        ("SectionHeader.TLabel", {'background': colors['background'], 'foreground': colors['primary'],
+                                  'font': ("Segoe UI", 12, "bold")}),
+        ("Note.TLabel", {'background': colors['background'], 'foreground': colors['text_secondary'],
+                         'font': ("Segoe UI", 9)}),  # Fuente más pequeña para la nota
+    ]
+    for name, cfg in styles:
+        style.configure(name, **cfg)
+    
+    # Efectos hover/pressed de los botones (compartidos entre ambos estilos)
+    btn_fg_map = [('active', 'white'),
+                  ('pressed', 'white'),
+                  ('disabled', colors['text_secondary']),
+                  ('!disabled', 'white')]
+    
+    def btn_bg_map(base):
+        return [('active', colors['primary_light']),
+                ('pressed', colors['primary_dark']),
+                ('disabled', colors['border']),
+                ('!disabled', base)]
     
     style.map("Professional.TButton",
-             background=[('active', colors['primary_light']),
-                        ('pressed', colors['primary_dark']),
-                        ('disabled', colors['border']),
-                        ('!disabled', colors['primary'])],
-             foreground=[('active', 'white'),
-                        ('pressed', 'white'),
-                        ('disabled', colors['text_secondary']),
-                        ('!disabled', 'white')],
+             background=btn_bg_map(colors['primary']),
+             foreground=btn_fg_map,
              relief=[('pressed', 'sunken'),
                     ('!pressed', 'raised')],
              bordercolor=[('active', colors['primary_dark']),
                          ('!active', colors['primary_dark'])])
     
-    # Estilo alternativo con mayor contraste
-    style.configure("HighContrast.TButton",
-                   font=("Segoe UI", 10, "bold"),
-                   padding=(15, 8),
-                   relief="solid",
-                   borderwidth=2,
-                   focuscolor='none',
-                   anchor='center',
-                   width=15,
-                   background=colors['button_bg'],
-                   foreground='white')
-    
     style.map("HighContrast.TButton",
-             background=[('active', colors['primary_light']),
-                        ('pressed', colors['primary_dark']),
-                        ('disabled', colors['border']),
-                        ('!disabled', colors['button_bg'])],
-             foreground=[('active', 'white'),
-                        ('pressed', 'white'),
-                        ('disabled', colors['text_secondary']),
-                        ('!disabled', 'white')],
+             background=btn_bg_map(colors['button_bg']),
+             foreground=btn_fg_map,
              relief=[('pressed', 'sunken'),
                     ('!pressed', 'solid')],
              bordercolor=[('active', colors['primary_light']),
                          ('!active', colors['button_bg'])])
     
-    style.configure("Main.TFrame",
-                   background=colors['background'])
+    return colors
+
+# Ejecutables ya localizados (solo se memorizan rutas existentes)
+_EXE_PATHS: dict[str, Path] = {}
+
+def exe_path(exe_name: str) -> Path:
+    """
+    Localiza ejecutable del módulo en bin/, bin/<módulo>/ (onedir) o directorio base.
     
-    style.configure("Header.TLabel",
-                   background=colors['background'],
-                   foreground=colors['primary'],
-                   font=("Segoe UI", 20, "bold"))
+    Las rutas encontradas se memorizan en _EXE_PATHS; si el ejecutable no
+    existe se vuelve a buscar en el siguiente intento.
     
-    style.configure("SubHeader.TLabel",
-                   background=colors['background'],
-                   foreground=colors['text_secondary'],
-                   font=("Segoe UI", 11))
+    Returns:
+        Path: Ruta al ejecutable (existe o primer candidato para error)
+    """
+    cached = _EXE_PATHS.get(exe_name)
+    if cached is not None:
+        return cached
     
-    style.configure("Version.TLabel",
-                   background=colors['background'],
-                   foreground=colors['primary_light'],
-                   font=("Segoe UI", 10, "italic"))
+    logging.debug("Buscando ejecutable: %s", exe_name)
     
-    style.configure("SectionHeader.TLabel",
-                   background=colors['background'],
-                   foreground=colors['primary'],
-                   font=("Segoe UI", 12, "bold"))  # Reducido de 16 a 14
+    base = app_dir()
+    candidates = [
+        ("bin", base / "bin" / exe_name),
+        ("onedir", base / "bin" / Path(exe_name).stem / exe_name),
+        ("plano", base / exe_name),
+    ]
     
-    style.configure("Note.TLabel",
-                   background=colors['background'],
-                   foreground=colors['text_secondary'],
-                   font=("Segoe UI", 9))  # Fuente más pequeña para la nota
+    for kind, cand in candidates:
+        logging.debug("Verificando ruta %s: %s", kind, cand)
+        if cand.exists():
+            logging.info("Ejecutable encontrado (%s): %s", kind, cand)
+            _EXE_PATHS[exe_name] = cand
+            return cand
     
-    return colors
+    logging.warning("Ejecutable no encontrado: %s", exe_name)
+    return candidates[0][1]
 
-def exe_path(exe_name: str) -> Path:
-    """
-    Localiza ejecutable del módulo en _MEIPASS/bin, bin/ o directorio base.
-    
-    Returns:
-        Path: Ruta al ejecutable (existe o último candidato para error)
-    """
-    logging.debug(f"Buscando ejecutable: {exe_name}")
-    
-    # Buscar en _MEIPASS/bin (PyInstaller one-file)
-    meipass = getattr(sys, "_MEIPASS", None)
-    if meipass:
-        p = Path(meipass) / "bin" / exe_name
-        logging.debug(f"Verificando ruta PyInstaller: {p}")
-        if p.exists():
-            logging.info(f"Ejecutable encontrado (PyInstaller): {p}")
-            return p
-    
-    # Buscar en bin/ (desarrollo)
-    base = Path(sys.executable).parent if getattr(sys, "frozen", False) else Path(__file__).parent
-    cand = base / "bin" / exe_name
-    logging.debug(f"Verificando ruta dev: {cand}")
-    if cand.exists():
-        logging.info(f"Ejecutable encontrado (dev): {cand}")
-        return cand
-    
-    # Buscar en directorio base
-    cand2 = base / exe_name
-    logging.debug(f"Verificando ruta plana: {cand2}")
-    if cand2.exists():
-        logging.info(f"Ejecutable encontrado (plano): {cand2}")
-        return cand2
-    
-    logging.warning(f"Ejecutable no encontrado: {exe_name}")
-    return cand
+# Resultado de validate_resources (los assets no cambian durante la ejecución)
+_RESOURCES_STATUS: tuple[bool, list[str]] | None = None
 
 def validate_resources() -> tuple[bool, list[str]]:
     """
     Valida existencia de recursos necesarios (iconos, imágenes).
     
+    Lee la carpeta assets/ una sola vez con os.scandir en lugar de
+    hacer un stat() por recurso. El resultado se memoriza en
+    _RESOURCES_STATUS.
+    
     Returns:
         tuple: (todos_existen, lista_faltantes)
     """
+    global _RESOURCES_STATUS
+    if _RESOURCES_STATUS is not None:
+        return _RESOURCES_STATUS
+    
     required_assets = [
         "assets/icon.ico",
         "assets/logo_humboldt.png"
     ]
     
-    missing = []
-    for asset in required_assets:
-        asset_path = resource_path(asset)
-        if not asset_path.exists():
-            missing.append(asset)
-            logging.warning(f"Recurso faltante: {asset_path}")
-        else:
-            logging.debug(f"Recurso encontrado: {asset_path}")
+    try:
+        with os.scandir(resource_path("assets")) as it:
+            present = {e.name for e in it if e.is_file()}
+    except OSError as e:
+        logging.warning("No se pudo leer la carpeta de recursos: %s", e)
+        present = set()
     
-    if missing:
-        logging.error(f"Recursos faltantes: {missing}")
-        return False, missing
+    missing = [a for a in required_assets if a.rpartition("/")[2] not in present]
     
-    logging.info("Todos los recursos validados correctamente")
-    return True, []
+    if missing:
+        logging.error("Recursos faltantes: %s", missing)
+        _RESOURCES_STATUS = (False, missing)
+    else:
+        logging.info("Todos los recursos validados correctamente")
+        _RESOURCES_STATUS = (True, [])
+    return _RESOURCES_STATUS
+
+# Valores por defecto si config.json no existe o es inválido
+DEFAULT_CONFIG = {
+    "durations_ms": {
+        "Img2WI.exe": 18000,
+        "WI2CamtrapDP.exe": 7000,
+        "WIsualization.exe": 30000
+    },
+    "window": {
+        "default_width": 1200,
+        "default_height": 680,
+        "min_width": 1000,
+        "min_height": 600
+    }
+}
+
+# Configuración ya leída y la huella (st_mtime_ns, st_size) de config.json
+# con la que se leyó; None como huella = el archivo no existía
+_CONFIG: dict | None = None
+_CONFIG_KEY: tuple[int, int] | None = None
 
 def load_config() -> dict:
     """
     Carga configuración desde config.json o retorna valores por defecto.
     
+    El resultado se memoriza en _CONFIG junto con la huella del archivo:
+    cada llamada hace un solo stat() y solo vuelve a parsear el JSON si
+    config.json cambió (o apareció/desapareció) desde la última lectura.
+    
     Returns:
         dict: Configuración con duraciones de carga y dimensiones de ventana
     """
+    global _CONFIG, _CONFIG_KEY
     config_file = resource_path("config.json")
-    default_config = {
-        "durations_ms": {
-            "Img2WI.exe": 18000,
-            "WI2CamtrapDP.exe": 7000,
-            "WIsualization.exe": 30000
-        },
-        "window": {
-            "default_width": 1200,
-            "default_height": 680,
-            "min_width": 1000,
-            "min_height": 600
-        }
-    }
+    try:
+        st = os.stat(config_file)
+        key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    
+    if _CONFIG is not None and key == _CONFIG_KEY:
+        return _CONFIG
+    
+    import json  # diferido: solo se necesita al (re)leer el archivo
     
-    if config_file.exists():
+    _CONFIG = DEFAULT_CONFIG
+    _CONFIG_KEY = key
+    
+    if key is not None:
         try:
             with open(config_file, 'r', encoding='utf-8') as f:
                 config = json.load(f)
-                logging.info(f"Configuración cargada desde: {config_file}")
-                return {**default_config, **config}
+                logging.info("Configuración cargada desde: %s", config_file)
+                _CONFIG = {**DEFAULT_CONFIG, **config}
         except (json.JSONDecodeError, IOError) as e:
-            logging.error(f"Error al cargar configuración: {e}")
+            logging.error("Error al cargar configuración: %s", e)
             logging.info("Usando configuración por defecto")
     else:
         logging.info("Archivo de configuración no encontrado, usando valores por defecto")
     
-    return default_config
+    return _CONFIG
+
+def reload_config() -> dict:
+    """
+    Descarta la configuración memorizada y vuelve a leer config.json.
+    
+    Returns:
+        dict: Configuración recién cargada
+    """
+    global _CONFIG
+    _CONFIG = None
+    return load_config()
 
 # =============================================================================================
 # CONTENIDO DE LA APLICACIÓN
 # =============================================================================================
 
+# Marcado **negrita** estilo Markdown (compilado una sola vez)
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+
+def strip_bold(text: str) -> str:
+    """Elimina el marcado **negrita** conservando el texto interior."""
+    return _BOLD_RE.sub(r'\1', text)
+
 # Metadatos
 APP_TITLE = "CTF - CamTrapFlow"
 VERSION = "1.0.0"
@@ -351,56 +408,92 @@ NOTE_TEXT = (
     "y de otras tareas en ejecución."
 )
 
+class Module(NamedTuple):
+    """Herramienta lanzable desde una tarjeta de la ventana principal."""
+    title: str
+    desc: str
+    exe: str
+    btn: str
+    icon: str           # Icono del diálogo de carga
+    loading_desc: str   # Descripción corta del diálogo de carga
+    loading_name: str   # Nombre usado en los mensajes de carga
+    desc_clean: str = ""  # desc sin marcado **negrita** (se calcula al importar)
+
 # Configuración de módulos - cada entrada define una herramienta
-MODULES = [
-    {
-        "title": "🎬  Módulo 1 — Img2WI",
-        "desc":  "Extrae **imágenes (frames)** de lotes de videos a **intervalos definidos** para preparar insumos de carga a **Wildlife Insights**.",
-        "exe":   "Img2WI.exe",
-        "btn":   "Abrir Img2WI",
-        "loading_info": {
-            "icon": "🎬",
-            "desc": "Herramienta de extracción de frames de video",
-            "name": "Img2WI"
-        }
-    },
-    {
-        "title": "🧩  Módulo 2 — WI2CamtrapDP",
-        "desc":  "Convierte exportaciones de **Wildlife Insights** al estándar **Camtrap Data Package** (datapackage.json, deployments.csv, media.csv, observations.csv…).",
-        "exe":   "WI2CamtrapDP.exe",
-        "btn":   "Abrir WI2CamtrapDP",
-        "loading_info": {
-            "icon": "🧩",
-            "desc": "Convertidor a formato Camtrap Data Package",
-            "name": "WI2CamtrapDP"
-        }
-    },
-    {
-        "title": "📊  Módulo 3 — WIsualization",
-        "desc":  "Genera **visualizaciones** listas para análisis (**curva de acumulación**, **calendario/fechas de muestreo**, **actividad horaria**, **presencia/ausencia**) desde **WI** o **Camtrap-DP**.",
-        "exe":   "WIsualization.exe",
-        "btn":   "Abrir WIsualization",
-        "loading_info": {
-            "icon": "📊",
-            "desc": "Generador de visualizaciones y análisis",
-            "name": "WIsualization"
-        }
-    },
-]
+MODULES = (
+    Module(
+        title="🎬  Módulo 1 — Img2WI",
+        desc="Extrae **imágenes (frames)** de lotes de videos a **intervalos definidos** para preparar insumos de carga a **Wildlife Insights**.",
+        exe="Img2WI.exe",
+        btn="Abrir Img2WI",
+        icon="🎬",
+        loading_desc="Herramienta de extracción de frames de video",
+        loading_name="Img2WI",
+    ),
+    Module(
+        title="🧩  Módulo 2 — WI2CamtrapDP",
+        desc="Convierte exportaciones de **Wildlife Insights** al estándar **Camtrap Data Package** (datapackage.json, deployments.csv, media.csv, observations.csv…).",
+        exe="WI2CamtrapDP.exe",
+        btn="Abrir WI2CamtrapDP",
+        icon="🧩",
+        loading_desc="Convertidor a formato Camtrap Data Package",
+        loading_name="WI2CamtrapDP",
+    ),
+    Module(
+        title="📊  Módulo 3 — WIsualization",
+        desc="Genera **visualizaciones** listas para análisis (**curva de acumulación**, **calendario/fechas de muestreo**, **actividad horaria**, **presencia/ausencia**) desde **WI** o **Camtrap-DP**.",
+        exe="WIsualization.exe",
+        btn="Abrir WIsualization",
+        icon="📊",
+        loading_desc="Generador de visualizaciones y análisis",
+        loading_name="WIsualization",
+    ),
+)
 
 CITATION = (
     "**Citar como**: Acevedo C.C. & A. Díaz-Pulido. 2025. **Gestión de datos de fototrampeo** (v1.0.0) [Software]. "
     "07/09/2025. **Red OTUS**. **Instituto de Investigación de Recursos Biológicos Alexander von Humboldt**."
 )
 
+# Versiones sin marcado, calculadas una vez al importar (la UI no hace trabajo de regex)
+APP_DESC_CLEAN = strip_bold(APP_DESC)
+NOTE_TEXT_CLEAN = strip_bold(NOTE_TEXT)
+CITATION_CLEAN = strip_bold(CITATION)
+MODULES = tuple(m._replace(desc_clean=strip_bold(m.desc)) for m in MODULES)
+
 # =============================================================================================
 # COMPONENTES DE INTERFAZ
 # =============================================================================================
 
+# Iconos de ventana decodificados una sola vez (ver load_window_icons)
+ICON_BITMAP: str | None = None
+ICON_PHOTO: tk.PhotoImage | None = None
+
+def load_window_icons():
+    """
+    Carga los iconos de ventana una sola vez tras crear la raíz Tk.
+    
+    Los diálogos de carga reutilizan ICON_BITMAP e ICON_PHOTO en lugar de
+    volver a decodificar el PNG en cada apertura.
+    """
+    global ICON_BITMAP, ICON_PHOTO
+    ico = resource_path("assets", "icon.ico")
+    if ico.exists():
+        ICON_BITMAP = str(ico)
+    png = resource_path("assets", "logo_humboldt.png")
+    if png.exists():
+        try:
+            ICON_PHOTO = tk.PhotoImage(file=str(png))
+        except tk.TclError as e:
+            logging.warning("Error al cargar icono %s: %s", png, e)
+
+@lru_cache(maxsize=None)
 def scaled_photo(path: Path, target_h: int) -> tk.PhotoImage | None:
     """
     Escala imagen PNG a altura objetivo usando subsample nativo de Tkinter.
     
+    Memorizada por (path, target_h): cada imagen se decodifica una sola vez.
+    
     Args:
         path: Ruta a imagen PNG
         target_h: Altura objetivo en píxeles
@@ -409,7 +502,7 @@ def scaled_photo(path: Path, target_h: int) -> tk.PhotoImage | None:
         tk.PhotoImage escalada o None si hay error
     """
     if not path.exists():
-        logging.warning(f"Imagen no encontrada: {path}")
+        logging.warning("Imagen no encontrada: %s", path)
         return None
     try:
         img = tk.PhotoImage(file=str(path))
@@ -417,24 +510,27 @@ def scaled_photo(path: Path, target_h: int) -> tk.PhotoImage | None:
         if h > target_h:
             factor = max(1, round(h / target_h))
             img = img.subsample(factor, factor)
-            logging.debug(f"Imagen escalada: {path} (factor: {factor})")
+            logging.debug("Imagen escalada: %s (factor: %s)", path, factor)
         else:
-            logging.debug(f"Imagen cargada sin escalar: {path}")
+            logging.debug("Imagen cargada sin escalar: %s", path)
         return img
     except tk.TclError as e:
-        logging.error(f"Error al cargar imagen {path}: {e}")
+        logging.error("Error al cargar imagen %s: %s", path, e)
         return None
     except Exception as e:
-        logging.error(f"Error inesperado al cargar imagen {path}: {e}")
+        logging.error("Error inesperado al cargar imagen %s: %s", path, e)
         return None
 
 def create_rich_text_label(parent, text, style_name, wraplength=None, justify="left"):
     """
-    Crea label TTK removiendo formato **negrita** para evitar problemas de layout.
+    Crea label TTK para textos cuyo formato **negrita** ya fue eliminado.
+    
+    Los textos estáticos se limpian una vez al importar (APP_DESC_CLEAN,
+    Module.desc_clean...); esta función no hace trabajo de regex.
     
     Args:
         parent: Widget padre
-        text: Texto con formato Markdown (**bold**)
+        text: Texto sin formato (ver strip_bold)
         style_name: Nombre del estilo TTK
         wraplength: Longitud máxima de línea
         justify: Justificación del texto
@@ -442,19 +538,45 @@ def create_rich_text_label(parent, text, style_name, wraplength=None, justify="l
     Returns:
         ttk.Label con texto sin formato
     """
-    import re
-    
-    clean_text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
-    
     label = ttk.Label(parent,
-                     text=clean_text,
+                     text=text,
                      style=style_name,
                      wraplength=wraplength if wraplength else 800,
                      justify=justify)
     
     return label
 
-def create_styled_button(parent, text, command, colors):
+# Bindtag compartido por los botones de módulo: los efectos hover se registran
+# una sola vez con bind_class en lugar de cuatro callbacks por botón
+_HOVER_BTN_TAG = "CTFHoverButton"
+_BTN_BG = '#1E4B8B'
+_BTN_BG_HOVER = '#4A7BC8'
+
+def _install_button_hover(widget):
+    """
+    Registra (una vez por intérprete Tk) los efectos hover/pressed del bindtag.
+    
+    Los botones tk.Button respetan bg en todos los temas; un ttk.Button con el
+    tema 'vista' de Windows ignora background y deja texto blanco sobre gris.
+    
+    Args:
+        widget: Cualquier widget de la aplicación (para acceder al intérprete)
+    """
+    if widget.bind_class(_HOVER_BTN_TAG):
+        return
+    
+    def _on(**opts):
+        def handler(e):
+            if str(e.widget['state']) != 'disabled':
+                e.widget.configure(**opts)
+        return handler
+    
+    widget.bind_class(_HOVER_BTN_TAG, "<Enter>", _on(bg=_BTN_BG_HOVER, relief="raised"))
+    widget.bind_class(_HOVER_BTN_TAG, "<Leave>", _on(bg=_BTN_BG, relief="raised"))
+    widget.bind_class(_HOVER_BTN_TAG, "<Button-1>", _on(relief="sunken"))
+    widget.bind_class(_HOVER_BTN_TAG, "<ButtonRelease-1>", _on(relief="raised"))
+
+def create_styled_button(parent, text, command):
     """
     Crea botón con estilos garantizados y efectos hover.
     
@@ -462,17 +584,17 @@ def create_styled_button(parent, text, command, colors):
         parent: Widget padre
         text: Texto del botón
         command: Función a ejecutar al hacer clic
-        colors: Diccionario de paleta de colores
     
     Returns:
-        tk.Button con efectos hover configurados
+        tk.Button con los efectos hover del bindtag compartido
     """
+    _install_button_hover(parent)
     btn = tk.Button(parent,
                    text=text,
-                   font=("Segoe UI", 10, "bold"),
-                   bg='#1E4B8B',
+                   font=FONT_BOLD,
+                   bg=_BTN_BG,
                    fg='white',
-                   activebackground='#4A7BC8',
+                   activebackground=_BTN_BG_HOVER,
                    activeforeground='white',
                    disabledforeground='#6C757D',
                    relief="raised",
@@ -481,46 +603,26 @@ def create_styled_button(parent, text, command, colors):
                    height=1,
                    cursor="hand2",
                    command=command)
-    
-    # Efectos hover
-    def on_enter(e):
-        if btn['state'] != 'disabled':
-            btn.configure(bg='#4A7BC8', relief="raised")
-    
-    def on_leave(e):
-        if btn['state'] != 'disabled':
-            btn.configure(bg='#1E4B8B', relief="raised")
-    
-    def on_press(e):
-        if btn['state'] != 'disabled':
-            btn.configure(relief="sunken")
-    
-    def on_release(e):
-        if btn['state'] != 'disabled':
-            btn.configure(relief="raised")
-    
-    btn.bind("<Enter>", on_enter)
-    btn.bind("<Leave>", on_leave)
-    btn.bind("<Button-1>", on_press)
-    btn.bind("<ButtonRelease-1>", on_release)
+    # Tras la clase Button: (widget, Button, CTFHoverButton, toplevel, all)
+    tags = btn.bindtags()
+    btn.bindtags(tags[:2] + (_HOVER_BTN_TAG,) + tags[2:])
     
     return btn
 
-def make_simple_card(parent, module_data, colors, on_click):
+def make_simple_card(parent, module: Module, on_click):
     """
     Crea tarjeta de módulo con descripción y botón de acción.
     
     Args:
         parent: Widget padre
-        module_data: Dict con info del módulo (title, desc, btn)
-        colors: Paleta de colores
+        module: Módulo a mostrar (title, desc, btn)
         on_click: Función al hacer clic en botón
     
     Returns:
         tuple: (card_frame, desc_label, button)
     """
     card = ttk.LabelFrame(parent, 
-                         text=module_data["title"], 
+                         text=module.title, 
                          padding=10,
                          style="ModuleCard.TLabelframe")
     
@@ -534,10 +636,10 @@ def make_simple_card(parent, module_data, colors, on_click):
     right_frame = ttk.Frame(content_frame, style="Card.TFrame")
     right_frame.pack(side="right", padx=(10, 0))
     
-    desc_label = create_rich_text_label(left_frame, module_data["desc"], "ModuleDesc.TLabel", 800, "left")
+    desc_label = create_rich_text_label(left_frame, module.desc_clean, "ModuleDesc.TLabel", 800, "left")
     desc_label.pack(fill="both", expand=True, anchor="w")
     
-    btn = create_styled_button(right_frame, module_data["btn"], on_click, colors)
+    btn = create_styled_button(right_frame, module.btn, on_click)
     btn.pack(anchor="e", padx=5, pady=5)
     
     return card, desc_label, btn
@@ -546,6 +648,21 @@ def make_simple_card(parent, module_data, colors, on_click):
 # DIÁLOGO DE CARGA
 # =============================================================================================
 
+@lru_cache(maxsize=1)
+def dialog_fonts() -> dict[str, tkfont.Font]:
+    """
+    Fuentes con nombre del diálogo de carga, resueltas una sola vez.
+    
+    Tk reutiliza la fuente ya resuelta (incluida la de emojis a 32 pt) en
+    lugar de volver a buscarla al crear o reconfigurar cada etiqueta.
+    """
+    return {
+        "icon": tkfont.Font(family="Segoe UI", size=32),
+        "main": tkfont.Font(family="Segoe UI", size=12, weight="bold"),
+        "desc": tkfont.Font(family="Segoe UI", size=9),
+        "status": tkfont.Font(family="Segoe UI", size=8),
+    }
+
 class LoadingDialog(tk.Toplevel):
     """
     Diálogo modal con feedback visual durante el lanzamiento de módulos.
@@ -555,79 +672,81 @@ class LoadingDialog(tk.Toplevel):
     - Mensajes de estado actualizados cada 1.5s
     - Centrado sobre ventana principal
     - Modal (bloquea interacción con ventana padre)
+    - Reutilizable: show()/hide() reconfiguran y muestran/ocultan el mismo
+      árbol de widgets (ver shared_loading_dialog)
     """
     
-    def __init__(self, parent, message="Abriendo módulo…", module_info=None):
+    STATUS_MESSAGES = (
+        "Iniciando módulo...",
+        "Cargando componentes...",
+        "Preparando interfaz...",
+        "Finalizando carga..."
+    )
+    
+    def __init__(self, parent, message="Abriendo módulo…", icon="", desc=""):
         """
-        Inicializa diálogo de carga.
+        Inicializa diálogo de carga y lo muestra.
         
         Args:
             parent: Ventana padre
             message: Mensaje inicial
-            module_info: Dict con icon, desc, name del módulo
+            icon: Icono (emoji) del módulo
+            desc: Descripción corta del módulo
         """
         super().__init__(parent)
+        self.withdraw()
         self.title("Cargando CamTrapFlow")
+        self.parent = parent
         self.message = message
-        self.module_info = module_info or {}
+        self._status_job = None
         
-        # Heredar iconos del padre
+        # Heredar iconos del padre (precargados en load_window_icons)
         try:
-            ico = resource_path("assets", "icon.ico")
-            if ico.exists():
-                self.iconbitmap(default=str(ico))
-            png = resource_path("assets", "logo_humboldt.png")
-            if png.exists():
-                icon_img = tk.PhotoImage(file=str(png))
-                self.iconphoto(True, icon_img)
-                self._icon_img_ref = icon_img
+            if ICON_BITMAP:
+                self.iconbitmap(default=ICON_BITMAP)
+            if ICON_PHOTO is not None:
+                self.iconphoto(True, ICON_PHOTO)
         except tk.TclError as e:
-            logging.warning(f"Error al establecer iconos del diálogo: {e}")
+            logging.warning("Error al establecer iconos del diálogo: %s", e)
         except Exception as e:
-            logging.error(f"Error inesperado con iconos del diálogo: {e}")
+            logging.error("Error inesperado con iconos del diálogo: %s", e)
 
         self.resizable(False, False)
         self.configure(bg="#f8f9fa")
         self.transient(parent)
-        self.grab_set()
 
         # Frame principal
         main_frame = tk.Frame(self, bg="#f8f9fa", padx=24, pady=24)
         main_frame.pack(fill="both", expand=True)
+        fonts = dialog_fonts()
 
-        # Icono del módulo
-        if self.module_info.get("icon"):
-            icon_label = tk.Label(
-                main_frame, 
-                text=self.module_info["icon"], 
-                font=("Segoe UI", 32),
-                bg="#f8f9fa",
-                fg="#2c3e50"
-            )
-            icon_label.pack(pady=(0, 12))
+        # Icono del módulo (se empaqueta solo si hay icono)
+        self.icon_label = tk.Label(
+            main_frame, 
+            font=fonts["icon"],
+            bg="#f8f9fa",
+            fg="#2c3e50"
+        )
 
         # Mensaje principal
         self.main_label = tk.Label(
             main_frame, 
             text=message, 
-            font=("Segoe UI", 12, "bold"),
+            font=fonts["main"],
             bg="#f8f9fa",
             fg="#2c3e50"
         )
         self.main_label.pack(pady=(0, 8))
 
-        # Descripción del módulo
-        if self.module_info.get("desc"):
-            desc_label = tk.Label(
-                main_frame,
-                text=self.module_info["desc"],
-                font=("Segoe UI", 9),
-                bg="#f8f9fa",
-                fg="#7f8c8d",
-                wraplength=300,
-                justify="center"
-            )
-            desc_label.pack(pady=(0, 16))
+        # Descripción del módulo (se empaqueta solo si hay descripción)
+        self.desc_label = tk.Label(
+            main_frame,
+            font=fonts["desc"],
+            bg="#f8f9fa",
+            fg="#7f8c8d",
+            wraplength=300,
+            justify="center"
+        )
 
         # Progress bar
         self.pb = ttk.Progressbar(
@@ -640,46 +759,62 @@ class LoadingDialog(tk.Toplevel):
         # Mensaje de estado
         self.status_label = tk.Label(
             main_frame,
-            text="Iniciando módulo, por favor espere...",
-            font=("Segoe UI", 8),
+            font=fonts["status"],
             bg="#f8f9fa",
             fg="#95a5a6"
         )
         self.status_label.pack()
 
+        self.show(message, icon, desc)
+
+    def show(self, message: str, icon: str = "", desc: str = ""):
+        """
+        Reconfigura los textos del diálogo y lo muestra de forma modal.
+        
+        Args:
+            message: Mensaje principal
+            icon: Icono (emoji) del módulo
+            desc: Descripción corta del módulo
+        """
+        self.message = message
+        self.main_label.configure(text=message)
+        self.status_label.configure(text="Iniciando módulo, por favor espere...")
+        
+        self.icon_label.configure(text=icon)
+        if icon:
+            self.icon_label.pack(pady=(0, 12), before=self.main_label)
+        else:
+            self.icon_label.pack_forget()
+        
+        self.desc_label.configure(text=desc)
+        if desc:
+            self.desc_label.pack(pady=(0, 16), before=self.pb)
+        else:
+            self.desc_label.pack_forget()
+
         # Centrar sobre la ventana principal
         self.update_idletasks()
-        w, h = 400, 200 if self.module_info.get("desc") else 160
-        x = parent.winfo_rootx() + (parent.winfo_width() - w) // 2
-        y = parent.winfo_rooty() + (parent.winfo_height() - h) // 2
+        w, h = 400, 200 if desc else 160
+        x = self.parent.winfo_rootx() + (self.parent.winfo_width() - w) // 2
+        y = self.parent.winfo_rooty() + (self.parent.winfo_height() - h) // 2
         self.geometry(f"{w}x{h}+{x}+{y}")
         
-        self.pb.start(8)
+        self.deiconify()
+        self.grab_set()
+        self.pb.start(33)  # ~30 fps: misma animación con 4x menos redibujos
         
-        # Mensajes progresivos
-        self.status_messages = [
-            "Iniciando módulo...",
-            "Cargando componentes...",
-            "Preparando interfaz...",
-            "Finalizando carga..."
-        ]
-        self.status_index = 0
-        self.after(1000, self.update_status)
+        # Mensajes progresivos (rotación infinita)
+        self.status_messages = itertools.cycle(self.STATUS_MESSAGES)
+        self._status_job = self.after(1000, self.update_status)
 
     def update_status(self):
         """Actualiza mensaje de estado cíclicamente cada 1.5s."""
         try:
-            if hasattr(self, 'status_label'):
-                try:
-                    if self.status_label.winfo_exists():
-                        message = self.status_messages[self.status_index % len(self.status_messages)]
-                        self.status_label.configure(text=message)
-                        self.status_index = (self.status_index + 1) % len(self.status_messages)
-                        self.after(1500, self.update_status)
-                except tk.TclError:
-                    pass
-        except Exception as e:
-            logging.debug(f"Error en update_status: {e}")
+            if self.status_label.winfo_exists():
+                self.status_label.configure(text=next(self.status_messages))
+                self._status_job = self.after(1500, self.update_status)
+        except tk.TclError:
+            pass
     
     def update_message(self, new_message: str):
         """Actualiza mensaje principal del diálogo."""
@@ -688,40 +823,69 @@ class LoadingDialog(tk.Toplevel):
                 try:
                     if self.main_label.winfo_exists():
                         self.main_label.configure(text=new_message)
-                        logging.debug(f"Mensaje del diálogo actualizado: {new_message}")
+                        logging.debug("Mensaje del diálogo actualizado: %s", new_message)
                         self.update_idletasks()
                 except tk.TclError:
                     logging.debug("Intento de actualizar mensaje en ventana cerrada")
         except Exception as e:
-            logging.warning(f"Error al actualizar mensaje del diálogo: {e}")
+            logging.warning("Error al actualizar mensaje del diálogo: %s", e)
+
+    def hide(self):
+        """Oculta el diálogo conservando sus widgets para el siguiente uso."""
+        try:
+            self.pb.stop()
+            if self._status_job is not None:
+                self.after_cancel(self._status_job)
+                self._status_job = None
+            self.grab_release()
+            self.withdraw()
+        except tk.TclError as e:
+            logging.warning("Error al ocultar ventana de diálogo: %s", e)
 
     def close(self):
         """Cierra el diálogo y libera recursos."""
         try:
             self.pb.stop()
         except tk.TclError as e:
-            logging.warning(f"Error al detener progress bar: {e}")
+            logging.warning("Error al detener progress bar: %s", e)
         except Exception as e:
-            logging.error(f"Error inesperado al cerrar diálogo: {e}")
+            logging.error("Error inesperado al cerrar diálogo: %s", e)
         
         try:
             self.grab_release()
             self.destroy()
         except tk.TclError as e:
-            logging.warning(f"Error al cerrar ventana de diálogo: {e}")
+            logging.warning("Error al cerrar ventana de diálogo: %s", e)
+
+# Diálogo de carga compartido (se crea en el primer lanzamiento)
+_SHARED_DIALOG: LoadingDialog | None = None
+
+def shared_loading_dialog(parent, message: str, icon: str = "", desc: str = "") -> LoadingDialog:
+    """
+    Muestra el diálogo de carga compartido, creándolo solo la primera vez.
+    
+    Los lanzamientos siguientes reconfiguran los textos del mismo Toplevel
+    en lugar de reconstruir todos sus widgets.
+    """
+    global _SHARED_DIALOG
+    if _SHARED_DIALOG is None or not _SHARED_DIALOG.winfo_exists():
+        _SHARED_DIALOG = LoadingDialog(parent, message, icon, desc)
+    else:
+        _SHARED_DIALOG.show(message, icon, desc)
+    return _SHARED_DIALOG
 
 @contextmanager
-def loading_context(parent, message: str, module_info: dict = None):
+def loading_context(parent, message: str, icon: str = "", desc: str = ""):
     """Context manager para diálogo de carga con gestión de botones."""
-    dlg = LoadingDialog(parent, message, module_info)
+    dlg = shared_loading_dialog(parent, message, icon, desc)
     set_module_buttons_enabled(False)
-    logging.info(f"Mostrando diálogo de carga: {message}")
+    logging.info("Mostrando diálogo de carga: %s", message)
     
     try:
         yield dlg
     finally:
         try:
-            dlg.close()
+            dlg.hide()
         finally:
             set_module_buttons_enabled(True)
             logging.debug("Diálogo de carga cerrado")
@@ -730,8 +894,12 @@ def loading_context(parent, message: str, module_info: dict = None):
 # LÓGICA DE LANZAMIENTO
 # =============================================================================================
 
+# Flags de CreateProcess en Windows: sin consola y desacoplado del lanzador
+# (CREATE_NO_WINDOW | DETACHED_PROCESS). En otros sistemas no aplica.
+_CREATION_FLAGS = (0x08000000 | 0x00000008) if os.name == "nt" else 0
+
 # Variables globales para gestión de estado
-module_buttons: list[ttk.Button] = []
+module_buttons: list[tk.Button] = []
 module_text_labels: list[ttk.Label] = []
 root: tk.Tk | None = None
 desc_label: ttk.Label | None = None
@@ -741,36 +909,40 @@ def set_module_buttons_enabled(enabled: bool):
     """Habilita o deshabilita todos los botones de módulos."""
     state = "normal" if enabled else "disabled"
     action = "habilitando" if enabled else "deshabilitando"
-    logging.debug(f"Botones de módulos: {action}")
+    logging.debug("Botones de módulos: %s", action)
     
     for b in module_buttons:
         try:
             b.configure(state=state)
         except tk.TclError as e:
-            logging.warning(f"Error al cambiar estado del botón: {e}")
+            logging.warning("Error al cambiar estado del botón: %s", e)
         except Exception as e:
-            logging.error(f"Error inesperado al cambiar estado del botón: {e}")
+            logging.error("Error inesperado al cambiar estado del botón: %s", e)
 
-def lanzar(exe_name: str, human_name: str = "módulo", module_info: dict = None):
+def lanzar(module: Module):
     """
     Lanza ejecutable de módulo con diálogo de carga.
     
     Args:
-        exe_name: Nombre del ejecutable (ej: "Img2WI.exe")
-        human_name: Nombre amigable para mensajes
-        module_info: Dict con información del módulo (icon, desc, name)
+        module: Módulo a lanzar (exe, icon, loading_desc, loading_name)
     
     Proceso:
     1. Valida existencia del ejecutable
     2. Muestra diálogo de carga
-    3. Lanza proceso con subprocess.Popen
+    3. Lanza proceso con subprocess.Popen en un hilo aparte
     4. Actualiza mensajes progresivamente
     5. Cierra diálogo después del tiempo configurado
+    
+    El Popen (que en Windows puede tardar si el antivirus analiza el .exe)
+    corre fuera del hilo de Tk; los cambios de widgets se devuelven al hilo
+    principal con root.after(0, ...). Los mensajes posteriores los recorre
+    _step sobre el generador _script, con un solo after() pendiente a la vez.
     """
+    exe_name = module.exe
     config = load_config()
     durations = config.get("durations_ms", {})
     
-    logging.info(f"Iniciando lanzamiento de: {exe_name}")
+    logging.info("Iniciando lanzamiento de: %s", exe_name)
     
     p = exe_path(exe_name)
     if not p.exists():
@@ -780,60 +952,84 @@ def lanzar(exe_name: str, human_name: str = "módulo", module_info: dict = None)
         return
 
     # Preparar diálogo de carga
-    module_name = module_info.get("name", human_name) if module_info else human_name
+    module_name = module.loading_name or module.title
     loading_message = f"Cargando {module_name}..."
     
-    dlg = LoadingDialog(root, loading_message, module_info)
+    dlg = shared_loading_dialog(root, loading_message, module.icon, module.loading_desc)
     set_module_buttons_enabled(False)
-    logging.info(f"Mostrando diálogo de carga: {loading_message}")
+    logging.info("Mostrando diálogo de carga: %s", loading_message)
+    
+    # Duración configurada por módulo (mínimo 3s)
+    duration = max(3000, durations.get(exe_name, 7000))
     
+    def _script():
+        """Mensajes progresivos como (espera_ms, mensaje); None solo espera."""
+        yield 800, f"{module_name} iniciado correctamente"
+        yield 700, f"Cargando componentes de {module_name}..."
+        yield duration - 2500, f"Abriendo ventana de {module_name}..."
+        yield 1000, None
+
+    def _step(script, message=None):
+        """Muestra el mensaje actual y programa el siguiente paso del guion."""
+        if message is not None:
+            dlg.update_message(message)
+        try:
+            delay, nxt = next(script)
+        except StopIteration:
+            _close_ok()
+            return
+        root.after(delay, _step, script, nxt)
+    
+    def _post(fn, *args):
+        """Encola una llamada de UI en el hilo principal de Tk."""
+        root.after(0, fn, *args)
+
     def _do_launch():
-        """Ejecuta el lanzamiento del proceso."""
+        """Ejecuta el lanzamiento del proceso (hilo de trabajo)."""
+        import subprocess  # diferido: no se carga hasta el primer lanzamiento
+        
         try:
-            dlg.update_message(f"Iniciando {module_name}...")
+            _post(dlg.update_message, f"Iniciando {module_name}...")
             
             # Lanzar proceso
             process = subprocess.Popen(
                 [str(p)], 
                 cwd=str(p.parent),
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+                creationflags=_CREATION_FLAGS
             )
-            logging.info(f"Proceso lanzado exitosamente: PID {process.pid}")
-            
-            root.after(800, lambda: dlg.update_message(f"{module_name} iniciado correctamente"))
+            logging.info("Proceso lanzado exitosamente: PID %s", process.pid)
             
-            # Duración configurada por módulo (mínimo 3s)
-            duration = max(3000, durations.get(exe_name, 7000))
-            logging.debug(f"Esperando {duration}ms antes de cerrar diálogo")
+            logging.debug("Esperando %sms antes de cerrar diálogo", duration)
             
-            # Mensajes progresivos
-            root.after(1500, lambda: dlg.update_message(f"Cargando componentes de {module_name}..."))
-            root.after(duration - 1000, lambda: dlg.update_message(f"Abriendo ventana de {module_name}..."))
-            root.after(duration, _close_ok)
+            # Mensajes progresivos, en el hilo de Tk
+            _post(_step, _script())
             
         except FileNotFoundError:
             error_msg = f"Ejecutable no encontrado: {exe_name}"
             logging.error(error_msg)
-            _close_err(error_msg)
+            _post(_close_err, error_msg)
         except PermissionError:
             error_msg = f"Sin permisos para ejecutar: {exe_name}"
             logging.error(error_msg)
-            _close_err(error_msg)
+            _post(_close_err, error_msg)
         except subprocess.SubprocessError as e:
             error_msg = f"Error al lanzar proceso: {e}"
             logging.error(error_msg)
-            _close_err(error_msg)
+            _post(_close_err, error_msg)
         except Exception as e:
             error_msg = f"Error inesperado: {e}"
             logging.error(error_msg)
-            _close_err(error_msg)
+            _post(_close_err, error_msg)
 
     def _close_ok():
         """Cierra diálogo tras lanzamiento exitoso."""
-        logging.info(f"Lanzamiento completado: {exe_name}")
+        logging.info("Lanzamiento completado: %s", exe_name)
         try:
-            dlg.close()
+            dlg.hide()
         finally:
             set_module_buttons_enabled(True)
             logging.debug("Diálogo de carga cerrado")
@@ -841,25 +1037,38 @@ def lanzar(exe_name: str, human_name: str = "módulo", module_info: dict = None)
     def _close_err(error_msg: str):
         """Cierra diálogo y muestra error."""
         try:
-            dlg.close()
+            dlg.hide()
         finally:
             set_module_buttons_enabled(True)
             logging.debug("Diálogo de carga cerrado")
             messagebox.showerror("Error al lanzar", f"No se pudo iniciar {exe_name}.\n{error_msg}")
 
-    root.after(50, _do_launch)
+    threading.Thread(target=_do_launch, name="launch", daemon=True).start()
 
 # =============================================================================================
 # VENTANA PRINCIPAL
 # =============================================================================================
 
+def _preload(results: queue.Queue):
+    """
+    Valida recursos y carga config.json fuera del hilo principal.
+    
+    Son operaciones de E/S (stat + lectura JSON) que se solapan con la
+    inicialización de Tk; el resultado se deja en la cola para main().
+    """
+    try:
+        results.put((validate_resources(), load_config()))
+    except Exception as e:
+        logging.error("Error en la precarga: %s", e)
+        results.put(((False, []), DEFAULT_CONFIG))
+
 def main():
     """
     Función principal - inicializa y ejecuta la aplicación.
     
     Secuencia:
-    1. Setup logging y validación de recursos
-    2. Carga de configuración
+    1. Setup logging
+    2. Validación de recursos y carga de configuración (hilo en segundo plano)
     3. Creación de ventana principal con estilos TTK
     4. Construcción de interfaz (header, módulos, footer)
     5. Configuración de dimensiones y posición
@@ -868,12 +1077,9 @@ def main():
     # Inicialización
     setup_logging()
     
-    resources_ok, missing = validate_resources()
-    if not resources_ok:
-        logging.warning(f"Algunos recursos no están disponibles: {missing}")
-    
-    config = load_config()
-    window_config = config.get("window", {})
+    # Validación y configuración se solapan con la creación de Tk()
+    preload: queue.Queue = queue.Queue(maxsize=1)
+    threading.Thread(target=_preload, args=(preload,), daemon=True).start()
     
     # Inicialización de estado global
     global root, module_buttons, module_text_labels
@@ -889,12 +1095,12 @@ def main():
 
     # Icono de la ventana
     try:
-        ico = resource_path("assets", "icon.ico")
-        if ico.exists():
-            root.iconbitmap(default=str(ico))
+        load_window_icons()
+        if ICON_BITMAP:
+            root.iconbitmap(default=ICON_BITMAP)
             logging.debug("Icono .ico establecido")
     except Exception as e:
-        logging.warning(f"Error al establecer icono: {e}")
+        logging.warning("Error al establecer icono: %s", e)
 
     # Frame principal
     main_frame = ttk.Frame(root, style="Main.TFrame", padding=15)
@@ -915,10 +1121,10 @@ def main():
                              style="Version.TLabel")
     version_label.pack(pady=(0, 8))
     
-    desc_label = create_rich_text_label(header_frame, APP_DESC, "SubHeader.TLabel", 1000, "center")
+    desc_label = create_rich_text_label(header_frame, APP_DESC_CLEAN, "SubHeader.TLabel", 1000, "center")
     desc_label.pack(pady=(0, 8))
     
-    note_label = create_rich_text_label(header_frame, NOTE_TEXT, "Note.TLabel", 900, "center")
+    note_label = create_rich_text_label(header_frame, NOTE_TEXT_CLEAN, "Note.TLabel", 900, "center")
     note_label.pack(pady=(0, 10))
     
     separator = ttk.Separator(header_frame, orient='horizontal')
@@ -934,12 +1140,11 @@ def main():
     section_title.pack(pady=(0, 10))
     
     # Generar tarjetas de módulos
-    for i, m in enumerate(MODULES):
+    for m in MODULES:
         card, txt_lbl, btn = make_simple_card(
             modules_frame,
             m,
-            colors,
-            on_click=lambda e=m["exe"], t=m["title"], info=m.get("loading_info", {}): lanzar(e, t, info)
+            on_click=lambda m=m: lanzar(m)
         )
         card.pack(fill="x", pady=8, padx=12)
         module_buttons.append(btn)
@@ -952,10 +1157,16 @@ def main():
     separator2 = ttk.Separator(footer_frame, orient='horizontal')
     separator2.pack(fill="x", pady=(0, 12), padx=40)
     
-    cite_text = f"✍️ {CITATION}"
+    cite_text = f"✍️ {CITATION_CLEAN}"
     cite_label = create_rich_text_label(footer_frame, cite_text, "SubHeader.TLabel", 1200, "center")
     cite_label.pack(pady=(0, 3))
 
+    # Resultado de la precarga (normalmente ya disponible a estas alturas)
+    (resources_ok, missing), config = preload.get()
+    if not resources_ok:
+        logging.warning("Algunos recursos no están disponibles: %s", missing)
+    window_config = config.get("window", {})
+    
     # Configuración de ventana
     w = window_config.get("default_width", 980)
     h = window_config.get("default_height", 640)
@@ -972,7 +1183,7 @@ def main():
     y = int((sh - h) / 2.4)
     root.geometry(f"+{x}+{y}")
     
-    logging.info(f"Ventana configurada: {w}x{h} en posición ({x}, {y})")
+    logging.info("Ventana configurada: %sx%s en posición (%s, %s)", w, h, x, y)
     logging.info("Iniciando bucle principal de la aplicación")
     
     # Bucle principal
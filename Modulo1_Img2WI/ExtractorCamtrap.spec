@@ -1,4 +1,4 @@
-# ExtractorCamtrap.spec — build ONE-FILE reproducible con PyQt5, ffmpeg y recursos
+# ExtractorCamtrap.spec — build ONE-DIR reproducible con PyQt5, ffmpeg y recursos
 # Uso:  python -m PyInstaller ExtractorCamtrap.spec --clean
 
 from PyInstaller.utils.hooks import collect_all
@@ -36,14 +36,13 @@ a = Analysis(
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
-# ONE-FILE: empaqueta todo directamente en el EXE (no hay COLLECT)
+# ONE-DIR: el EXE solo lleva el bootloader; el runtime queda en dist/Img2WI/_internal
+# (sin extracción a _MEIPASS en cada arranque)
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='Img2WI',
     debug=False,
     bootloader_ignore_signals=False,
@@ -52,3 +51,13 @@ exe = EXE(
     console=False,  # ventana de consola oculta (GUI)
     icon='resources/icons/app_icon.png',
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=False,
+    name='Img2WI',
+)
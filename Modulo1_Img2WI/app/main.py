@@ -26,6 +26,7 @@ Licencia: Ver THIRD_PARTY_NOTICES.txt
 
 import sys
 import os
+import multiprocessing
 from PyQt5.QtWidgets import QApplication
 
 # Añadir la carpeta raíz del proyecto al sys.path para imports relativos
@@ -34,6 +35,10 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from app.ui_main import VideoProcessorWindow
 
 if __name__ == "__main__":
+    # Necesario en el ejecutable congelado: los procesos del pool de
+    # extracción relanzan el .exe y deben salir aquí sin abrir la UI
+    multiprocessing.freeze_support()
+
     # Inicializar la aplicación PyQt5
     app = QApplication(sys.argv)
     
@@ -35,12 +35,19 @@ Versión: 1.0.0
 Licencia: Ver THIRD_PARTY_NOTICES.txt
 """
 
+import json
+import multiprocessing
 import os
+import re
 import sys
 import time
 import shutil
+import struct
 import subprocess
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
 from pathlib import Path
 
 import wiutils
@@ -53,10 +60,22 @@ import wiutils
 # escenarios: ejecución desde código fuente, ejecutable PyInstaller (one-file),
 # o instalación del sistema.
 
+_IS_WIN = os.name == "nt"
+
+# CREATE_NO_WINDOW: evita que cada llamada a ffmpeg/ffprobe abra una consola
+_CREATIONFLAGS = 0x08000000 if _IS_WIN else 0
+
+# subprocess.run con las opciones comunes a todas las llamadas a FFmpeg/FFprobe
+_run = partial(subprocess.run, creationflags=_CREATIONFLAGS, capture_output=True)
+
+
+@lru_cache(maxsize=1)
 def _find_ffmpeg() -> str:
     """
     Localiza el ejecutable de FFmpeg en múltiples ubicaciones.
     
+    El resultado se memoriza: la búsqueda se hace una sola vez por proceso.
+    
     Estrategia de búsqueda:
         1. Si está empaquetado con PyInstaller (_MEIPASS), busca en el directorio temporal
         2. Si no, busca relativo al script actual (app/bin/ffmpeg.exe)
@@ -65,7 +84,7 @@ def _find_ffmpeg() -> str:
     Returns:
         str: Ruta completa al ejecutable de FFmpeg, o cadena vacía si no se encuentra
     """
-    exe = "ffmpeg.exe" if os.name == "nt" else "ffmpeg"
+    exe = "ffmpeg.exe" if _IS_WIN else "ffmpeg"
     meipass = getattr(sys, "_MEIPASS", None)
     if meipass:
         for rel in (exe, Path("bin") / exe):
@@ -80,9 +99,11 @@ def _find_ffmpeg() -> str:
     return shutil.which(exe) or ""
 
 
+@lru_cache(maxsize=1)
 def _find_ffprobe() -> str:
     """
     Localiza el ejecutable de FFprobe usando la misma estrategia que _find_ffmpeg().
+    El resultado también se memoriza.
     
     FFprobe se utiliza para extraer metadatos de los videos (duración, codec, etc.)
     sin necesidad de procesarlos completamente.
@@ -90,7 +111,7 @@ def _find_ffprobe() -> str:
     Returns:
         str: Ruta completa al ejecutable de FFprobe, o cadena vacía si no se encuentra
     """
-    exe = "ffprobe.exe" if os.name == "nt" else "ffprobe"
+    exe = "ffprobe.exe" if _IS_WIN else "ffprobe"
     meipass = getattr(sys, "_MEIPASS", None)
     if meipass:
         for rel in (exe, Path("bin") / exe):
@@ -105,6 +126,44 @@ def _find_ffprobe() -> str:
     return shutil.which(exe) or ""
 
 
+# Hilos por proceso de FFmpeg (-threads): 0 = automático (un solo video a la
+# vez satura los núcleos); 1 cuando el pool procesa un video por núcleo.
+_FFMPEG_THREADS_SINGLE = 0
+_FFMPEG_THREADS_PARALLEL = 1
+
+# Duración en la salida de "ffmpeg -i" (ej. "  Duration: 00:00:12.34, start: ...")
+_DUR_RE = re.compile(rb"Duration:\s*(\d{2}:\d{2}:\d{2})")
+
+# Extensiones reconocidas (con punto, en minúsculas), como tuplas para
+# filtrar nombres con un único str.endswith
+_IMG_EXT_TUPLE = (".jpg", ".jpeg", ".png")
+_VIDEO_EXT_TUPLE = (".mp4", ".mov", ".avi")
+
+# Contenedores que se extraen siempre con FFmpeg (MP4 va por wiutils)
+_FFMPEG_EXT_TUPLE = (".avi", ".mov")
+
+
+def _list_images_fast(out_dir: Path) -> list[str]:
+    """
+    Lista los nombres de las imágenes de una carpeta con una sola lectura.
+    
+    os.scandir entrega nombre y tipo desde la propia lectura del directorio,
+    sin crear objetos Path ni hacer stat() por entrada como Path.glob.
+    
+    Args:
+        out_dir: Carpeta a listar
+    
+    Returns:
+        list: Nombres de archivo con extensión de imagen (vacía si no existe)
+    """
+    try:
+        with os.scandir(out_dir) as it:
+            return [e.name for e in it
+                    if e.name.lower().endswith(_IMG_EXT_TUPLE) and e.is_file()]
+    except FileNotFoundError:
+        return []
+
+
 def _fps_from_offset(offset) -> float:
     """
     Convierte el offset (segundos entre imágenes) a frames por segundo (fps).
@@ -136,21 +195,46 @@ def _fps_from_offset(offset) -> float:
 # - FFmpeg: Herramienta universal de procesamiento de video
 # - wiutils: Biblioteca especializada para archivos de cámaras trampa
 
+def _frame_args(video_path: Path, fps: float) -> tuple[list, list]:
+    """
+    Argumentos de FFmpeg para muestrear los frames de un video.
+    
+    Si la tasa de frames del video se puede leer de la cabecera, se toma uno
+    de cada K frames con el filtro select (K = fps_video / fps) y -vsync 0,
+    sin regenerar marcas de tiempo (+genpts) ni reajustar la cadencia con el
+    filtro fps. Si no, se usa la combinación clásica +genpts / fps=X / vfr.
+    
+    Args:
+        video_path: Ruta del video
+        fps: Frames por segundo a extraer
+    
+    Returns:
+        tuple: (argumentos_de_entrada, argumentos_de_salida)
+    """
+    in_fps = _probe_fps_native(video_path)
+    step = int(round(in_fps / fps)) if in_fps else 0
+    if step >= 1:
+        return [], ["-vf", f"select='not(mod(n,{step}))'", "-vsync", "0"]
+    return ["-fflags", "+genpts"], ["-vsync", "vfr", "-vf", f"fps={fps}"]
+
+
 def _extract_with_ffmpeg(ffmpeg_bin: str, video_path: Path, out_dir: Path,
-                         fps: float, update_status=None) -> bool:
+                         fps: float, update_status=None,
+                         threads: int = _FFMPEG_THREADS_SINGLE) -> bool:
     """
-    Extrae frames de un video usando FFmpeg con filtro de tasa de frames variable.
+    Extrae frames de un video usando FFmpeg.
     
-    Comando FFmpeg utilizado:
-        -vsync vfr: Variable frame rate (extrae solo frames únicos)
-        -vf fps=X: Filtro para especificar la tasa de extracción
+    Comando FFmpeg utilizado (ver _frame_args):
+        -vf select: uno de cada K frames, si se conoce la tasa del video
+        -vsync vfr -vf fps=X: tasa de extracción variable, en otro caso
     
     Args:
         ffmpeg_bin: Ruta al ejecutable de FFmpeg
         video_path: Ruta del archivo de video a procesar
-        out_dir: Directorio donde se guardarán las imágenes
+        out_dir: Carpeta de staging (nueva) donde se guardarán las imágenes
         fps: Frames por segundo a extraer
         update_status: Función callback opcional para reportar el progreso
+        threads: Valor de -threads para decodificar y codificar
     
     Returns:
         bool: True si la extracción fue exitosa, False en caso contrario
@@ -161,22 +245,21 @@ def _extract_with_ffmpeg(ffmpeg_bin: str, video_path: Path, out_dir: Path,
             return False
 
         out_dir.mkdir(parents=True, exist_ok=True)
-        before = {p.name for p in out_dir.glob("*")
-                  if p.suffix.lower() in (".jpg", ".jpeg", ".png")}
 
         video_stem = Path(video_path).stem
         pattern = out_dir / f"{video_stem}_%06d.jpg"
 
+        in_args, out_args = _frame_args(video_path, fps)
         cmd = [
             ffmpeg_bin, "-hide_banner", "-loglevel", "error", "-nostdin", "-y",
-            "-fflags", "+genpts", "-i", str(video_path),
-            "-vsync", "vfr", "-vf", f"fps={fps}", str(pattern),
+            "-threads", str(threads), *in_args, "-i", str(video_path),
+            "-threads", str(threads), *out_args, str(pattern),
         ]
-        creationflags = 0x08000000 if os.name == "nt" else 0
-        subprocess.run(cmd, check=True, capture_output=True, creationflags=creationflags)
+        _run(cmd, check=True)
 
-        produced = [p for p in out_dir.glob("*")
-                    if p.name not in before and p.suffix.lower() in (".jpg", ".jpeg", ".png")]
+        # Cada video se extrae en una carpeta de staging nueva y la numeración
+        # de FFmpeg empieza siempre en 1: basta con mirar el primer frame
+        produced = os.path.exists(out_dir / f"{video_stem}_{1:06d}.jpg")
         if not produced:
             update_status and update_status("⚠️ FFmpeg se ejecutó pero no produjo imágenes.")
             return False
@@ -209,7 +292,7 @@ def _extract_with_wiutils(video_path: Path, out_dir: Path, timestamp: str, offse
     """
     try:
         wiutils.convert_video_to_images(str(video_path), str(out_dir), timestamp, offset=offset)
-        return any(p.suffix.lower() in (".jpg", ".jpeg", ".png") for p in out_dir.glob("*"))
+        return bool(_list_images_fast(out_dir))
     except Exception as e:
         print(f"[wiutils] Falla con {video_path.name}: {e}")
         return False
@@ -221,21 +304,26 @@ def _extract_with_wiutils(video_path: Path, out_dir: Path, timestamp: str, offse
 # Funciones para gestionar la nomenclatura uniforme de las imágenes extraídas.
 # Formato estándar: <nombre_video>_XXXXXX.jpg (índice de 6 dígitos)
 
-def _parse_index_from_name(p: Path, video_stem: str) -> int:
+# Siguiente índice libre por prefijo de video durante la ejecución actual
+# ({video_stem: next_idx}); se reinicia al comenzar cada process_videos().
+_NEXT_IDX: dict[str, int] = {}
+
+
+def _parse_index_from_name(name: str, video_stem: str) -> int:
     """
     Extrae el índice numérico del nombre de un archivo de imagen.
     
     Esperado: <video_stem>_XXXXXX.ext donde XXXXXX es un número de 6 dígitos.
     
     Args:
-        p: Path del archivo a analizar
+        name: Nombre del archivo a analizar
         video_stem: Nombre base del video (sin extensión)
     
     Returns:
         int: Índice extraído, o -1 si no se puede parsear
     """
     try:
-        base = p.stem
+        base = name.rpartition(".")[0]
         if not base.startswith(f"{video_stem}_"):
             return -1
         part = base.split("_")[-1]
@@ -244,7 +332,7 @@ def _parse_index_from_name(p: Path, video_stem: str) -> int:
         return -1
 
 
-def _next_index_for_prefix(out_dir: Path, video_stem: str) -> int:
+def _next_index_for_prefix(out_dir: Path, video_stem: str, names: list = None) -> int:
     """
     Encuentra el siguiente índice disponible para un prefijo de video dado.
     
@@ -254,56 +342,72 @@ def _next_index_for_prefix(out_dir: Path, video_stem: str) -> int:
     Args:
         out_dir: Directorio donde buscar archivos existentes
         video_stem: Nombre base del video
+        names: Listado de imágenes de out_dir ya tomado (evita releer la carpeta)
     
     Returns:
         int: Siguiente índice disponible (max_actual + 1)
     """
+    if names is None:
+        names = _list_images_fast(out_dir)
+    prefix = f"{video_stem}_"
     max_idx = 0
-    for p in out_dir.glob(f"{video_stem}_*.*"):
-        if p.suffix.lower() not in (".jpg", ".jpeg", ".png"):
+    for name in names:
+        if not name.startswith(prefix):
             continue
-        idx = _parse_index_from_name(p, video_stem)
+        idx = _parse_index_from_name(name, video_stem)
         if idx > max_idx:
             max_idx = idx
     return max_idx + 1
 
 
-def _rename_new_flat(out_dir: Path, video_stem: str, before_names: set) -> int:
+def _merge_staged(stage_dir: Path, out_dir: Path, video_stem: str,
+                  known_names: set = None) -> int:
     """
-    Renombra las imágenes recién extraídas a la nomenclatura estándar.
+    Mueve las imágenes de una carpeta de staging a la carpeta de salida.
     
-    Solo procesa archivos nuevos (no presentes en before_names) que no tengan
-    ya el formato correcto. Evita colisiones de nombres y normaliza extensiones.
+    Conserva los nombres <video_stem>_XXXXXX.ext cuyo índice está libre; el
+    resto (nombres de wiutils o índices ya ocupados) recibe el siguiente
+    índice libre según _NEXT_IDX. La carpeta de staging se elimina al terminar.
     
     Args:
-        out_dir: Directorio con las imágenes a renombrar
+        stage_dir: Carpeta temporal donde se extrajeron las imágenes del video
+        out_dir: Carpeta única de salida
         video_stem: Nombre base del video (prefijo para las imágenes)
-        before_names: Set de nombres de archivos que ya existían antes
+        known_names: Set opcional de nombres presentes en out_dir; si se
+            indica, sustituye a la lectura de la carpeta para buscar el
+            índice máximo y se le agregan los nombres de las imágenes movidas
     
     Returns:
-        int: Total de imágenes nuevas encontradas (renombradas o no)
-    """  
-    new_imgs = [p for p in out_dir.glob("*")
-                if p.name not in before_names and p.suffix.lower() in (".jpg", ".jpeg", ".png")]
-    to_rename = [p for p in new_imgs if not p.name.startswith(f"{video_stem}_")]
-    if not to_rename:
-        return len(new_imgs)
-
-    next_idx = _next_index_for_prefix(out_dir, video_stem)
-    for p in sorted(to_rename, key=lambda x: x.name.lower()):
-        ext = p.suffix.lower()
-        if ext == ".jpeg":  # normaliza
-            ext = ".jpg"
-        target = out_dir / f"{video_stem}_{next_idx:06d}{ext}"
-        while target.exists():
-            next_idx += 1
+        int: Total de imágenes movidas a out_dir
+    """
+    staged = sorted(_list_images_fast(stage_dir), key=str.lower)
+    next_idx = _NEXT_IDX.get(video_stem)
+    if next_idx is None:
+        next_idx = _next_index_for_prefix(out_dir, video_stem, known_names)
+    moved = 0
+    for name in staged:
+        p = stage_dir / name
+        idx = _parse_index_from_name(name, video_stem)
+        if idx >= next_idx:
+            # Índice por encima del máximo usado: está libre, se conserva
+            target = out_dir / name
+            next_idx = idx + 1
+        else:
+            ext = p.suffix.lower()
+            if ext == ".jpeg":  # normaliza
+                ext = ".jpg"
             target = out_dir / f"{video_stem}_{next_idx:06d}{ext}"
-        try:
-            p.rename(target)
             next_idx += 1
+        try:
+            os.rename(p, target)
+            moved += 1
+            if known_names is not None:
+                known_names.add(target.name)
         except Exception as e:
-            print(f"[rename] No se pudo renombrar {p.name} -> {target.name}: {e}")
-    return len(new_imgs)
+            print(f"[rename] No se pudo mover {p.name} -> {target.name}: {e}")
+    _NEXT_IDX[video_stem] = next_idx
+    shutil.rmtree(stage_dir, ignore_errors=True)
+    return moved
 
 
 # ==============================================================================
@@ -311,14 +415,182 @@ def _rename_new_flat(out_dir: Path, video_stem: str, before_names: set) -> int:
 # ==============================================================================
 # Funciones para obtener información técnica de los videos sin procesarlos.
 
+def _iter_atoms(f, start: int, stop: int):
+    """
+    Recorre los átomos MP4/MOV contenidos entre dos offsets del archivo.
+    
+    Args:
+        f: Archivo abierto en modo binario
+        start: Offset del primer átomo
+        stop: Offset del final de la región
+    
+    Yields:
+        tuple: (tipo, inicio_del_contenido, fin_del_átomo)
+    """
+    offset = start
+    while offset + 8 <= stop:
+        f.seek(offset)
+        size, kind = struct.unpack(">I4s", f.read(8))
+        header = 8
+        if size == 1:
+            size, = struct.unpack(">Q", f.read(8))
+            header = 16
+        elif size == 0:
+            size = stop - offset
+        if size < header:
+            return
+        yield kind, offset + header, offset + size
+        offset += size
+
+
+def _find_atom(f, start: int, stop: int, *path: bytes) -> tuple | None:
+    """
+    Desciende por una ruta de átomos (ej. b"mdia", b"minf", b"stbl").
+    
+    Returns:
+        tuple | None: (inicio_del_contenido, fin) del último átomo, o None
+    """
+    for kind in path:
+        for k, s, e in _iter_atoms(f, start, stop):
+            if k == kind:
+                start, stop = s, e
+                break
+        else:
+            return None
+    return start, stop
+
+
+def _avih_fields(f) -> tuple | None:
+    """
+    Lee (dwMicroSecPerFrame, dwTotalFrames) de la cabecera avih de un AVI.
+    
+    Args:
+        f: Archivo abierto en modo binario, posicionado tras "RIFF....AVI "
+    
+    Returns:
+        tuple | None: Campos de avih, o None si no se encuentran
+    """
+    chunk = f.read(256)
+    pos = chunk.find(b"avih")
+    if pos < 0 or len(chunk) < pos + 8 + 20:
+        return None
+    usec_per_frame, = struct.unpack_from("<I", chunk, pos + 8)
+    total_frames, = struct.unpack_from("<I", chunk, pos + 8 + 16)
+    return usec_per_frame, total_frames
+
+
+def _probe_duration_native(video: Path) -> float | None:
+    """
+    Lee la duración directamente de la cabecera del contenedor, sin procesos externos.
+    
+    Soporta:
+        - MP4/MOV: átomo moov/mvhd (duration / timescale)
+        - AVI: cabecera avih (dwMicroSecPerFrame × dwTotalFrames)
+    
+    Args:
+        video: Path del archivo de video
+    
+    Returns:
+        float | None: Duración en segundos, o None si no se pudo leer
+    """
+    try:
+        with open(video, "rb") as f:
+            head = f.read(12)
+            if len(head) < 12:
+                return None
+
+            # AVI: RIFF....AVI LIST....hdrlavih
+            if head[:4] == b"RIFF" and head[8:12] == b"AVI ":
+                fields = _avih_fields(f)
+                if not fields:
+                    return None
+                secs = fields[0] * fields[1] / 1_000_000
+                return secs if secs > 0 else None
+
+            # MP4/MOV: moov/mvhd
+            f.seek(0, os.SEEK_END)
+            mvhd = _find_atom(f, 0, f.tell(), b"moov", b"mvhd")
+            if not mvhd:
+                return None
+            f.seek(mvhd[0])
+            data = f.read(32)
+            if data[0] == 1:
+                timescale, duration = struct.unpack_from(">IQ", data, 20)
+            else:
+                timescale, duration = struct.unpack_from(">II", data, 12)
+            return duration / timescale if timescale else None
+    except Exception:
+        pass
+    return None
+
+
+def _probe_fps_native(video: Path) -> float | None:
+    """
+    Lee la tasa de frames media del video desde la cabecera del contenedor.
+    
+    Soporta:
+        - MP4/MOV: primera pista de video (hdlr "vide"); número de muestras
+          de stsz dividido por la duración de mdhd
+        - AVI: 1e6 / dwMicroSecPerFrame de avih
+    
+    Args:
+        video: Path del archivo de video
+    
+    Returns:
+        float | None: Frames por segundo, o None si no se pudo leer
+    """
+    try:
+        with open(video, "rb") as f:
+            head = f.read(12)
+            if len(head) < 12:
+                return None
+
+            if head[:4] == b"RIFF" and head[8:12] == b"AVI ":
+                fields = _avih_fields(f)
+                return 1_000_000 / fields[0] if fields and fields[0] else None
+
+            f.seek(0, os.SEEK_END)
+            moov = _find_atom(f, 0, f.tell(), b"moov")
+            if not moov:
+                return None
+            for kind, start, stop in _iter_atoms(f, *moov):
+                if kind != b"trak":
+                    continue
+                hdlr = _find_atom(f, start, stop, b"mdia", b"hdlr")
+                if not hdlr:
+                    continue
+                f.seek(hdlr[0] + 8)
+                if f.read(4) != b"vide":
+                    continue
+                mdhd = _find_atom(f, start, stop, b"mdia", b"mdhd")
+                stsz = _find_atom(f, start, stop, b"mdia", b"minf", b"stbl", b"stsz")
+                if not mdhd or not stsz:
+                    return None
+                f.seek(mdhd[0])
+                data = f.read(32)
+                if data[0] == 1:
+                    timescale, duration = struct.unpack_from(">IQ", data, 20)
+                else:
+                    timescale, duration = struct.unpack_from(">II", data, 12)
+                f.seek(stsz[0] + 8)
+                sample_count, = struct.unpack(">I", f.read(4))
+                if not timescale or not duration or not sample_count:
+                    return None
+                return sample_count * timescale / duration
+    except Exception:
+        pass
+    return None
+
+
 def _probe_duration_str(ffprobe_bin: str, ffmpeg_bin: str, video: Path) -> str:
     """
     Obtiene la duración de un video en formato legible (HH:MM:SS o MM:SS).
     
     Estrategia de detección (por prioridad):
-        1. FFprobe con opción -show_entries format=duration (más preciso)
-        2. FFmpeg -i parseando la salida stderr (fallback)
-        3. "desconocida" si ambos métodos fallan
+        1. Lectura directa de la cabecera MP4/MOV/AVI (sin procesos externos)
+        2. FFprobe con opción -show_entries format=duration
+        3. FFmpeg -i parseando la salida stderr (fallback)
+        4. "desconocida" si todos los métodos fallan
     
     Args:
         ffprobe_bin: Ruta al ejecutable de FFprobe
@@ -328,14 +600,18 @@ def _probe_duration_str(ffprobe_bin: str, ffmpeg_bin: str, video: Path) -> str:
     Returns:
         str: Duración en formato "HH:MM:SS" o "desconocida" si falla
     """
-    # 1) ffprobe (si existe)
+    # 1) cabecera del contenedor
+    secs = _probe_duration_native(video)
+    if secs is not None:
+        return _secs_to_hms(secs)
+
+    # 2) ffprobe (si existe)
     if ffprobe_bin and Path(ffprobe_bin).exists():
         try:
-            creationflags = 0x08000000 if os.name == "nt" else 0
-            pr = subprocess.run(
+            pr = _run(
                 [ffprobe_bin, "-v", "error", "-select_streams", "v:0",
                  "-show_entries", "format=duration", "-of", "default=noprint_wrappers=1:nokey=1", str(video)],
-                capture_output=True, check=True, creationflags=creationflags
+                check=True
             )
             txt = (pr.stdout or b"").decode("utf-8", errors="ignore").strip()
             secs = float(txt)
@@ -343,28 +619,60 @@ def _probe_duration_str(ffprobe_bin: str, ffmpeg_bin: str, video: Path) -> str:
         except Exception:
             pass
 
-    # 2) ffmpeg -i (parsea "Duration: 00:00:00.xx")
+    # 3) ffmpeg -i (parsea "Duration: 00:00:00.xx")
     if ffmpeg_bin and Path(ffmpeg_bin).exists():
         try:
-            creationflags = 0x08000000 if os.name == "nt" else 0
-            pr = subprocess.run(
-                [ffmpeg_bin, "-hide_banner", "-i", str(video)],
-                capture_output=True, check=False, creationflags=creationflags
-            )
-            err = (pr.stderr or b"").decode("utf-8", errors="ignore")
-            for line in err.splitlines():
-                if "Duration:" in line:
-                    # Ejemplo: "  Duration: 00:00:12.34, start: 0.000000, bitrate: ..."
-                    part = line.split("Duration:", 1)[1].split(",", 1)[0].strip()
-                    # toma HH:MM:SS.xx y trunca a HH:MM:SS
-                    hms = part.split(".")[0]
-                    return hms
+            pr = _run([ffmpeg_bin, "-hide_banner", "-i", str(video)], check=False)
+            # búsqueda directa sobre los bytes; trunca HH:MM:SS.xx a HH:MM:SS
+            m = _DUR_RE.search(pr.stderr or b"")
+            if m:
+                return m.group(1).decode("ascii")
         except Exception:
             pass
 
     return "desconocida"
 
 
+def _probe_durations_bulk(ffprobe_bin: str, ffmpeg_bin: str, paths: list,
+                          pool: ThreadPoolExecutor) -> dict:
+    """
+    Encola el sondeo de duración de todos los videos en un pool de hilos.
+    
+    No espera resultados: devuelve un Future por video, en el mismo orden en
+    que se procesarán, para que los sondeos avancen mientras se extrae.
+    
+    Args:
+        ffprobe_bin: Ruta al ejecutable de FFprobe
+        ffmpeg_bin: Ruta al ejecutable de FFmpeg (usado como fallback)
+        paths: Videos a analizar
+        pool: Pool de hilos donde ejecutar los sondeos
+    
+    Returns:
+        dict: {video: Future con la duración "HH:MM:SS" o "desconocida"}
+    """
+    return {v: pool.submit(_probe_duration_str, ffprobe_bin, ffmpeg_bin, v) for v in paths}
+
+
+def _duration_of(durations: dict, video: Path) -> str:
+    """
+    Duración de un video a partir de un dict de valores o de Futures.
+    
+    Args:
+        durations: {video: str | Future}
+        video: Video consultado
+    
+    Returns:
+        str: Duración, o "desconocida" si no hay dato o el sondeo falló
+    """
+    d = durations.get(video, "desconocida")
+    if isinstance(d, Future):
+        try:
+            return d.result()
+        except Exception:
+            return "desconocida"
+    return d
+
+
 def _secs_to_hms(secs: float) -> str:
     """
     Convierte segundos a formato HH:MM:SS.
@@ -387,18 +695,81 @@ def _secs_to_hms(secs: float) -> str:
 # ==============================================================================
 # Función principal que coordina todo el proceso de extracción de imágenes.
 
-def process_videos(input_path: Path, output_path: Path, update_status, update_progress, offset=None):
+def _progress_reporter(update_progress, total: int):
+    """
+    Crea una función que reporta el avance solo cuando cambia el porcentaje.
+    
+    El divisor se fija una vez y el porcentaje se calcula con aritmética
+    entera (exacta: el último elemento da siempre 100); con muchos videos se
+    evita emitir el mismo porcentaje repetidas veces hacia la UI (como máximo
+    101 llamadas).
+    
+    Args:
+        update_progress: Callback que recibe int 0-100 (puede ser None)
+        total: Número de elementos que representan el 100 %
+    
+    Returns:
+        callable: Función que recibe el número de elementos completados
+    """
+    denom = max(total, 1)
+    last_pct = -1
+
+    def _progress(i):
+        nonlocal last_pct
+        pct = i * 100 // denom
+        if pct == last_pct or not update_progress:
+            return
+        last_pct = pct
+        try:
+            update_progress(pct)
+        except Exception:
+            pass
+
+    return _progress
+
+
+def _iter_videos(base: Path, exts=_VIDEO_EXT_TUPLE):
+    """
+    Recorre recursivamente una carpeta y entrega solo los archivos de video.
+    
+    Usa os.scandir con una cola de directorios: el tipo de cada entrada sale
+    de la propia lectura del directorio y el Path se crea únicamente para
+    los archivos que coinciden, en lugar de uno por entrada como rglob.
+    
+    Args:
+        base: Carpeta raíz
+        exts: Tupla de extensiones aceptadas (con punto, en minúsculas)
+    
+    Yields:
+        Path: Cada video encontrado
+    """
+    pending = deque([os.fspath(base)])
+    while pending:
+        d = pending.popleft()
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.lower().endswith(exts):
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
+def process_videos(input_path: Path, output_path: Path, update_status, update_progress, offset=None,
+                   workers=None, resume=True):
     """
     Función principal: procesa todos los videos encontrados en input_path.
     
     Flujo de ejecución:
-        1. Localiza FFmpeg y FFprobe
+        1. Localiza FFmpeg y FFprobe (en paralelo con el paso 2)
         2. Escanea recursivamente buscando videos (.mp4, .mov, .avi)
-        3. Por cada video:
-           - Detecta duración
+        3. Detecta la duración de todos los videos en paralelo
+        4. Por cada video:
            - Extrae frames (wiutils para MP4, FFmpeg para otros o fallback)
            - Renombra imágenes con nomenclatura estándar
-        4. Reporta progreso mediante callbacks
+        5. Reporta progreso mediante callbacks
     
     Args:
         input_path: Carpeta raíz donde buscar videos recursivamente
@@ -406,80 +777,367 @@ def process_videos(input_path: Path, output_path: Path, update_status, update_pr
         update_status: Callback para mensajes de log (función que recibe str)
         update_progress: Callback para progreso (función que recibe int 0-100)
         offset: Segundos entre imágenes (None = 1 segundo por defecto)
+        workers: Videos simultáneos (None = un proceso por núcleo; 1 = secuencial)
+        resume: Omitir los videos que el manifiesto de output_path registra
+            como ya extraídos con el mismo intervalo (False = procesar todos)
     
     Returns:
-        tuple: (total_videos_procesados, tiempo_transcurrido_segundos)
+        tuple: (total_videos_procesados, tiempo_transcurrido_segundos,
+            imágenes_generadas); las imágenes son solo las escritas en esta
+            corrida (sin contar las que ya estaban en la salida)
     """
-    exts = {".mp4", ".avi", ".mov"}
-    video_paths = sorted((p for p in input_path.rglob("*") if p.suffix.lower() in exts),
-                         key=lambda x: str(x).lower())
-    total_videos = len(video_paths)
+    # ffmpeg/ffprobe y self-test se resuelven en paralelo (cada uno puede
+    # lanzar subprocesos) mientras se recorre la carpeta de entrada
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        f_ff = ex.submit(_find_ffmpeg)
+        f_fp = ex.submit(_find_ffprobe)
+        f_test = ex.submit(lambda: _ffmpeg_self_test(f_ff.result()) if f_ff.result() else None)
+
+        # Orden alfabético sin distinguir mayúsculas; la clave se calcula una
+        # sola vez por video (decorate-sort-undecorate)
+        keyed = [(os.fspath(p).casefold(), p) for p in _iter_videos(input_path)]
+        keyed.sort(key=lambda kp: kp[0])
+        video_paths = [p for _, p in keyed]
+        total_videos = len(video_paths)
+
+        ffmpeg_bin = f_ff.result()
+        ffprobe_bin = f_fp.result()
+        self_test = f_test.result()
 
-    # ffmpeg/ffprobe y fps
-    ffmpeg_bin = _find_ffmpeg()
-    ffprobe_bin = _find_ffprobe()
     update_status and update_status(f"🔵 FFmpeg: {ffmpeg_bin or 'NO ENCONTRADO'}")
     update_status and update_status(f"🔵 FFprobe: {ffprobe_bin or 'NO ENCONTRADO'}")
     if ffmpeg_bin:
-        update_status and update_status(f"🔵 {_ffmpeg_self_test(ffmpeg_bin)}")
+        update_status and update_status(f"🔵 {self_test}")
     else:
         update_status and update_status("⚠️ ffmpeg ausente")
 
     fps = _fps_from_offset(offset)
     output_path.mkdir(parents=True, exist_ok=True)
+    _NEXT_IDX.clear()
     start = time.time()
 
-    for i, video_path in enumerate(video_paths, start=1):
-        try:
-            dur = _probe_duration_str(ffprobe_bin, ffmpeg_bin, video_path)
-            update_status and update_status(
-                f"🔵 Procesando {i}/{total_videos}: {video_path.name} (duración {dur})"
-            )
+    # Duraciones: sondeos concurrentes en segundo plano, solapados con la
+    # extracción; cada video espera solo por el suyo
+    probe_pool = ThreadPoolExecutor(max_workers=8)
+    durations = _probe_durations_bulk(ffprobe_bin, ffmpeg_bin, video_paths, probe_pool)
+    try:
+        # Imágenes presentes en la salida: se lee la carpeta una vez y el set se
+        # mantiene al día con lo que produce cada video
+        existing_names = set(_list_images_fast(output_path))
 
-            # Timestamp para wiutils
-            mod_time = os.path.getmtime(video_path)
-            fecha_dt = datetime.fromtimestamp(mod_time) - timedelta(seconds=29)
-            timestamp = fecha_dt.strftime("%m-%d-%Y %H:%M:%S")
+        # Reanudación: se omiten los videos que el manifiesto registra como
+        # extraídos y cuyas imágenes siguen en la salida
+        manifest = _load_manifest(output_path)
+        keys = {v: _manifest_key(v, input_path) for v in video_paths}
+        skipped = _already_processed(video_paths, keys, manifest, existing_names, fps) if resume else set()
+        if skipped:
+            for video_path in video_paths:
+                if video_path in skipped:
+                    update_status and update_status(f"⏭ {keys[video_path]} ya procesado")
+            video_paths = [v for v in video_paths if v not in skipped]
+        pending = len(video_paths)
 
-            video_stem = video_path.stem
-            out_dir = output_path
+        # Imágenes escritas en esta corrida (suma de lo que mueve _merge_staged)
+        written = 0
 
-            before = {p.name for p in out_dir.glob("*")
-                      if p.suffix.lower() in (".jpg", ".jpeg", ".png")}
+        def _on_merged(video_path, n_images):
+            nonlocal written
+            written += n_images
+            if n_images:
+                manifest[keys[video_path]] = {"images": n_images, "fps": fps}
+                _save_manifest(output_path, manifest)
 
-            # MP4 -> wiutils, si falla -> FFmpeg ; AVI/MOV -> FFmpeg
-            suffix = video_path.suffix.lower()
-            if suffix in {".avi", ".mov"}:
-                ok = _extract_with_ffmpeg(ffmpeg_bin, video_path, out_dir, fps, update_status)
-            else:
-                ok = _extract_with_wiutils(video_path, out_dir, timestamp, offset)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers > 1 and pending > 1:
+            update_status and update_status(f"🔵 Procesando {pending} videos en paralelo ({workers} procesos)")
+            process_videos_parallel(video_paths, output_path, fps, ffmpeg_bin, workers=workers,
+                                    offset=offset, durations=durations, existing_names=existing_names,
+                                    update_status=update_status, update_progress=update_progress,
+                                    on_merged=_on_merged)
+            duration = round(time.time() - start, 2)
+            return total_videos, duration, written
+
+        _progress = _progress_reporter(update_progress, pending)
+
+        for i, video_path in enumerate(video_paths, start=1):
+            stage_dir = output_path / f".img2wi_{i:05d}_{video_path.stem}"
+            try:
+                dur = _duration_of(durations, video_path)
+                update_status and update_status(
+                    f"🔵 Procesando {i}/{pending}: {video_path.name} (duración {dur})"
+                )
+
+                # MP4 -> wiutils, si falla -> FFmpeg ; AVI/MOV -> FFmpeg
+                _, ok, log_lines = _process_one_video(video_path, stage_dir, fps, offset, ffmpeg_bin,
+                                                      threads=_FFMPEG_THREADS_SINGLE)
+                for msg in log_lines:
+                    update_status and update_status(msg)
                 if not ok:
-                    update_status and update_status("⚠️ wiutils falló; probando FFmpeg…")
-                    ok = _extract_with_ffmpeg(ffmpeg_bin, video_path, out_dir, fps, update_status)
+                    shutil.rmtree(stage_dir, ignore_errors=True)
+                    continue
 
-            if not ok:
-                continue
+                # Renombrado: se mueven solo las imágenes de este video
+                new_count = _merge_staged(stage_dir, output_path, video_path.stem, existing_names)
+                _on_merged(video_path, new_count)
+                update_status and update_status(f"✅ {new_count} imágenes generadas desde '{video_path.name}'")
 
-            # Renombrado (sólo nuevas sin prefijo)
-            new_count = _rename_new_flat(out_dir, video_stem, before)
-            update_status and update_status(f"✅ {new_count} imágenes generadas desde '{video_path.name}'")
+                # progreso simple por video
+                _progress(i)
 
-            # progreso simple por video
-            try:
-                update_progress and update_progress(int(i / max(total_videos, 1) * 100))
-            except Exception:
-                pass
+            except Exception as e:
+                shutil.rmtree(stage_dir, ignore_errors=True)
+                update_status and update_status(f"❌ Error procesando {video_path.name}: {e}")
 
-        except Exception as e:
-            update_status and update_status(f"❌ Error procesando {video_path.name}: {e}")
+        if not pending:
+            _progress(1)
+    finally:
+        # También si la extracción se interrumpe: no quedan sondeos pendientes
+        probe_pool.shutdown(wait=False, cancel_futures=True)
 
     duration = round(time.time() - start, 2)
-    return total_videos, duration
+    return total_videos, duration, written
+
+
+# Registro de videos ya extraídos en la carpeta de salida, por ruta relativa
+# a la carpeta de entrada: {ruta: {"images": n, "fps": fps}}
+_MANIFEST_NAME = ".img2wi_manifest.json"
+
+
+def _manifest_key(video_path: Path, base: Path) -> str:
+    """
+    Clave del video en el manifiesto: ruta relativa a la carpeta de entrada.
+    
+    Los nombres de archivo se repiten entre cámaras (cam1/VID0001.MP4 y
+    cam2/VID0001.MP4), así que el nombre o el stem solos no bastan.
+    """
+    try:
+        return video_path.relative_to(base).as_posix()
+    except ValueError:
+        return video_path.as_posix()
+
+
+def _load_manifest(out_dir: Path) -> dict:
+    """Lee el manifiesto de out_dir ({} si no existe o está dañado)."""
+    try:
+        with open(out_dir / _MANIFEST_NAME, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(out_dir: Path, manifest: dict) -> None:
+    """Escribe el manifiesto de forma atómica (archivo temporal + replace)."""
+    path = out_dir / _MANIFEST_NAME
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, path)
+    except OSError:
+        # Sin manifiesto la siguiente corrida simplemente no podrá reanudar
+        pass
+
+
+def _already_processed(video_paths: list, keys: dict, manifest: dict,
+                       existing_names: set, fps: float) -> set:
+    """
+    Detecta videos ya extraídos en una corrida anterior.
+    
+    Un video se omite si su ruta relativa figura en el manifiesto con el
+    mismo fps y las imágenes registradas para su prefijo <video_stem>_
+    (sumando todos los videos con ese stem) siguen en la carpeta de salida.
+    
+    Args:
+        video_paths: Videos de la ejecución
+        keys: {video: clave en el manifiesto}
+        manifest: Manifiesto leído de la carpeta de salida
+        existing_names: Nombres de imágenes ya presentes en la salida
+        fps: Frames por segundo de esta corrida
+    
+    Returns:
+        set: Videos que pueden omitirse
+    """
+    done = set()
+    if not manifest or not existing_names:
+        return done
+    counts = {}
+    for name in existing_names:
+        stem = name.rpartition("_")[0]
+        counts[stem] = counts.get(stem, 0) + 1
+
+    # Imágenes esperadas por stem según el manifiesto
+    expected = {}
+    for key, entry in manifest.items():
+        if isinstance(entry, dict):
+            stem = Path(key).stem
+            expected[stem] = expected.get(stem, 0) + int(entry.get("images", 0))
+
+    for video_path in video_paths:
+        entry = manifest.get(keys[video_path])
+        if not isinstance(entry, dict) or abs(float(entry.get("fps", 0)) - fps) > 1e-9:
+            continue
+        stem = video_path.stem
+        if counts.get(stem, 0) >= expected.get(stem, 0):
+            done.add(video_path)
+    return done
+
+
+def _wiutils_timestamp(video_path: Path) -> str:
+    """
+    Timestamp base para wiutils: fecha de modificación del video menos 29 s.
+    
+    Args:
+        video_path: Ruta del video
+    
+    Returns:
+        str: Fecha en formato "MM-DD-YYYY HH:MM:SS"
+    """
+    mod_time = os.path.getmtime(video_path)
+    fecha_dt = datetime.fromtimestamp(mod_time) - timedelta(seconds=29)
+    return fecha_dt.strftime("%m-%d-%Y %H:%M:%S")
+
+
+def _process_one_video(video_path: Path, stage_dir: Path, fps: float, offset,
+                       ffmpeg_bin: str, timestamp: str = None,
+                       threads: int = _FFMPEG_THREADS_PARALLEL) -> tuple:
+    """
+    Extrae un video completo sobre su propia carpeta de staging.
+    
+    Estrategia: wiutils para MP4 con FFmpeg como fallback; FFmpeg directo
+    para AVI/MOV. Lo usan el flujo secuencial y los procesos del pool (la
+    carpeta propia evita que los procesos concurrentes se mezclen); quien
+    llama mueve luego las imágenes a la salida plana.
+    Los callbacks de la UI no cruzan procesos, así que los mensajes se
+    acumulan y se devuelven a quien llama.
+    
+    Args:
+        video_path: Ruta del video
+        stage_dir: Carpeta de staging exclusiva de este video
+        fps: Frames por segundo a extraer (FFmpeg)
+        offset: Segundos entre imágenes (wiutils)
+        ffmpeg_bin: Ruta al ejecutable de FFmpeg
+        timestamp: Timestamp base para wiutils (None = se calcula aquí)
+        threads: Valor de -threads para FFmpeg (1: hay otros videos en paralelo)
+    
+    Returns:
+        tuple: (nombre_del_video, ok, lista_de_mensajes)
+    """
+    log_lines = []
+    stage_dir.mkdir(parents=True, exist_ok=True)
+    if video_path.name.lower().endswith(_FFMPEG_EXT_TUPLE):
+        ok = _extract_with_ffmpeg(ffmpeg_bin, video_path, stage_dir, fps, log_lines.append,
+                                  threads=threads)
+    else:
+        if timestamp is None:
+            timestamp = _wiutils_timestamp(video_path)
+        ok = _extract_with_wiutils(video_path, stage_dir, timestamp, offset)
+        if not ok:
+            log_lines.append("⚠️ wiutils falló; probando FFmpeg…")
+            ok = _extract_with_ffmpeg(ffmpeg_bin, video_path, stage_dir, fps, log_lines.append,
+                                      threads=threads)
+    return video_path.name, ok, log_lines
+
+
+def process_videos_parallel(videos: list, out_dir: Path, fps: float, ffmpeg_bin: str,
+                            workers: int = None, offset=None, durations: dict = None,
+                            existing_names: set = None,
+                            update_status=None, update_progress=None, on_merged=None) -> int:
+    """
+    Extrae imágenes de varios videos en paralelo con un pool de procesos.
+    
+    Cada video se extrae en un proceso independiente (FFmpeg y el trabajo en
+    Python de wiutils no comparten el GIL) sobre su propia carpeta de staging.
+    El proceso que llama recibe los resultados a medida que terminan y, en
+    el orden en que se enviaron los videos, mueve las imágenes a out_dir con
+    la nomenclatura estándar y reporta estado y progreso desde su propio hilo.
+    
+    Args:
+        videos: Lista de videos a procesar
+        out_dir: Carpeta única de salida
+        fps: Frames por segundo a extraer
+        ffmpeg_bin: Ruta al ejecutable de FFmpeg
+        workers: Procesos simultáneos (None = un proceso por núcleo)
+        offset: Segundos entre imágenes (para wiutils)
+        durations: {video: duración o Future}, solo para los mensajes
+        existing_names: Nombres de imágenes ya presentes en out_dir; se
+            mantiene al día con cada video fusionado
+        update_status: Callback para mensajes de log
+        update_progress: Callback para progreso (0-100)
+        on_merged: Callback opcional (video, imágenes_movidas) tras fusionar
+            cada video en out_dir
+    
+    Returns:
+        int: Total de videos procesados con éxito
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    threads = _FFMPEG_THREADS_PARALLEL if workers > 1 else _FFMPEG_THREADS_SINGLE
+    durations = durations or {}
+    if existing_names is None:
+        existing_names = set(_list_images_fast(out_dir))
+    total = len(videos)
+    _progress = _progress_reporter(update_progress, total)
+    done = 0
+    processed = 0
+
+    # "spawn" en todas las plataformas (el de Windows): los procesos no heredan
+    # por fork los hilos del llamador (sondeos de duración, QThread de la UI)
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers, max(total, 1)), mp_context=ctx) as pool:
+        futures = {}
+        for i, video_path in enumerate(videos, start=1):
+            stage_dir = out_dir / f".img2wi_{i:05d}_{video_path.stem}"
+            fut = pool.submit(_process_one_video, video_path, stage_dir, fps, offset, ffmpeg_bin,
+                              threads=threads)
+            futures[fut] = (i, video_path, stage_dir)
+
+        # Los resultados llegan en orden de término, pero se fusionan en orden
+        # de envío: los índices <stem>_NNNNNN de videos con el mismo stem no
+        # dependen de cuál termina primero
+        ready = {}
+        next_i = 1
+        for fut in as_completed(futures):
+            i, video_path, stage_dir = futures[fut]
+            ready[i] = (fut, video_path, stage_dir)
+            while next_i in ready:
+                fut_i, video_path, stage_dir = ready.pop(next_i)
+                try:
+                    name, ok, log_lines = fut_i.result()
+                    update_status and update_status(
+                        f"🔵 Procesado {next_i}/{total}: {name} "
+                        f"(duración {_duration_of(durations, video_path)})"
+                    )
+                    for msg in log_lines:
+                        update_status and update_status(msg)
+                    if ok:
+                        new_count = _merge_staged(stage_dir, out_dir, video_path.stem, existing_names)
+                        processed += 1
+                        on_merged and on_merged(video_path, new_count)
+                        update_status and update_status(f"✅ {new_count} imágenes generadas desde '{name}'")
+                    else:
+                        shutil.rmtree(stage_dir, ignore_errors=True)
+                except Exception as e:
+                    shutil.rmtree(stage_dir, ignore_errors=True)
+                    update_status and update_status(f"❌ Error procesando {video_path.name}: {e}")
+
+                next_i += 1
+                done += 1
+                _progress(done)
+
+    return processed
+
+
+# Resultado del self-test por binario; solo se guardan las ejecuciones exitosas
+# para que un fallo transitorio se reintente en la siguiente corrida.
+_SELF_TEST: dict[str, str] = {}
 
 
 def _ffmpeg_self_test(ffmpeg_bin: str) -> str:
     """
     Verifica que FFmpeg esté funcionando correctamente ejecutando -version.
+    El resultado se memoriza por ruta del binario.
     
     Args:
         ffmpeg_bin: Ruta al ejecutable de FFmpeg
@@ -487,13 +1145,30 @@ def _ffmpeg_self_test(ffmpeg_bin: str) -> str:
     Returns:
         str: Primera línea de la versión de FFmpeg o mensaje de error
     """
+    cached = _SELF_TEST.get(ffmpeg_bin)
+    if cached is not None:
+        return cached
     try:
-        pr = subprocess.run(
+        # Solo interesa la primera línea: se lee de stdout y stderr se descarta
+        proc = subprocess.Popen(
             [ffmpeg_bin, "-hide_banner", "-loglevel", "error", "-version"],
-            capture_output=True, check=True,
-            creationflags=(0x08000000 if os.name == "nt" else 0)
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, creationflags=_CREATIONFLAGS,
         )
-        out = (pr.stdout or pr.stderr or b"").decode("utf-8", errors="ignore").splitlines()
-        return out[0] if out else "ffmpeg ok (sin salida)"
+        try:
+            first = proc.stdout.readline().decode("utf-8", errors="ignore").rstrip()
+        finally:
+            proc.stdout.close()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        # Con la primera línea ya leída, un código de salida distinto de cero
+        # puede deberse solo al cierre anticipado del pipe
+        if not first and proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, ffmpeg_bin)
+        result = first or "ffmpeg ok (sin salida)"
     except Exception as e:
         return f"no se pudo ejecutar ffmpeg: {e}"
+    _SELF_TEST[ffmpeg_bin] = result
+    return result
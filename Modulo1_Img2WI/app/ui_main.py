@@ -32,7 +32,9 @@ Licencia: Ver THIRD_PARTY_NOTICES.txt
 
 import os
 import sys
+import threading
 import time
+from datetime import datetime
 from pathlib import Path
 
 from PyQt5.QtCore import Qt, QTimer, QTime, QObject, pyqtSignal, QThread
@@ -49,6 +51,11 @@ from PyQt5.QtWidgets import (
 # Funciones auxiliares para manejo de recursos (iconos, imágenes) en diferentes
 # entornos: desarrollo (código fuente) y producción (ejecutable PyInstaller).
 
+# Base de recursos: carpeta de PyInstaller (_MEIPASS) o la del código fuente.
+# Es invariante durante la ejecución, así que se resuelve una sola vez.
+_RESOURCE_BASE = Path(getattr(sys, "_MEIPASS", None) or Path(__file__).resolve().parent)
+
+
 def resource_path(relative: str) -> str:
     """
     Localiza recursos (iconos, imágenes) tanto en desarrollo como en ejecutable.
@@ -62,7 +69,7 @@ def resource_path(relative: str) -> str:
     Returns:
         str: Ruta absoluta al recurso, ajustada según el entorno de ejecución
     """
-    base = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent))
+    base = _RESOURCE_BASE
     p1 = (base / relative).resolve()
     if p1.exists():
         return str(p1)
@@ -71,6 +78,27 @@ def resource_path(relative: str) -> str:
     return str(p2)
 
 
+# Colores por nivel de log (se construyen una sola vez)
+_LOG_COLORS = {
+    "info": QColor("#1f77b4"),  # azul
+    "warn": QColor("#e6a700"),  # amarillo
+    "ok":   QColor("#2ca02c"),  # verde
+    "error":QColor("#d62728"),  # rojo
+}
+
+# Nivel de log según el emoji con el que el backend prefija sus mensajes
+# (⚠️ llega como "⚠" + selector de variación U+FE0F)
+_LVL_BY_EMOJI = {"✅": "ok", "⚠": "warn", "❌": "error", "🔵": "info"}
+
+# Extensiones de video soportadas y otras comunes (solo para avisar al usuario)
+_VALID_EXTS = frozenset({".mp4", ".mov", ".avi"})
+_COMMON_VIDEO_EXTS = frozenset({".mov", ".mkv", ".wmv", ".flv", ".mpg", ".mpeg", ".m4v",
+                                ".3gp", ".webm", ".ts", ".vob", ".asf", ".avi", ".mp4"})
+
+# Intervalo (ms) con el que se vuelcan a la tabla los logs acumulados
+_LOG_FLUSH_MS = 200
+
+
 # ==============================================================================
 # VENTANA PRINCIPAL DE LA APLICACIÓN
 # ==============================================================================
@@ -93,6 +121,9 @@ class VideoProcessorWindow(QWidget):
         worker (Worker): Objeto que ejecuta el procesamiento en el hilo
         timer (QTimer): Cronómetro para medir duración del proceso
     """
+    # Logo del pie ya escalado; se comparte entre ventanas (ver _footer_logo)
+    _LOGO_PIX: QPixmap = None
+
     def __init__(self):
         super().__init__()
 
@@ -211,6 +242,16 @@ class VideoProcessorWindow(QWidget):
         self.log_table.setMinimumHeight(260)
         root.addWidget(self.log_table, 1)
 
+        # Buffer de logs: se vuelca a la tabla en bloque cada _LOG_FLUSH_MS
+        self._log_buffer: list[tuple] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(_LOG_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_logs)
+        # Última hora formateada (la tabla solo muestra resolución de segundos)
+        self._last_sec = -1
+        self._last_str = ""
+
         # Mensaje inicial
         self._add_log("ok", "Esperando acción del usuario…")
 
@@ -233,10 +274,9 @@ class VideoProcessorWindow(QWidget):
 
         footer_row = QHBoxLayout()
         logo_lbl = QLabel()
-        logo_path = resource_path("../resources/icons/logo_humboldt.png")
-        if os.path.exists(logo_path):
-            pix = QPixmap(logo_path)
-            logo_lbl.setPixmap(pix.scaledToHeight(28, Qt.SmoothTransformation))
+        logo_pix = self._footer_logo()
+        if logo_pix is not None:
+            logo_lbl.setPixmap(logo_pix)
         logo_lbl.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         footer_row.addWidget(logo_lbl)
 
@@ -271,10 +311,29 @@ class VideoProcessorWindow(QWidget):
     # MÉTODOS AUXILIARES DE INTERFAZ
     # ==========================================================================
     
+    @classmethod
+    def _footer_logo(cls):
+        """
+        Devuelve el logo del pie escalado a 28 px de alto, o None si no existe.
+        
+        A ese tamaño FastTransformation no se distingue del filtrado bilineal;
+        el resultado se guarda en la clase para reutilizarlo al reabrir la ventana.
+        """
+        if cls._LOGO_PIX is None:
+            logo_path = resource_path("../resources/icons/logo_humboldt.png")
+            if not os.path.exists(logo_path):
+                return None
+            cls._LOGO_PIX = QPixmap(logo_path).scaledToHeight(28, Qt.FastTransformation)
+        return cls._LOGO_PIX
+
     def _add_log(self, level: str, message: str):
         """
         Añade una entrada a la tabla de logs con formato y color según el nivel.
         
+        La entrada se acumula en un buffer y se inserta en la tabla en el
+        siguiente volcado (_flush_logs), de modo que ráfagas de mensajes
+        provocan un único re-layout.
+        
         Args:
             level: Nivel del mensaje ("info", "warn", "ok", "error")
             message: Texto del mensaje a mostrar
@@ -285,27 +344,44 @@ class VideoProcessorWindow(QWidget):
             - ok: Verde (#2ca02c) - Éxito
             - error: Rojo (#d62728) - Errores
         """
-        colors = {
-            "info": QColor("#1f77b4"),  # azul
-            "warn": QColor("#e6a700"),  # amarillo
-            "ok":   QColor("#2ca02c"),  # verde
-            "error":QColor("#d62728"),  # rojo
-        }
-        from datetime import datetime
-        row = self.log_table.rowCount()
-        self.log_table.insertRow(row)
-
-        titem = QTableWidgetItem(datetime.now().strftime("%H:%M:%S"))
-        litem = QTableWidgetItem(level.upper())
-        mitem = QTableWidgetItem(message)
-
-        col = colors.get(level, QColor("#1f77b4"))
-        litem.setForeground(col); mitem.setForeground(col)
-
-        self.log_table.setItem(row, 0, titem)
-        self.log_table.setItem(row, 1, litem)
-        self.log_table.setItem(row, 2, mitem)
-        self.log_table.scrollToBottom()
+        sec = int(time.time())
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_str = datetime.fromtimestamp(sec).strftime("%H:%M:%S")
+        self._log_buffer.append((self._last_str, level, message))
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_logs(self):
+        """
+        Vuelca en la tabla todas las entradas pendientes del buffer de logs.
+        
+        Reserva todas las filas de una vez y desactiva el repintado mientras
+        se rellenan, para hacer un solo re-layout y un solo scroll por volcado.
+        """
+        buf = self._log_buffer
+        if not buf:
+            return
+        self._log_buffer = []
+
+        table = self.log_table
+        table.setUpdatesEnabled(False)
+        try:
+            base = table.rowCount()
+            table.setRowCount(base + len(buf))
+            default = _LOG_COLORS["info"]
+            for row, (hhmmss, level, message) in enumerate(buf, base):
+                col = _LOG_COLORS.get(level, default)
+                litem = QTableWidgetItem(level.upper())
+                mitem = QTableWidgetItem(message)
+                litem.setForeground(col); mitem.setForeground(col)
+
+                table.setItem(row, 0, QTableWidgetItem(hhmmss))
+                table.setItem(row, 1, litem)
+                table.setItem(row, 2, mitem)
+        finally:
+            table.setUpdatesEnabled(True)
+        table.scrollToBottom()
 
     def _log_from_backend(self, text: str):
         """
@@ -321,17 +397,28 @@ class VideoProcessorWindow(QWidget):
             text: Mensaje del backend (puede incluir emoji como prefijo)
         """
         msg = (text or "").strip()
-        lvl = "info"
-        if msg.startswith("✅"):
-            lvl = "ok";   msg = msg.lstrip("✅ ").strip()
-        elif msg.startswith("⚠️"):
-            lvl = "warn"; msg = msg.lstrip("⚠️ ").strip()
-        elif msg.startswith("❌"):
-            lvl = "error";msg = msg.lstrip("❌ ").strip()
-        elif msg.startswith("🔵"):
-            lvl = "info"; msg = msg.lstrip("🔵 ").strip()
+        lvl = _LVL_BY_EMOJI.get(msg[:1])
+        if lvl is None:
+            lvl = "info"
+        else:
+            # Quita solo el prefijo (emoji, selector de variación y espacios)
+            msg = msg[1:].lstrip("\ufe0f ")
         self._add_log(lvl, msg)
 
+    def _drain_backend_logs(self):
+        """
+        Vacía los mensajes acumulados por el Worker y los registra en orden.
+        
+        El Worker solo avisa cuando su buffer pasa de vacío a no vacío, así que
+        cada aviso puede traer varios mensajes: una ráfaga de logs cuesta un
+        único evento entre hilos en lugar de uno por línea.
+        """
+        worker = self.sender()
+        if worker is None:
+            return
+        for text in worker.take_status():
+            self._log_from_backend(text)
+
     def reset_ui(self):
         """
         Reinicia la interfaz al estado inicial (sin proyecto seleccionado).
@@ -348,6 +435,7 @@ class VideoProcessorWindow(QWidget):
         """
         self.input_path = None
         self.output_path = None
+        self._log_buffer.clear()
         self.log_table.setRowCount(0)
         self._add_log("ok", "Esperando acción del usuario…")
 
@@ -381,28 +469,54 @@ class VideoProcessorWindow(QWidget):
     # MÉTODOS DE ACCIÓN DEL USUARIO
     # ==========================================================================
     
-    def _scan_videos(self, base: Path):
+    def _scan_videos(self, base: Path, want_lists: bool = True):
         """
         Escanea recursivamente la carpeta seleccionada buscando archivos de video.
         
+        Recorre el árbol en una sola pasada con os.scandir y solo conserva los
+        archivos de video; el resto de entradas no se materializa en memoria.
+        
         Clasifica los archivos en:
             - Soportados: .MP4, .MOV, .AVI (pueden procesarse)
             - No soportados: Otros formatos de video comunes (feedback al usuario)
         
         Args:
             base: Carpeta raíz donde buscar videos
+            want_lists: Si es False, se detiene en el primer video soportado
+                (basta para saber si se puede procesar la carpeta)
         
         Returns:
-            tuple: (videos_válidos, videos_no_soportados, todos_los_archivos)
+            tuple: (videos_válidos, videos_no_soportados, hay_entradas)
         """
-        valid_exts = {".mp4", ".mov", ".avi"}
-        common_video_exts = {".mov", ".mkv", ".wmv", ".flv", ".mpg", ".mpeg", ".m4v",
-                             ".3gp", ".webm", ".ts", ".vob", ".asf", ".avi", ".mp4"}
-        all_files = list(base.rglob("*"))
-        vids_ok   = [p for p in all_files if p.suffix.lower() in valid_exts]
-        vids_skip = [p for p in all_files if p.suffix.lower() in common_video_exts
-                     and p.suffix.lower() not in valid_exts]
-        return vids_ok, vids_skip, all_files
+        vids_ok, vids_skip = [], []
+        has_entries = False
+        stack = [str(base)]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    has_entries = True
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                    except OSError:
+                        continue
+                    name = entry.name
+                    dot = name.rfind(".")
+                    if dot < 0:
+                        continue
+                    ext = name[dot:].lower()
+                    if ext in _VALID_EXTS:
+                        vids_ok.append(Path(entry.path))
+                        if not want_lists:
+                            return vids_ok, vids_skip, has_entries
+                    elif ext in _COMMON_VIDEO_EXTS:
+                        vids_skip.append(Path(entry.path))
+        return vids_ok, vids_skip, has_entries
 
     def select_folder(self):
         """
@@ -432,8 +546,8 @@ class VideoProcessorWindow(QWidget):
         self.output_path = self.input_path.parent / f"Img2WI_{self.input_path.name}_{ts}"
 
         # Validaciones tempranas
-        vids_ok, vids_skip, all_files = self._scan_videos(self.input_path)
-        if not all_files:
+        vids_ok, vids_skip, has_entries = self._scan_videos(self.input_path, want_lists=False)
+        if not has_entries:
             QMessageBox.information(self, "Carpeta vacía", "La carpeta seleccionada está vacía.")
             self._add_log("warn", "Carpeta vacía.")
             self.btn_start.setEnabled(False)
@@ -472,7 +586,7 @@ class VideoProcessorWindow(QWidget):
             7. Inicia el hilo de procesamiento
         
         Señales conectadas:
-            - worker.status -> Actualización de logs
+            - worker.status_ready -> Actualización de logs (por lotes)
             - worker.progress -> Actualización de barra de progreso
             - worker.finished -> Finalización y limpieza
         """
@@ -505,7 +619,7 @@ class VideoProcessorWindow(QWidget):
 
         # Conexiones
         self.thread.started.connect(self.worker.run)
-        self.worker.status.connect(self._log_from_backend)
+        self.worker.status_ready.connect(self._drain_backend_logs)
         self.worker.progress.connect(self.progress.setValue)
         self.worker.finished.connect(self.finish_processing)
         self.worker.finished.connect(self.thread.quit)
@@ -553,6 +667,21 @@ class VideoProcessorWindow(QWidget):
 # WORKER PARA PROCESAMIENTO ASÍNCRONO
 # ==============================================================================
 
+# process_videos se resuelve la primera vez que se usa (app.processor importa
+# wiutils, que es pesado, y no debe retrasar la apertura de la ventana) y
+# queda enlazado aquí para las corridas siguientes.
+_process_videos = None
+
+
+def _get_processor():
+    """Devuelve app.processor.process_videos, importándolo solo la primera vez."""
+    global _process_videos
+    if _process_videos is None:
+        from app.processor import process_videos
+        _process_videos = process_videos
+    return _process_videos
+
+
 class Worker(QObject):
     """
     Worker que ejecuta el procesamiento de videos en un hilo separado.
@@ -562,7 +691,8 @@ class Worker(QObject):
     
     Señales:
         finished: Se emite al terminar con (total_videos, total_imagenes)
-        status: Se emite para cada mensaje de log del backend
+        status_ready: Avisa que hay mensajes del backend pendientes; se emite
+            solo cuando el buffer pasa de vacío a no vacío (ver take_status)
         progress: Se emite para actualizar la barra de progreso (0-100)
     
     Atributos:
@@ -571,7 +701,7 @@ class Worker(QObject):
         offset: Segundos entre imágenes (configurado por el usuario)
     """
     finished = pyqtSignal(int, int)   # total_videos, total_imagenes
-    status   = pyqtSignal(str)        # logs del backend
+    status_ready = pyqtSignal()       # hay logs del backend en el buffer
     progress = pyqtSignal(int)        # 0..100
 
     def __init__(self, input_path: Path, output_path: Path, offset):
@@ -579,49 +709,47 @@ class Worker(QObject):
         self.input_path = input_path
         self.output_path = output_path
         self.offset = offset
+        # Mensajes pendientes de leer por la UI (compartidos entre hilos)
+        self._pending: list[str] = []
+        self._pending_lock = threading.Lock()
 
     def _status_cb(self, msg: str):
-        """Callback para emitir mensajes de estado al hilo principal."""
-        self.status.emit(msg)
+        """Callback que acumula mensajes de estado para el hilo principal."""
+        with self._pending_lock:
+            wake = not self._pending
+            self._pending.append(msg)
+        if wake:
+            self.status_ready.emit()
+
+    def take_status(self) -> tuple:
+        """Entrega y vacía los mensajes pendientes (llamado desde la UI)."""
+        with self._pending_lock:
+            batch, self._pending = tuple(self._pending), []
+        return batch
 
     def _progress_cb(self, val: int):
         """Callback para emitir progreso (0-100) al hilo principal."""
         self.progress.emit(int(val))
 
-    def _count_images(self, root: Path) -> int:
-        """
-        Cuenta el total de imágenes generadas en la carpeta de salida.
-        
-        Args:
-            root: Carpeta raíz donde buscar imágenes
-        
-        Returns:
-            int: Número total de archivos .jpg, .jpeg y .png encontrados
-        """
-        exts = {".jpg", ".jpeg", ".png"}
-        return sum(1 for p in root.glob("**/*") if p.is_file() and p.suffix.lower() in exts)
-
     def run(self):
         """
         Método principal ejecutado en el hilo separado.
         
         Proceso:
-            1. Importa el módulo processor (evita importación circular)
+            1. Obtiene process_videos (importado una sola vez, ver _get_processor)
             2. Llama a process_videos con callbacks para comunicación
-            3. Cuenta imágenes generadas
-            4. Emite señal finished con resultados
+            3. Emite señal finished con resultados (process_videos ya
+               entrega el total de imágenes de la salida)
         
         Este método se ejecuta automáticamente cuando el QThread arranca.
         """
-        from app.processor import process_videos
-        total, _ = process_videos(
+        total, _, total_images = _get_processor()(
             self.input_path,
             self.output_path,
             update_status=self._status_cb,
             update_progress=self._progress_cb,
             offset=self.offset
         )
-        total_images = self._count_images(self.output_path)
         self.finished.emit(total, total_images)
 
 
@@ -29,8 +29,16 @@ Licencia: Ver LICENSE
 
 import sys
 import os
+import io
+import re
+import struct
+import threading
+import time
 import zipfile
 import json
+import hashlib
+import mmap
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -38,64 +46,104 @@ from datetime import datetime
 import pytz
 from PyQt5 import QtWidgets, uic, QtCore
 from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal
-from PyQt5.QtGui import QIcon, QPixmap
+from PyQt5.QtGui import QBrush, QGuiApplication, QIcon, QStandardItem, QStandardItemModel
 from PyQt5.QtWidgets import (
-    QFileDialog, QMessageBox, QTabWidget, QTableWidget, QTableWidgetItem,
-    QLabel, QWidget, QHBoxLayout, QVBoxLayout, QGroupBox, QFrame,
-    QDialog, QDialogButtonBox, QTextEdit, QPushButton
+    QFileDialog, QMessageBox, QTabWidget, QTableView, QAbstractItemView,
+    QLabel, QWidget, QVBoxLayout, QGroupBox, QFrame,
+    QDialog, QDialogButtonBox, QTextEdit
 )
 
 # Módulo de procesamiento Camtrap-DP
 from camtrapdp.processor import process_zip as _proc_zip
 
+# Recursos Qt compilados (resources.qrc → resources_rc.py, lo genera
+# camtrapdp.spec); desde el código fuente se leen los archivos de assets/
+try:
+    import resources_rc  # noqa: F401  (registra las rutas ":/...")
+    _HAS_QRC = True
+except ImportError:
+    _HAS_QRC = False
+
+
+# ============================================================================
+# CONFIGURACIÓN HIDPI PARA PANTALLAS DE ALTA RESOLUCIÓN
+# ============================================================================
+# Qt solo respeta estos atributos si se fijan antes de crear la QApplication;
+# por eso se aplican al importar, y no dentro de main().
+if QtWidgets.QApplication.instance() is None:
+    os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
+    os.environ["QT_ENABLE_HIGHDPI_SCALING"]   = "1"
+    if hasattr(Qt, "AA_EnableHighDpiScaling"):      # Qt >= 5.6
+        QtWidgets.QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    if hasattr(Qt, "AA_UseHighDpiPixmaps"):
+        QtWidgets.QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    if hasattr(QGuiApplication, "setHighDpiScaleFactorRoundingPolicy"):  # Qt >= 5.14
+        QGuiApplication.setHighDpiScaleFactorRoundingPolicy(
+            Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+        )
+
 
 # ============================================================================
-# WIDGETS PERSONALIZADOS
+# MODELOS PERSONALIZADOS
 # ============================================================================
 
-class AspectLabel(QLabel):
+# Presentación de cada nivel de log: (texto "emoji NIVEL", color de la columna
+# Nivel o None); se construye una vez y append_log solo hace una búsqueda
+_LEVEL_TBL = {
+    "ERROR": ("🔴 ERROR", QBrush(Qt.red)),
+    "WARN":  ("🟡 WARN",  QBrush(Qt.darkYellow)),
+    "OK":    ("🟢 OK",    QBrush(Qt.darkGreen)),
+    "INFO":  ("🔵 INFO",  None),
+}
+
+
+class LogTableModel(QtCore.QAbstractTableModel):
     """
-    QLabel personalizado que reescala imágenes manteniendo la proporción de aspecto.
-    
-    Permite controlar el modo de ajuste (altura, ancho o ambos) y reescala
-    automáticamente el QPixmap cuando cambia el tamaño del widget.
+    Modelo de la tabla de seguimiento (Hora | Nivel | Mensaje).
     
-    Args:
-        parent: Widget padre (opcional)
-        fit: Modo de ajuste - "height", "width" o "both"
+    Las filas se guardan como tuplas en una lista y se sirven por índice,
+    sin crear un QTableWidgetItem por celda.
     """
     
-    def __init__(self, parent=None, fit="height"):
+    _HEADERS = ("Hora", "Nivel", "Mensaje")
+    
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self._orig = None  # QPixmap original sin escalar
-        self._fit = fit    # Modo de ajuste: "height" | "width" | "both"
-        self.setAlignment(Qt.AlignCenter)
+        self._rows = []  # (hora, "emoji NIVEL", mensaje, QBrush | None)
+    
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else 3
     
-    def setPixmap(self, pm: QPixmap):
-        """Almacena el pixmap original y lo reescala según el tamaño actual."""
-        self._orig = pm
-        self._rescale()
+    def data(self, index, role=Qt.DisplayRole):
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ForegroundRole and index.column() == 1:
+            return self._rows[index.row()][3]
+        return None
     
-    def resizeEvent(self, e):
-        """Reescala la imagen cuando el widget cambia de tamaño."""
-        super().resizeEvent(e)
-        self._rescale()
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._HEADERS[section]
+        return None
     
-    def _rescale(self):
-        """Reescala el pixmap original según el modo de ajuste configurado."""
-        if not isinstance(self._orig, QPixmap) or self._orig.isNull():
-            super().setPixmap(QPixmap())
+    def append_rows(self, rows):
+        """Agrega al final un lote de filas (hora, "emoji NIVEL", color, mensaje)."""
+        if not rows:
             return
-        
-        # Reescalar según el modo configurado
-        if self._fit == "height":
-            pm2 = self._orig.scaledToHeight(max(1, self.height()), Qt.SmoothTransformation)
-        elif self._fit == "width":
-            pm2 = self._orig.scaledToWidth(max(1, self.width()), Qt.SmoothTransformation)
-        else:  # "both"
-            pm2 = self._orig.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        
-        super().setPixmap(pm2)
+        n = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), n, n + len(rows) - 1)
+        self._rows.extend((ts, label, message, brush)
+                          for ts, label, brush, message in rows)
+        self.endInsertRows()
+    
+    def clear(self):
+        """Elimina todas las filas."""
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
 
 
 # ============================================================================
@@ -119,7 +167,7 @@ def _resolve_pipeline():
                   - msg (str): Mensaje de resultado o error
     """
 
-    def _check_artifacts(work_dir: Path):
+    def _check_artifacts(work_dir: str):
         """
         Verifica la existencia de artefactos generados por el procesamiento.
         
@@ -127,20 +175,32 @@ def _resolve_pipeline():
         uno de los archivos CSV con contenido (tamaño > 0).
         
         Args:
-            work_dir: Directorio de trabajo del procesamiento
+            work_dir: Directorio de trabajo del procesamiento (str o Path)
             
         Returns:
             tuple: (ok, out, dp, csvs) donde:
                    - ok (bool): True si los artefactos esenciales existen
-                   - out (Path): Ruta del directorio output
-                   - dp (Path): Ruta del datapackage.json
-                   - csvs (list[Path]): Lista de rutas de archivos CSV esperados
+                   - out (str): Ruta del directorio output
+                   - dp (str): Ruta del datapackage.json
+                   - csvs (list[str]): Lista de rutas de archivos CSV esperados
         """
-        out = Path(work_dir) / "output"
-        dp  = out / "datapackage.json"
-        csvs = [out / "deployments.csv", out / "media.csv", out / "observations.csv"]
-        ok = out.exists() and dp.exists() and any(p.exists() and p.stat().st_size > 0 for p in csvs)
-        return ok, out, dp, csvs
+        join = os.path.join
+        out = join(work_dir, "output")
+        dp  = join(out, "datapackage.json")
+        csvs = [join(out, "deployments.csv"), join(out, "media.csv"), join(out, "observations.csv")]
+        # Un solo os.stat por archivo (existencia y tamaño a la vez); si existe
+        # datapackage.json también existe output, y basta con el primer CSV no vacío
+        try:
+            os.stat(dp)
+        except OSError:
+            return False, out, dp, csvs
+        for p in csvs:
+            try:
+                if os.stat(p).st_size > 0:
+                    return True, out, dp, csvs
+            except OSError:
+                continue
+        return False, out, dp, csvs
 
     try:
         # ===== INTENTO 1: API NUEVA (process_zip) =====
@@ -162,24 +222,11 @@ def _resolve_pipeline():
                 tuple: (ok, work_dir, message)
             """
             try:
-                # Wrapper robusto que garantiza siempre emitir (porcentaje, mensaje)
-                def _safe_progress(*a, **k):
+                # Adapta la firma del procesador a (porcentaje, mensaje); la
+                # normalización de tipos y la protección las hace el Worker
+                def _safe_progress(pct=-1, msg=None, *_, **k):
                     """Normaliza llamadas de progreso a formato (pct, msg)."""
-                    try:
-                        pct = int(a[0]) if len(a) >= 1 else -1
-                    except Exception:
-                        pct = -1
-                    
-                    msg = ""
-                    if len(a) >= 2 and a[1] is not None:
-                        msg = str(a[1])
-                    elif "message" in k:
-                        msg = str(k.get("message") or "")
-                    
-                    try:
-                        progress_cb(pct, msg)
-                    except Exception:
-                        pass
+                    progress_cb(pct, k.get("message") if msg is None else msg)
 
                 # Ejecutar el procesamiento con la API nueva
                 work = _proc_zip(
@@ -193,15 +240,15 @@ def _resolve_pipeline():
                 )
 
                 # Verificar que se generaron los artefactos esperados
-                work_dir = Path(str(work))
+                work_dir = os.fspath(work)
                 ok, _, _, _ = _check_artifacts(work_dir)
                 if not ok:
-                    return False, str(work_dir), (
+                    return False, work_dir, (
                         "No se generaron artefactos (datapackage/CSV). Revisa permisos, "
                         "espacio en disco o mensajes previos."
                     )
 
-                return True, str(work_dir), "Proceso completado."
+                return True, work_dir, "Proceso completado."
             except Exception as e:
                 return False, "", f"{e}"
 
@@ -236,27 +283,13 @@ def _resolve_pipeline():
                 tuple: (ok, work_dir, message)
             """
             try:
-                # Adaptadores para los callbacks de la API antigua
+                # Adaptadores para los callbacks de la API antigua; la
+                # normalización de valores la hace el propio Worker
                 def _p(v):
                     """Callback de progreso simplificado."""
-                    try:
-                        progress_cb(int(v), "")
-                    except Exception:
-                        pass
-                
-                def _s(msg):
-                    """Callback de estado/log."""
-                    try:
-                        log_cb(msg)
-                    except Exception:
-                        pass
+                    progress_cb(v, "")
                 
-                def _l(msg):
-                    """Callback adicional de log."""
-                    try:
-                        log_cb(msg)
-                    except Exception:
-                        pass
+                _s = _l = log_cb  # estado y log van al mismo destino
 
                 # Construir objeto de opciones para la API antigua
                 opts = _Options(
@@ -269,23 +302,27 @@ def _resolve_pipeline():
                 )
 
                 # Ejecutar procesamiento con la API antigua
-                res = _proc_old(str(zip_path), str(out_dir), opts,
+                zip_path, out_dir = os.fspath(zip_path), os.fspath(out_dir)
+                res = _proc_old(zip_path, out_dir, opts,
                                 progress_cb=_p, status_cb=_s, log_cb=_l)
 
                 # La API antigua devuelve un diccionario con 'work_dir'
                 # Si no existe, inferir la ruta estándar
-                guess_dir = Path(out_dir) / f"WI2CamtrapDP_{Path(zip_path).stem}"
-                work_dir = Path(res.get("work_dir", str(guess_dir)))
+                work_dir = res.get("work_dir")
+                if work_dir is None:
+                    stem = os.path.splitext(os.path.basename(zip_path))[0]
+                    work_dir = os.path.join(out_dir, f"WI2CamtrapDP_{stem}")
+                work_dir = os.fspath(work_dir)
 
                 # Verificar que se generaron los artefactos esperados
                 ok, _, _, _ = _check_artifacts(work_dir)
                 if not ok:
-                    return False, str(work_dir), (
+                    return False, work_dir, (
                         "No se generaron artefactos (datapackage/CSV). Revisa permisos, "
                         "espacio en disco o mensajes previos."
                     )
 
-                return True, str(work_dir), "Proceso completado."
+                return True, work_dir, "Proceso completado."
             except Exception as e:
                 return False, "", f"{e}"
 
@@ -298,6 +335,24 @@ RUN_PIPELINE = _resolve_pipeline()
 # ============================================================================
 # WORKER: PROCESAMIENTO EN HILO SEPARADO
 # ============================================================================
+
+def _safe_call(fn, *args) -> bool:
+    """Ejecuta fn(*args) ignorando cualquier excepción; indica si tuvo éxito."""
+    try:
+        fn(*args)
+        return True
+    except Exception:
+        return False
+
+
+def _as_pct(value) -> int:
+    """Convierte a porcentaje entero un valor no int (-1 si no es numérico)."""
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return -1
+
+
 class Worker(QObject):
     """
     Worker para ejecutar el pipeline de procesamiento en un hilo separado.
@@ -306,36 +361,80 @@ class Worker(QObject):
     Emite señales para reportar progreso y resultado final.
     
     Signals:
-        progress (int, str): Emitido durante el procesamiento con (porcentaje, mensaje)
-                             El porcentaje puede ser -1 para indicar progreso indeterminado
+        progress_ready: Avisa que hay eventos (porcentaje, mensaje) pendientes;
+                        se emite solo cuando el buffer pasa de vacío a no vacío
+                        y la UI los recoge con take_progress(). El porcentaje
+                        puede ser -1 para indicar progreso indeterminado
         finished (bool, str, str): Emitido al terminar con (ok, work_dir, mensaje)
                                    - ok: True si fue exitoso
                                    - work_dir: Directorio de trabajo generado
                                    - mensaje: Descripción del resultado o error
     
     Attributes:
-        zip_path (Path): Ruta del archivo ZIP a procesar
-        out_dir (Path): Directorio de salida
+        zip_path (str): Ruta del archivo ZIP a procesar
+        out_dir (str): Directorio de salida
         options (dict): Opciones de procesamiento
+    
+    Las rutas se guardan como str: el procesador las convierte a Path por
+    su cuenta, así que no se construyen objetos Path en esta capa.
     """
     
     # Señales Qt
-    progress = pyqtSignal(int, str)        # (porcentaje, mensaje)
+    progress_ready = pyqtSignal()          # hay eventos (porcentaje, mensaje) en el buffer
     finished = pyqtSignal(bool, str, str)  # (ok, work_dir, mensaje)
     
-    def __init__(self, zip_path: Path, out_dir: Path, options: dict):
+    def __init__(self, zip_path, out_dir, options: dict):
         super().__init__()
-        self.zip_path = Path(zip_path)
-        self.out_dir = Path(out_dir)
+        self.zip_path = os.fspath(zip_path)
+        self.out_dir = os.fspath(out_dir)
         self.options = options
+        # Eventos pendientes de leer por la UI (compartidos entre hilos)
+        self._pending: list[tuple] = []
+        self._pending_lock = threading.Lock()
+        self._last_pct = -2
+    
+    def _push(self, pct: int, msg: str):
+        """
+        Encola un evento y avisa a la UI solo si el buffer estaba vacío.
+        
+        Es la única frontera protegida entre el procesador y Qt: un fallo al
+        emitir (p. ej. la ventana ya se cerró) no interrumpe el procesamiento.
+        """
+        with self._pending_lock:
+            wake = not self._pending
+            if not msg and not wake and not self._pending[-1][1]:
+                # Dos avances seguidos sin mensaje: basta con el último
+                self._pending[-1] = (pct, msg)
+            else:
+                self._pending.append((pct, msg))
+        if wake:
+            _safe_call(self.progress_ready.emit)
+    
+    def take_progress(self) -> tuple:
+        """Entrega y vacía los eventos pendientes (llamado desde la UI)."""
+        with self._pending_lock:
+            batch, self._pending = tuple(self._pending), []
+        return batch
     
     def _log(self, msg: str):
-        """Emite un mensaje de log sin porcentaje de progreso."""
-        self.progress.emit(-1, str(msg))
+        """Encola un mensaje de log sin porcentaje de progreso."""
+        self._push(-1, msg if type(msg) is str else str(msg))
     
     def _progress(self, pct: int, msg: str = ""):
-        """Emite una actualización de progreso con porcentaje."""
-        self.progress.emit(int(pct), str(msg))
+        """
+        Encola una actualización de progreso; se omite si no cambia nada.
+        
+        Es el único punto que normaliza los valores del procesador: un
+        porcentaje no numérico se reporta como indeterminado (-1).
+        """
+        if type(pct) is not int:
+            pct = _as_pct(pct)
+        if type(msg) is not str:
+            msg = "" if msg is None else str(msg)
+        if pct == self._last_pct and not msg:
+            return
+        self._last_pct = pct
+        self._push(pct, msg)
     
     def run(self):
         """
@@ -351,10 +450,45 @@ class Worker(QObject):
         self.finished.emit(ok, work_dir, err_or_ok)
 
 
+class ZipInspector(QtCore.QRunnable):
+    """
+    Revisa el ZIP antes de procesar (¿exportación de iniciativa?) en el
+    QThreadPool global, para que la lectura del directorio central de un ZIP
+    de varios GB no congele la interfaz.
+    
+    Signals (en self.signals):
+        detected (int): Número de archivos images_*.csv encontrados
+        failed (str): Mensaje de error si el ZIP no se pudo inspeccionar
+    """
+    
+    class _Signals(QObject):
+        detected = pyqtSignal(int)
+        failed = pyqtSignal(str)
+    
+    def __init__(self, zip_path):
+        super().__init__()
+        self.zip_path = os.fspath(zip_path)
+        # Creado en el hilo de la UI: las señales llegan encoladas a ese hilo
+        self.signals = ZipInspector._Signals()
+    
+    def run(self):
+        try:
+            n = _detect_initiative_zip(Path(self.zip_path))
+        except Exception as e:
+            _safe_call(self.signals.failed.emit, str(e))
+            return
+        _safe_call(self.signals.detected.emit, n)
+
+
 # ============================================================================
 # FUNCIONES UTILITARIAS
 # ============================================================================
 
+# Base de recursos: carpeta de PyInstaller (_MEIPASS) o la del código fuente.
+# Es invariante durante la ejecución, así que se resuelve una sola vez.
+_RESOURCE_BASE = Path(getattr(sys, "_MEIPASS", None) or Path(__file__).resolve().parent)
+
+
 def resource_path(*parts) -> Path:
     """
     Resuelve la ruta de recursos empaquetados (PyInstaller) o del código fuente.
@@ -371,18 +505,166 @@ def resource_path(*parts) -> Path:
     Example:
         >>> icon = resource_path("assets", "app_icon.png")
     """
-    base = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent))
-    return base.joinpath(*parts)
+    return _RESOURCE_BASE.joinpath(*parts)
+
+
+# Caché de la interfaz compilada para ejecuciones desde el código fuente
+_UI_CACHE_DIR = Path.home() / ".cache" / "WI2CamtrapDP"
+
+
+def _compiled_ui_source(ui_file: Path) -> str:
+    """
+    Retorna el código Python generado por uic para un archivo .ui.
+    
+    El resultado se guarda en ~/.cache/WI2CamtrapDP/ui_<hash>.py, con el hash
+    del contenido del .ui como clave; los arranques siguientes solo leen ese
+    archivo. Si la caché no se puede escribir, se compila en memoria.
+    
+    Args:
+        ui_file: Ruta al archivo .ui de Qt Designer
+        
+    Returns:
+        str: Código fuente de la clase Ui_* generada
+    """
+    key = hashlib.blake2b(ui_file.read_bytes(), digest_size=16).hexdigest()
+    cache = _UI_CACHE_DIR / f"ui_{key}.py"
+    try:
+        return cache.read_text(encoding="utf-8")
+    except OSError:
+        pass
+
+    buf = io.StringIO()
+    uic.compileUi(str(ui_file), buf)
+    src = buf.getvalue()
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(src, encoding="utf-8")
+        os.replace(tmp, cache)
+    except OSError:
+        pass
+    return src
+
+
+def _load_main_widget() -> QWidget:
+    """
+    Construye la ventana principal a partir del diseño de Qt Designer.
+    
+    Usa el módulo ui_camtrapdp.py generado con pyuic5 (lo produce
+    camtrapdp.spec al compilar), evitando leer y compilar el XML en cada
+    arranque. Desde el código fuente, si el módulo no existe o es más antiguo
+    que camtrapdp.ui, se usa la compilación en caché de _compiled_ui_source.
+    
+    Returns:
+        QWidget: Ventana con los widgets del .ui accesibles como atributos
+    """
+    ui_file = resource_path("ui", "camtrapdp.ui")
+    try:
+        import ui_camtrapdp
+    except ImportError:
+        ui_camtrapdp = None
+
+    if ui_camtrapdp is not None and (
+        getattr(sys, "frozen", False)
+        or not ui_file.exists()
+        or os.path.getmtime(ui_camtrapdp.__file__) >= ui_file.stat().st_mtime
+    ):
+        ui_class = ui_camtrapdp.Ui_CamtrapDPTab
+    else:
+        ns = {}
+        exec(compile(_compiled_ui_source(ui_file), str(ui_file), "exec"), ns)
+        ui_class = ns["Ui_CamtrapDPTab"]
+
+    w = QWidget()
+    ui = ui_class()
+    ui.setupUi(w)
+    # Igual que loadUi: los widgets quedan como atributos de la ventana
+    for name, obj in vars(ui).items():
+        setattr(w, name, obj)
+    return w
+
+
+def _asset(name: str):
+    """
+    Localiza un archivo de assets/, preferentemente dentro de los recursos Qt.
+    
+    Con resources_rc cargado la búsqueda ocurre en memoria (":/assets/..."),
+    sin tocar el disco; en caso contrario se usa resource_path().
+    
+    Args:
+        name: Nombre del archivo dentro de assets/ (ej: "logo_humboldt.png")
+        
+    Returns:
+        str | None: Ruta utilizable por QIcon/QPixmap, o None si no existe
+    """
+    if _HAS_QRC:
+        qpath = f":/assets/{name}"
+        if QtCore.QFile.exists(qpath):
+            return qpath
+    path = resource_path("assets", name)
+    return str(path) if path.exists() else None
+
+
+# Mensajes de resultado de validación del pipeline ("Validación: OK", ...);
+# buscan sobre el mensaje original, sin copias en minúsculas ni sin tildes
+_VALIDATION_RE = re.compile(r"validaci[oó]n:", re.I)
+_VALIDATION_OK_RE = re.compile(r" ok", re.I)
+
+# Intervalo mínimo entre actualizaciones de la barra de progreso (s)
+_BAR_MIN_INTERVAL_S = 0.016
+
+# Hoja de estilo de la barra de progreso; la regla aplicada depende de la
+# propiedad dinámica "state" ("" | "ok" | "error"), así se instala una vez
+_PROGRESS_QSS = """
+    QProgressBar[state="error"] {
+        border: 2px solid #c0392b;
+        border-radius: 5px;
+        text-align: center;
+        background-color: #fadbd8;
+    }
+    QProgressBar[state="error"]::chunk {
+        background-color: #e74c3c;
+        width: 1px;
+    }
+    QProgressBar[state="ok"] {
+        border: 2px solid #27ae60;
+        border-radius: 5px;
+        text-align: center;
+        background-color: #d5f4e6;
+    }
+    QProgressBar[state="ok"]::chunk {
+        background-color: #2ecc71;
+        width: 1px;
+    }
+"""
+
+# Intervalo de volcado de la cola de mensajes a la tabla/consola (ms)
+_LOG_FLUSH_MS = 50
+
+
+# Último segundo formateado por _now(): [segundo_epoch, "HH:MM:SS"]
+_NOW_CACHE = [-1, ""]
 
 
 def _now() -> str:
     """
     Retorna la hora actual en formato HH:MM:SS.
     
+    Los mensajes llegan en ráfagas: el texto solo se vuelve a formatear
+    cuando cambia el segundo.
+    
     Returns:
         str: Hora actual formateada (ej: "14:35:22")
     """
-    return datetime.now().strftime("%H:%M:%S")
+    sec = int(time.time())
+    if sec != _NOW_CACHE[0]:
+        _NOW_CACHE[0] = sec
+        _NOW_CACHE[1] = time.strftime("%H:%M:%S", time.localtime(sec))
+    return _NOW_CACHE[1]
+
+
+# pytz.timezone memoizado: cada zona se carga una sola vez por proceso
+_tz = lru_cache(maxsize=None)(pytz.timezone)
 
 
 def _tz_items_with_gmt(ids):
@@ -402,11 +684,18 @@ def _tz_items_with_gmt(ids):
         >>> _tz_items_with_gmt(["America/Bogota"])
         [("(GMT-05:00) America/Bogota", "America/Bogota")]
     """
+    return list(_tz_items_cached(tuple(ids)))
+
+
+@lru_cache(maxsize=4)
+def _tz_items_cached(ids: tuple) -> tuple:
+    """Calcula los ítems de _tz_items_with_gmt; la lista de IDs es estática."""
+    # Un único "ahora" en UTC para todas las zonas
+    now_utc = datetime.now(pytz.UTC)
     items = []
     for tzid in ids:
         try:
-            tz = pytz.timezone(tzid)
-            offset = datetime.now(tz).utcoffset()
+            offset = now_utc.astimezone(_tz(tzid)).utcoffset()
             total_min = 0 if offset is None else int(offset.total_seconds() // 60)
             sign = "-" if total_min < 0 else "+"
             hh, mm = divmod(abs(total_min), 60)
@@ -414,20 +703,63 @@ def _tz_items_with_gmt(ids):
         except Exception:
             # Si falla el parsing, agregar sin formato
             items.append((tzid, tzid))
-    return items
+    return tuple(items)
 
 
-def _emoji_for(level: str) -> str:
+def _frictionless_version():
     """
-    Retorna el emoji correspondiente a un nivel de log.
+    Retorna la versión instalada de frictionless sin importar el paquete.
+    
+    Solo se lee el archivo METADATA de la distribución; importar frictionless
+    arrastra pandas, jsonschema, pyyaml, etc., y aquí solo se quiere el texto
+    de la casilla de validación.
     
-    Args:
-        level: Nivel del mensaje ("ERROR", "WARN", "OK", "INFO")
-        
     Returns:
-        str: Emoji representativo del nivel
+        str | None: Versión (ej: "5.18.1") o None si no está instalado
+    """
+    from importlib.metadata import version, PackageNotFoundError
+    try:
+        return version("frictionless")
+    except PackageNotFoundError:
+        return None
+
+
+def _populate_timezones(combo, default: str):
+    """
+    Llena el combobox de zonas horarias con un único modelo.
+    
+    Construir el QStandardItemModel completo y asignarlo con setModel evita
+    las ~600 notificaciones de cambio (y repintados) de addItem uno a uno.
+    
+    Args:
+        combo: QComboBox a llenar
+        default: ID de zona horaria seleccionada inicialmente
     """
-    return {"ERROR": "🔴", "WARN": "🟡", "OK": "🟢", "INFO": "🔵"}.get(level, "🔵")
+    model = QStandardItemModel(combo)
+    for txt, tzid in _tz_items_with_gmt(sorted(pytz.all_timezones)):
+        item = QStandardItem(txt)
+        item.setData(tzid, Qt.UserRole)
+        model.appendRow(item)
+
+    # Conserva la selección si el usuario ya la cambió antes de este llenado
+    default = combo.currentData() or default
+    combo.blockSignals(True)
+    combo.setUpdatesEnabled(False)
+    try:
+        combo.setModel(model)
+        combo.setCurrentIndex(max(0, combo.findData(default)))
+    finally:
+        combo.setUpdatesEnabled(True)
+        combo.blockSignals(False)
+
+
+# Patrones de _level_from_msg, en orden de prioridad; equivalen a comparar
+# el mensaje sin espacios iniciales y en minúsculas, sin crear esa copia
+_LEVEL_PATTERNS = (
+    ("ERROR", re.compile(r"^\s*error|traceback", re.I)),
+    ("WARN",  re.compile(r"^\s*warn|warning|advertencia", re.I)),
+    ("OK",    re.compile(r"^\s*(?:validación: ok|listo)|proceso completado", re.I)),
+)
 
 
 def _level_from_msg(msg: str) -> str:
@@ -443,16 +775,71 @@ def _level_from_msg(msg: str) -> str:
     Returns:
         str: Nivel inferido ("ERROR", "WARN", "OK", "INFO")
     """
-    s = msg.strip().lower()
-    if s.startswith("error") or "traceback" in s:
-        return "ERROR"
-    if s.startswith("warn") or "warning" in s or "advertencia" in s:
-        return "WARN"
-    if s.startswith("validación: ok") or s.startswith("listo") or "proceso completado" in s:
-        return "OK"
+    for level, pattern in _LEVEL_PATTERNS:
+        if pattern.search(msg):
+            return level
     return "INFO"
 
 
+# Estructuras ZIP usadas por _count_images_csv_fast
+_ZIP_EOCD_SIG = b"PK\x05\x06"   # fin del directorio central (22 bytes + comentario)
+_ZIP_CDH_SIG = 0x02014B50          # cabecera de entrada del directorio central
+_ZIP_CDH = struct.Struct("<IHHHHHHIIIHHHHHII")  # 46 bytes
+_IMAGES_CSV_RE = re.compile(rb"(?:^|/)images_[^/]*\.csv\Z", re.I)
+
+
+def _count_images_csv_fast(zip_path: Path):
+    """
+    Cuenta los images_*.csv leyendo directamente el directorio central del ZIP.
+    
+    Mapea el archivo en memoria (mmap), localiza el registro de fin de
+    directorio central (EOCD) y recorre el directorio central extrayendo solo
+    el nombre de cada entrada, sin construir un ZipInfo por entrada como
+    zipfile.ZipFile. El sistema operativo solo carga las páginas que se tocan:
+    la cola del archivo y el tramo del directorio central hasta el segundo
+    hallazgo, donde se detiene.
+    
+    Args:
+        zip_path: Ruta del archivo ZIP a analizar
+        
+    Returns:
+        int | None: Número de images_*.csv (máximo 2), o None si el archivo
+        no se puede leer por esta vía (ZIP64, multivolumen, datos antepuestos
+        o estructura inesperada); en ese caso se debe usar zipfile.
+    """
+    with open(zip_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < 22:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = mm.rfind(_ZIP_EOCD_SIG, max(0, size - 22 - 0xFFFF))
+            if pos < 0 or pos + 22 > size:
+                return None
+            (_, disk, cd_disk, _, n_entries,
+             cd_size, cd_offset, _) = struct.unpack_from("<IHHHHIIH", mm, pos)
+            if disk or cd_disk or n_entries == 0xFFFF or cd_offset == 0xFFFFFFFF:
+                return None
+            cd_end = cd_offset + cd_size
+            if cd_end > pos:
+                return None
+
+            count = 0
+            off = cd_offset
+            for _ in range(n_entries):
+                if off + 46 > cd_end:
+                    return None
+                fields = _ZIP_CDH.unpack_from(mm, off)
+                if fields[0] != _ZIP_CDH_SIG:
+                    return None
+                name_len, extra_len, comment_len = fields[10], fields[11], fields[12]
+                if _IMAGES_CSV_RE.search(mm[off + 46:off + 46 + name_len]):
+                    count += 1
+                    if count > 1:
+                        break
+                off += 46 + name_len + extra_len + comment_len
+            return count
+
+
 def _detect_initiative_zip(zip_path: Path) -> int:
     """
     Detecta si un ZIP es de iniciativa (no soportado) contando archivos images_*.csv.
@@ -465,17 +852,27 @@ def _detect_initiative_zip(zip_path: Path) -> int:
         
     Returns:
         int: Número de archivos images_*.csv encontrados.
-             Si > 1, es una iniciativa (no soportada).
+             Si > 1, es una iniciativa (no soportada). El recorrido se
+             detiene en el segundo hallazgo, así que el valor máximo es 2.
              
     Raises:
         zipfile.BadZipFile: Si el archivo no es un ZIP válido
     """
+    count = _count_images_csv_fast(zip_path)
+    if count is not None:
+        return count
+
+    # Respaldo: zipfile (ZIP64, datos antepuestos, archivos dañados)
     count = 0
     with zipfile.ZipFile(str(zip_path), "r") as z:
-        for n in z.namelist():
-            base = os.path.basename(n).lower()
-            if base.startswith("images_") and base.endswith(".csv"):
+        for info in z.infolist():
+            name = info.filename
+            # Solo se normaliza el nombre base, y solo sus extremos
+            base = name[name.rfind("/") + 1:]
+            if len(base) >= 11 and base[:7].lower() == "images_" and base[-4:].lower() == ".csv":
                 count += 1
+                if count > 1:
+                    break
     return count
 
 
@@ -503,27 +900,18 @@ def main():
     Returns:
         int: Código de salida de la aplicación (0 si es exitoso)
     """
-    # ========================================================================
-    # CONFIGURACIÓN HIDPI PARA PANTALLAS DE ALTA RESOLUCIÓN
-    # ========================================================================
-    os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
-    os.environ["QT_ENABLE_HIGHDPI_SCALING"]   = "1"
-    QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, True)
-    QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps, True)
-
+    # La configuración HiDPI se aplica al importar el módulo (ver arriba)
     app = QtWidgets.QApplication(sys.argv)
 
     # ========================================================================
     # CARGA DE INTERFAZ Y RECURSOS
     # ========================================================================
     # Cargar iconos de la aplicación
-    icon_png = resource_path("assets", "app_icon.png")
-    icon_ico = resource_path("assets", "app_icon.ico")
-    app_icon = QIcon(str(icon_png)) if icon_png.exists() else (QIcon(str(icon_ico)) if icon_ico.exists() else None)
+    icon_file = _asset("app_icon.png") or _asset("app_icon.ico")
+    app_icon = QIcon(icon_file) if icon_file else None
     
-    # Cargar diseño de interfaz desde archivo .ui
-    ui_file = resource_path("ui", "camtrapdp.ui")
-    w = uic.loadUi(str(ui_file))
+    # Cargar diseño de interfaz (precompilado si está disponible)
+    w = _load_main_widget()
     w.setWindowTitle("WI2CamtrapDP")
     
     # Aplicar icono a ventana y aplicación
@@ -531,10 +919,6 @@ def main():
         app.setWindowIcon(app_icon)
         w.setWindowIcon(app_icon)
 
-    # Ocultar “Guardar log de ejecución” si existe
-    if hasattr(w, "chkSaveLog"):
-        w.chkSaveLog.setChecked(False); w.chkSaveLog.setVisible(False); w.chkSaveLog.setEnabled(False)
-
     # Tamaño inicial
     screen = w.screen() or app.primaryScreen()
     geo = screen.availableGeometry()
@@ -581,191 +965,88 @@ def main():
     # ========================================================================
     # SISTEMA DE SEGUIMIENTO: TABS CON VISTA RESUMIDA Y DETALLADA
     # ========================================================================
-    gl = getattr(w, "groupLog", None)
-    if gl and hasattr(w, "logConsole"):
-        # Cambiar título del groupBox para reflejar funcionalidad de seguimiento
-        if hasattr(gl, "setTitle"):
-            gl.setTitle("📋 Seguimiento de ejecución")
+    gl = w.groupLog
+    # Cambiar título del groupBox para reflejar funcionalidad de seguimiento
+    gl.setTitle("📋 Seguimiento de ejecución")
         
-        # Crear sistema de tabs con dos vistas
-        w.logTabs = QTabWidget()
-        w.logTabs.setObjectName("logTabs")
+    # Crear sistema de tabs con dos vistas
+    w.logTabs = QTabWidget()
+    w.logTabs.setObjectName("logTabs")
         
-        # ====================================================================
-        # TAB 1: VISTA RESUMIDA (TABLA)
-        # ====================================================================
-        # Crear tabla para mostrar resumen de eventos importantes
-        w.logTable = QTableWidget(0, 3)
-        w.logTable.setObjectName("logTable")
-        w.logTable.setHorizontalHeaderLabels(["Hora", "Nivel", "Mensaje"])
-        w.logTable.horizontalHeader().setStretchLastSection(True)
-        w.logTable.verticalHeader().setVisible(False)
-        w.logTable.setEditTriggers(QTableWidget.NoEditTriggers)
-        w.logTable.setSelectionBehavior(QTableWidget.SelectRows)
-        w.logTable.setAlternatingRowColors(True)
+    # ====================================================================
+    # TAB 1: VISTA RESUMIDA (TABLA)
+    # ====================================================================
+    # Crear tabla para mostrar resumen de eventos importantes
+    w.logTable = QTableView()
+    w.logTable.setObjectName("logTable")
+    w.logTable.setModel(LogTableModel(w.logTable))
+    w.logTable.horizontalHeader().setStretchLastSection(True)
+    w.logTable.verticalHeader().setVisible(False)
+    w.logTable.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    w.logTable.setSelectionBehavior(QAbstractItemView.SelectRows)
+    w.logTable.setAlternatingRowColors(True)
         
-        # ====================================================================
-        # TAB 2: VISTA DETALLADA (TEXTO)
-        # ====================================================================
-        # Reutilizar widget logConsole existente para vista de texto completo
-        gl.layout().removeWidget(w.logConsole)
+    # ====================================================================
+    # TAB 2: VISTA DETALLADA (TEXTO)
+    # ====================================================================
+    # Reutilizar widget logConsole existente para vista de texto completo
+    gl.layout().removeWidget(w.logConsole)
         
-        # Agregar ambas vistas como tabs
-        w.logTabs.addTab(w.logTable, "📊 Resumen")
-        w.logTabs.addTab(w.logConsole, "📝 Detalles")
-        gl.layout().addWidget(w.logTabs)
+    # Agregar ambas vistas como tabs
+    w.logTabs.addTab(w.logTable, "📊 Resumen")
+    w.logTabs.addTab(w.logConsole, "📝 Detalles")
+    gl.layout().addWidget(w.logTabs)
 
     # ========================================================================
     # FOOTER: LOGO Y CITACIÓN
     # ========================================================================
-    footer = QFrame()
-    fb = QHBoxLayout(footer)
-    fb.setContentsMargins(0, 6, 0, 0)
-    
-    # Logo del Instituto Humboldt
-    logo_lbl = AspectLabel(fit="height")
-    logo_lbl.setFixedHeight(18)
-    logo_path = resource_path("assets", "logo_humboldt.png")
-    if logo_path.exists():
-        pm = QPixmap(str(logo_path))
-        if not pm.isNull():
-            logo_lbl.setPixmap(pm)
-    
-    fb.addWidget(logo_lbl, 0, Qt.AlignLeft | Qt.AlignVCenter)
-    fb.addSpacing(8)
-    
-    # Texto de citación
+    # Un único QLabel con HTML: logo en línea + texto de citación
+    logo_path = _asset("logo_humboldt.png")
+    logo_html = ""
+    if logo_path:
+        src = logo_path if logo_path.startswith(":") else Path(logo_path).as_uri()
+        logo_html = f'<img src="{src}" height="18" style="vertical-align:middle"/>&nbsp;&nbsp;'
     citation = ("<b>Citar como:</b> Acevedo, C. C., & Diaz-Pulido, A. (2025). Gestión de datos de fototrampeo (v1.0.0) [Software]. "
                 "Red OTUS, Instituto de Investigación de Recursos Biológicos Alexander von Humboldt. Publicado el 7 de septiembre de 2025.")
-    footer_txt = QLabel(citation)
-    footer_txt.setStyleSheet("color:#666; font-size:11px;")
-    footer_txt.setWordWrap(True)
-    footer_txt.setAlignment(Qt.AlignCenter)
-    footer_txt.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
-    fb.addWidget(footer_txt); fb.addSpacing(8); fb.setStretchFactor(logo_lbl, 0); fb.setStretch(fb.indexOf(footer_txt), 1)
+    footer = QLabel(logo_html + citation)
+    footer.setTextFormat(Qt.RichText)
+    footer.setStyleSheet("color:#666; font-size:11px;")
+    footer.setWordWrap(True)
+    footer.setAlignment(Qt.AlignCenter)
+    footer.setContentsMargins(0, 6, 0, 0)
     if root_layout is not None: root_layout.addWidget(footer)
 
     # Zonas horarias
-    if hasattr(w, "cbTimezone"):
-        w.cbTimezone.clear()
-        for txt, tzid in _tz_items_with_gmt(sorted(pytz.all_timezones)):
-            w.cbTimezone.addItem(txt, tzid)
-        idx = max(0, w.cbTimezone.findData("America/Bogota"))
-        w.cbTimezone.setCurrentIndex(idx)
+    # La lista completa (~600 zonas con su offset) se construye después del
+    # primer pintado; mientras tanto el combo ya muestra la zona por defecto
+    w.cbTimezone.clear()
+    w.cbTimezone.addItem("America/Bogota", "America/Bogota")
+    QtCore.QTimer.singleShot(0, lambda: _populate_timezones(w.cbTimezone, "America/Bogota"))
 
     # Checks por defecto
-    try:
-        import frictionless as _fr
-        ver = getattr(_fr, "__version__", None)
-    except Exception:
-        ver = None
-    if hasattr(w, "chkValidate"):   w.chkValidate.setChecked(True);   w.chkValidate.setText(f"🔍 Validar con Frictionless{f' (v{ver})' if ver else ''}")
-    if hasattr(w, "chkMakeZip"):    w.chkMakeZip.setChecked(True);    w.chkMakeZip.setText("📦 Crear ZIP final (incluye fecha-hora)")
-    if hasattr(w, "chkOpenFolder"): w.chkOpenFolder.setChecked(True); w.chkOpenFolder.setText("📂 Abrir carpeta al terminar")
-    if hasattr(w, "chkOverwrite"):  w.chkOverwrite.setChecked(True);  w.chkOverwrite.setText("♻️ Sobrescribir si existe")
+    ver = _frictionless_version()
+    w.chkValidate.setChecked(True);   w.chkValidate.setText(f"🔍 Validar con Frictionless{f' (v{ver})' if ver else ''}")
+    w.chkMakeZip.setChecked(True);    w.chkMakeZip.setText("📦 Crear ZIP final (incluye fecha-hora)")
+    w.chkOpenFolder.setChecked(True); w.chkOpenFolder.setText("📂 Abrir carpeta al terminar")
+    w.chkOverwrite.setChecked(True);  w.chkOverwrite.setText("♻️ Sobrescribir si existe")
 
     # Salida fija a carpeta del ZIP
-    if hasattr(w, "btnOut"): w.btnOut.setVisible(False); w.btnOut.setEnabled(False)
-    if hasattr(w, "leOut"):
-        w.leOut.setReadOnly(True)
-        w.leOut.setPlaceholderText("Se usará la misma carpeta del ZIP")
-        w.leOut.clear()
+    w.btnOut.setVisible(False); w.btnOut.setEnabled(False)
+    w.leOut.setReadOnly(True)
+    w.leOut.setPlaceholderText("Se usará la misma carpeta del ZIP")
+    w.leOut.clear()
 
     # ========================================================================
     # CONFIGURACIÓN DE BOTONES DE RESULTADOS
     # ========================================================================
-    # Ocultar botón de log (funcionalidad no utilizada)
-    if hasattr(w, "btnOpenLog"):
-        w.btnOpenLog.setVisible(False)
-        w.btnOpenLog.setEnabled(False)
-    
-    # Deshabilitar botón de limpiar inicialmente
-    if hasattr(w, "btnClear"):
-        w.btnClear.setEnabled(False)
-    
     # Ocultar botones de apertura de resultados (se habilitan después del procesamiento)
     for bn in ["btnOpenOut", "btnOpenDatapackage"]:
-        if hasattr(w, bn):
-            getattr(w, bn).setEnabled(False)
-            getattr(w, bn).setVisible(False)
+        getattr(w, bn).setEnabled(False)
+        getattr(w, bn).setVisible(False)
 
-    # ========================================================================
-    # REORGANIZACIÓN DE LAYOUT: OPCIONES EN FILA HORIZONTAL
-    # ========================================================================
-    def _remove_from_layout(widget):
-        """
-        Remueve un widget del layout y lo destruye.
-        
-        Args:
-            widget: Widget a remover
-        """
-        if not widget:
-            return
-        parent = widget.parentWidget()
-        lay = parent.layout() if parent else None
-        if lay:
-            lay.removeWidget(widget)
-        widget.setParent(None)
-        widget.deleteLater()
-
-    # Reorganizar checkboxes de opciones en una sola fila
-    if hasattr(w, "groupOptions") and w.groupOptions.layout():
-        grid = w.groupOptions.layout()
-        
-        # Remover checkbox de log si existe (funcionalidad legacy)
-        if hasattr(w, "chkSaveLog"):
-            _remove_from_layout(w.chkSaveLog)
-            delattr(w, "chkSaveLog")
-        
-        # Remover spacers existentes
-        for i in reversed(range(grid.count())):
-            if grid.itemAt(i) and grid.itemAt(i).spacerItem() is not None:
-                grid.takeAt(i)
-        
-        # Agregar checkboxes en fila horizontal
-        col = 0
-        for name in ("chkValidate", "chkMakeZip", "chkOpenFolder", "chkOverwrite"):
-            if hasattr(w, name):
-                grid.addWidget(getattr(w, name), 0, col, 1, 1)
-                grid.setColumnStretch(col, 1)
-                col += 1
-        
-        # Ajustar espaciado y márgenes
-        grid.setHorizontalSpacing(12)
-        grid.setContentsMargins(8, 8, 8, 8)
-
-    # ========================================================================
-    # CONFIGURACIÓN DE BOTONES DE EJECUCIÓN
-    # ========================================================================
-    # Agregar botón de plantilla de correo en sección de ejecución
-    if hasattr(w, "groupRun") and w.groupRun.layout():
-        run_grid = w.groupRun.layout()
-        
-        # Crear botón de plantilla si no existe
-        if not hasattr(w, "btnEmailTemplate"):
-            w.btnEmailTemplate = QPushButton("Plantilla de correo", w.groupRun)
-            w.btnEmailTemplate.setObjectName("btnEmailTemplate")
-        w.btnEmailTemplate.setEnabled(False)  # Deshabilitado inicialmente
-        
-        # Reorganizar botones en fila horizontal
-        if hasattr(w, "btnProcess"):
-            run_grid.addWidget(w.btnProcess, 0, 0, 1, 1)
-        run_grid.addWidget(w.btnEmailTemplate, 0, 1, 1, 1)
-        if hasattr(w, "btnClear"):
-            run_grid.addWidget(w.btnClear, 0, 2, 1, 1)
-        
-        # Configurar stretch factors para distribución uniforme
-        for c in range(3):
-            run_grid.setColumnStretch(c, 1)
-        
-        # Ajustar espaciado y márgenes
-        run_grid.setHorizontalSpacing(12)
-        run_grid.setContentsMargins(8, 8, 8, 8)
-        
-        # Asegurar que la barra de progreso ocupe todo el ancho
-        if hasattr(w, "progressBar"):
-            run_grid.addWidget(w.progressBar, 1, 0, 1, 3)
-            w.progressBar.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+    # Estilos de la barra de progreso: una sola hoja, elegida por la propiedad "state"
+    w.progressBar.setProperty("state", "")
+    w.progressBar.setStyleSheet(_PROGRESS_QSS)
 
     # ========================================================================
     # INICIALIZACIÓN DE ESTADO INTERNO
@@ -774,6 +1055,7 @@ def main():
     w._thread = None              # QThread para procesamiento asíncrono
     w._worker = None              # Worker que ejecuta el pipeline
     w._last_work_dir = ""         # Último directorio de salida generado
+    w._resolved_dp = None         # datapackage.json del último proceso (si existe)
     w._last_validation = ""       # Estado de validación: "OK" | "Con errores" | ""
 
     # ========================================================================
@@ -787,85 +1069,97 @@ def main():
             level: Nivel del mensaje ("ERROR", "WARN", "OK", "INFO")
             message: Contenido del mensaje
         """
-        ts = _now()
-        emoji = _emoji_for(level)
-        
-        # Agregar fila a la tabla de resumen
-        if hasattr(w, "logTable"):
-            row = w.logTable.rowCount(); w.logTable.insertRow(row)
-            for col, val in enumerate([ts, f"{emoji} {level}", message]):
-                it = QTableWidgetItem(val)
-                if col == 1:
-                    if level == "ERROR": it.setForeground(Qt.red)
-                    elif level == "WARN": it.setForeground(Qt.darkYellow)
-                    elif level == "OK": it.setForeground(Qt.darkGreen)
-                it.setToolTip(val); w.logTable.setItem(row, col, it)
-            w.logTable.scrollToBottom()
-        if hasattr(w, "logConsole"): w.logConsole.appendPlainText(f"{ts} | {emoji} {level} | {message}")
+        # Se encola; _flush_logs pinta el lote completo (ver _LOG_FLUSH_MS)
+        label, brush = _LEVEL_TBL.get(level) or (f"🔵 {level}", None)
+        _log_queue.append((_now(), label, brush, message))
+        if not _log_timer.isActive():
+            _log_timer.start()
+
+    # Cola de mensajes pendientes de pintar (variables locales y no atributos
+    # de w: la ventana se reemplaza por el envoltorio con scroll)
+    _log_queue = []
+    _log_timer = QtCore.QTimer(w)
+    _log_timer.setSingleShot(True)
+    _log_timer.setInterval(_LOG_FLUSH_MS)
+
+    def _flush_logs():
+        """Vuelca la cola en la tabla y la consola con un solo repintado."""
+        if not _log_queue:
+            return
+        batch = _log_queue[:]
+        _log_queue.clear()
+        w.logTable.setUpdatesEnabled(False)
+        try:
+            w.logTable.model().append_rows(batch)
+        finally:
+            w.logTable.setUpdatesEnabled(True)
+        w.logTable.scrollToBottom()
+        w.logConsole.appendPlainText("\n".join(
+            f"{ts} | {label} | {message}" for ts, label, _, message in batch
+        ))
+
+    _log_timer.timeout.connect(_flush_logs)
+
+    def clear_logs():
+        """Vacía la tabla, la consola y los mensajes aún no pintados."""
+        _log_queue.clear()
+        _log_timer.stop()
+        w.logConsole.clear()
+        w.logTable.model().clear()
 
     def set_busy(busy: bool):
-        if hasattr(w, "progressBar"): w.progressBar.setRange(0, 0 if busy else 100)
+        w.progressBar.setRange(0, 0 if busy else 100)
+
+    def _set_progress_bar_state(state: str):
+        """Cambia la regla activa de _PROGRESS_QSS sin volver a parsear la hoja de estilo."""
+        w.progressBar.setProperty("state", state)
+        style = w.progressBar.style()
+        style.unpolish(w.progressBar)
+        style.polish(w.progressBar)
 
     def set_progress_bar_error_state():
         """Configura la barra de progreso en estado de error (roja, 100%)."""
-        if hasattr(w, "progressBar"):
-            w.progressBar.setValue(100)
-            w.progressBar.setRange(0, 100)
-            w.progressBar.setStyleSheet("""
-                QProgressBar {
-                    border: 2px solid #c0392b;
-                    border-radius: 5px;
-                    text-align: center;
-                    background-color: #fadbd8;
-                }
-                QProgressBar::chunk {
-                    background-color: #e74c3c;
-                    width: 1px;
-                }
-            """)
+        w.progressBar.setValue(100)
+        w.progressBar.setRange(0, 100)
+        _set_progress_bar_state("error")
 
     def set_progress_bar_success_state():
         """Configura la barra de progreso en estado exitoso (verde, 100%)."""
-        if hasattr(w, "progressBar"):
-            w.progressBar.setValue(100)
-            w.progressBar.setRange(0, 100)
-            w.progressBar.setStyleSheet("""
-                QProgressBar {
-                    border: 2px solid #27ae60;
-                    border-radius: 5px;
-                    text-align: center;
-                    background-color: #d5f4e6;
-                }
-                QProgressBar::chunk {
-                    background-color: #2ecc71;
-                    width: 1px;
-                }
-            """)
+        w.progressBar.setValue(100)
+        w.progressBar.setRange(0, 100)
+        _set_progress_bar_state("ok")
 
     def reset_progress_bar_style():
         """Restaura el estilo por defecto de la barra de progreso."""
-        if hasattr(w, "progressBar"):
-            w.progressBar.setStyleSheet("")
+        _set_progress_bar_state("")
 
     def enable_result_buttons(enabled: bool, has_dp: bool, out_dir: Path | None):
-        if hasattr(w, "btnOpenOut"):        w.btnOpenOut.setEnabled(bool(enabled and out_dir and out_dir.exists()))
-        if hasattr(w, "btnOpenDatapackage"): w.btnOpenDatapackage.setEnabled(enabled and has_dp)
-
-    def update_email_button_state(work_dir: Path | None = None):
-        """Habilita el botón si existe datapackage.json (desde label, work_dir o _last_work_dir)."""
-        has_dp = False
-        if hasattr(w, "lblDatapackagePath"):
-            ptxt = (w.lblDatapackagePath.text() or "").strip()
-            if ptxt and Path(ptxt).exists():
-                has_dp = True
-        if not has_dp and work_dir:
-            cand = Path(work_dir) / "output" / "datapackage.json"
-            has_dp = cand.exists()
-        if not has_dp and getattr(w, "_last_work_dir", ""):
-            cand = Path(w._last_work_dir) / "output" / "datapackage.json"
-            has_dp = cand.exists()
-        if hasattr(w, "btnEmailTemplate"):
-            w.btnEmailTemplate.setEnabled(bool(has_dp))
+        w.btnOpenOut.setEnabled(bool(enabled and out_dir and out_dir.exists()))
+        w.btnOpenDatapackage.setEnabled(enabled and has_dp)
+
+    def update_email_button_state():
+        """Habilita el botón si hay datapackage.json (resuelto por on_finished o por el watcher)."""
+        w.btnEmailTemplate.setEnabled(bool(getattr(w, "_resolved_dp", None)))
+
+    # La carpeta output/ del último proceso se vigila con QFileSystemWatcher:
+    # el botón de plantilla sigue al datapackage.json sin consultar el disco
+    # en cada acción de la interfaz
+    _dp_watcher = QtCore.QFileSystemWatcher(w)
+
+    def watch_output_dir(out_dir: Path | None):
+        """Vigila out_dir (o deja de vigilar si es None)."""
+        watched = _dp_watcher.directories()
+        if watched:
+            _dp_watcher.removePaths(watched)
+        if out_dir is not None and out_dir.is_dir():
+            _dp_watcher.addPath(str(out_dir))
+
+    def _on_output_dir_changed(path: str):
+        dp_file = Path(path) / "datapackage.json"
+        w._resolved_dp = str(dp_file) if dp_file.exists() else None
+        update_email_button_state()
+
+    _dp_watcher.directoryChanged.connect(_on_output_dir_changed)
 
     # ===== Acciones UI =====
     def choose_zip():
@@ -876,30 +1170,44 @@ def main():
         if path:
             w.leZip.setText(path)
             out_dir = str(Path(path).resolve().parent)
-            if hasattr(w, "leOut"): w.leOut.setText(out_dir)
+            w.leOut.setText(out_dir)
             append_log("INFO", f"Seleccionado: {path}")
-            if hasattr(w, "btnProcess"): w.btnProcess.setEnabled(True)
+            w.btnProcess.setEnabled(True)
             enable_result_buttons(False, False, None)
-            update_email_button_state(None)
+            update_email_button_state()
 
     def _set_path_label(lbl_name: str, path_obj):
         """Escribe una ruta candidata en el label (o vacío si no aplica), sin 'None\\...'.
         Acepta Path o str; ignora None."""
-        if hasattr(w, lbl_name):
-            txt = ""
-            if path_obj is not None:
-                try:
-                    txt = str(Path(path_obj))
-                except Exception:
-                    txt = ""
-            getattr(w, lbl_name).setText(txt)
+        txt = ""
+        if path_obj is not None:
+            try:
+                txt = str(Path(path_obj))
+            except Exception:
+                txt = ""
+        getattr(w, lbl_name).setText(txt)
+
+    # Último datapackage.json leído: [ruta, (mtime_ns, tamaño), dict]
+    _dp_cache = ["", None, None]
+
+    def _read_datapackage(dp_path: str) -> dict:
+        """Lee datapackage.json; reutiliza el último si el archivo no cambió."""
+        st = os.stat(dp_path)
+        sig = (st.st_mtime_ns, st.st_size)
+        if _dp_cache[0] == dp_path and _dp_cache[1] == sig:
+            return _dp_cache[2]
+        with open(dp_path, "rb") as f:
+            dp = json.loads(f.read())
+        _dp_cache[:] = [dp_path, sig, dp]
+        return dp
 
     def _open_email_template_dialog(parent):
         """Diálogo de plantilla de correo (rellena desde datapackage.json)."""
-        dp_path = ""
+        # Estrategia 0: el datapackage.json ya resuelto al terminar el proceso
+        dp_path = getattr(parent, "_resolved_dp", None) or ""
         
         # Estrategia 1: desde lblDatapackagePath
-        if hasattr(parent, "lblDatapackagePath") and parent.lblDatapackagePath.text().strip():
+        if not dp_path and parent.lblDatapackagePath.text().strip():
             dp_path = parent.lblDatapackagePath.text().strip()
             print(f"DEBUG: Intentando desde lblDatapackagePath: {dp_path}")
         
@@ -912,21 +1220,6 @@ def main():
             else:
                 print(f"DEBUG: No existe en _last_work_dir: {cand}")
         
-        # Estrategia 3: buscar en directorio actual/reciente (fallback adicional)
-        if not dp_path:
-            # Buscar en el directorio de salida configurado
-            if hasattr(parent, "leOut") and parent.leOut.text().strip():
-                out_dir = Path(parent.leOut.text().strip())
-                # Buscar directorios que empiecen con "WI2CamtrapDP_"
-                potential_dirs = list(out_dir.glob("WI2CamtrapDP_*"))
-                if potential_dirs:
-                    # Tomar el más reciente
-                    latest_dir = max(potential_dirs, key=lambda x: x.stat().st_mtime)
-                    cand = latest_dir / "output" / "datapackage.json"
-                    if cand.exists():
-                        dp_path = str(cand)
-                        print(f"DEBUG: Encontrado por búsqueda en output dir: {dp_path}")
-        
         # Verificación final
         if not dp_path or not Path(dp_path).exists():
             error_msg = f"No se encontró el archivo datapackage.json."
@@ -938,8 +1231,7 @@ def main():
             return
             
         try:
-            with open(dp_path, "r", encoding="utf-8") as f:
-                dp = json.load(f)
+            dp = _read_datapackage(dp_path)
         except Exception as e:
             QMessageBox.warning(parent, "Error", f"No se pudo leer datapackage.json:\n{e}")
             return
@@ -982,8 +1274,8 @@ def main():
         dlg.exec_()
 
     # Conexiones
-    if hasattr(w, "btnZip"): w.btnZip.clicked.connect(choose_zip)
-    if hasattr(w, "btnEmailTemplate"): w.btnEmailTemplate.clicked.connect(lambda: _open_email_template_dialog(w))
+    w.btnZip.clicked.connect(choose_zip)
+    w.btnEmailTemplate.clicked.connect(lambda: _open_email_template_dialog(w))
 
     # Limpiar
     def clear_ui():
@@ -995,82 +1287,124 @@ def main():
             QMessageBox.information(w, "En ejecución", "Espera a que termine para limpiar."); return
         for name in ["leZip","leOut","lblStatus","lblDeploymentsPath","lblMediaPath",
                      "lblObservationsPath","lblDatapackagePath","lblZipPath","lblLogPath","lblValidateResult"]:
-            if hasattr(w, name):
-                obj = getattr(w, name); (obj.clear() if hasattr(obj,"clear") else obj.setText(""))
-        if hasattr(w,"logConsole"): w.logConsole.clear()
-        if hasattr(w,"logTable"):   w.logTable.setRowCount(0)
-        if hasattr(w,"progressBar"): 
-            w.progressBar.setValue(0)
-            w.progressBar.setRange(0,100)
-            reset_progress_bar_style()
-        if hasattr(w,"lblStatus"): 
-            w.lblStatus.setStyleSheet("")  # Restaurar estilo por defecto
-        if hasattr(w,"btnProcess"): w.btnProcess.setEnabled(bool(getattr(w,"leZip",None) and w.leZip.text().strip()))
-        if hasattr(w,"btnClear"):   w.btnClear.setEnabled(False)
-        update_email_button_state(None)
+            getattr(w, name).clear()
+        clear_logs()
+        w.progressBar.setValue(0)
+        w.progressBar.setRange(0,100)
+        reset_progress_bar_style()
+        w.lblStatus.setStyleSheet("")  # Restaurar estilo por defecto
+        w.btnProcess.setEnabled(bool(w.leZip.text().strip()))
+        w.btnClear.setEnabled(False)
+        w._resolved_dp = None
+        watch_output_dir(None)
+        update_email_button_state()
         enable_result_buttons(False, False, None)
         w._last_work_dir = ""
         w._last_validation = ""
 
-    if hasattr(w, "btnClear"): w.btnClear.clicked.connect(clear_ui)
+    w.btnClear.clicked.connect(clear_ui)
 
     # Procesar
+    # Inspección del ZIP en curso (se conserva la referencia hasta que responda)
+    _inspector = [None]
+
     def on_process():
-        zip_txt = w.leZip.text().strip() if hasattr(w, "leZip") else ""
+        zip_txt = w.leZip.text().strip()
         if not zip_txt or not Path(zip_txt).exists():
             QMessageBox.warning(w, "Falta ZIP", "Selecciona un archivo .zip válido."); return
-        try: images_files = _detect_initiative_zip(Path(zip_txt))
-        except Exception as e:
-            QMessageBox.warning(w, "ZIP inválido", f"No se pudo inspeccionar el ZIP:\n{e}"); return
+
+        # La inspección corre en el pool global; la UI sigue respondiendo
+        w.btnProcess.setEnabled(False)
+        w.lblStatus.setText("🔎 Inspeccionando ZIP…")
+        w.lblStatus.setStyleSheet("")
+        insp = ZipInspector(zip_txt)
+        insp.signals.detected.connect(lambda n: on_zip_inspected(zip_txt, n))
+        insp.signals.failed.connect(on_zip_inspect_failed)
+        _inspector[0] = insp
+        QtCore.QThreadPool.globalInstance().start(insp)
+
+    def on_zip_inspect_failed(err: str):
+        _inspector[0] = None
+        w.lblStatus.setText("-")
+        w.btnProcess.setEnabled(True)
+        QMessageBox.warning(w, "ZIP inválido", f"No se pudo inspeccionar el ZIP:\n{err}")
+
+    def on_zip_inspected(zip_txt: str, images_files: int):
+        _inspector[0] = None
         if images_files > 1:
-            msg = (f"Se detectaron {images_files} archivos 'images_*.csv'. Parece una exportación de una INICIATIVA. "
+            msg = (f"Se detectaron al menos {images_files} archivos 'images_*.csv'. Parece una exportación de una INICIATIVA. "
                    "Esta utilidad solo procesa PROYECTOS.")
             append_log("WARN", msg); QMessageBox.warning(w, "No soportado (Iniciativa)", msg)
-            if hasattr(w,"lblStatus"): w.lblStatus.setText("Cancelado")
-            set_busy(False); enable_result_buttons(False, False, None); update_email_button_state(None); return
+            w.lblStatus.setText("Cancelado")
+            w.btnProcess.setEnabled(True)
+            set_busy(False); enable_result_buttons(False, False, None); update_email_button_state(); return
+        start_processing(zip_txt)
 
+    def start_processing(zip_txt: str):
         out_dir = str(Path(zip_txt).resolve().parent)
-        if hasattr(w, "leOut"): w.leOut.setText(out_dir)
+        w.leOut.setText(out_dir)
 
         options = {
-            "timezone_hint": (w.cbTimezone.currentData() if hasattr(w, "cbTimezone") else "America/Bogota"),
-            "validate": (w.chkValidate.isChecked() if hasattr(w, "chkValidate") else True),
-            "make_zip": (w.chkMakeZip.isChecked() if hasattr(w, "chkMakeZip") else True),
-            "open_folder": (w.chkOpenFolder.isChecked() if hasattr(w, "chkOpenFolder") else False),
-            "overwrite": (w.chkOverwrite.isChecked() if hasattr(w, "chkOverwrite") else False),
+            "timezone_hint": (w.cbTimezone.currentData() or "America/Bogota"),
+            "validate": w.chkValidate.isChecked(),
+            "make_zip": w.chkMakeZip.isChecked(),
+            "open_folder": w.chkOpenFolder.isChecked(),
+            "overwrite": w.chkOverwrite.isChecked(),
         }
 
-        if hasattr(w, "lblStatus"): 
-            w.lblStatus.setText("🔄 Procesando…")
-            w.lblStatus.setStyleSheet("")  # Restaurar estilo por defecto
+        w.lblStatus.setText("🔄 Procesando…")
+        w.lblStatus.setStyleSheet("")  # Restaurar estilo por defecto
         reset_progress_bar_style()
         set_busy(True)
-        if hasattr(w,"btnProcess"): w.btnProcess.setEnabled(False)
-        if hasattr(w,"btnClear"):   w.btnClear.setEnabled(False)
-        update_email_button_state(None)
-        if hasattr(w,"logConsole"): w.logConsole.clear()
-        if hasattr(w,"logTable"):   w.logTable.setRowCount(0)
-        if hasattr(w, "lblValidateResult"): w.lblValidateResult.setText("")
+        w.btnProcess.setEnabled(False)
+        w.btnClear.setEnabled(False)
+        w._resolved_dp = None
+        watch_output_dir(None)
+        update_email_button_state()
+        clear_logs()
+        w.lblValidateResult.setText("")
         append_log("INFO", "→ Procesando…")
         enable_result_buttons(False, False, None)
 
-        th = QThread(); worker = Worker(Path(zip_txt), Path(out_dir), options); worker.moveToThread(th)
+        th = QThread(); worker = Worker(zip_txt, out_dir, options); worker.moveToThread(th)
         w._thread, w._worker = th, worker
         th.started.connect(worker.run)
 
+        _last_bar_t = [0.0]  # último setValue de la barra (time.monotonic)
+        _pending_pct = [None]  # último pct descartado por el límite de repintado
+        _bar_timer = QtCore.QTimer(w)
+        _bar_timer.setSingleShot(True)
+        _bar_timer.setInterval(int(_BAR_MIN_INTERVAL_S * 1000))
+
+        def _set_bar(pct: int):
+            _bar_timer.stop(); _pending_pct[0] = None
+            _last_bar_t[0] = time.monotonic()
+            w.progressBar.setValue(min(100, pct))
+
+        def _flush_bar():
+            """Aplica el último pct que quedó retenido por el límite de repintado."""
+            if _pending_pct[0] is not None:
+                _set_bar(_pending_pct[0])
+
+        _bar_timer.timeout.connect(_flush_bar)
+
         def on_progress(pct: int, msg: str):
             if msg:
                 append_log(_level_from_msg(msg), msg)
-                low = msg.lower()
-                low_norm = low.replace("ó","o").replace("á","a")
-                if ("validación:" in low) or ("validacion:" in low_norm):
-                    w._last_validation = "OK" if (" ok" in low or " ok" in low_norm) else "Con errores"
-                    if hasattr(w, "lblValidateResult"):
-                        w.lblValidateResult.setText(w._last_validation)
-
-            if hasattr(w,"progressBar") and pct >= 0:
+                if _VALIDATION_RE.search(msg):
+                    w._last_validation = "OK" if _VALIDATION_OK_RE.search(msg) else "Con errores"
+                    w.lblValidateResult.setText(w._last_validation)
+
+            if pct >= 0:
                 if w.progressBar.minimum() == 0 and w.progressBar.maximum() == 0: w.progressBar.setRange(0,100)
-                w.progressBar.setValue(min(100, pct))
+                # A lo sumo un repintado por cuadro (~60 Hz); el 100% siempre pasa
+                # y el último valor retenido se aplica al vencer el intervalo
+                if pct >= 100 or time.monotonic() - _last_bar_t[0] >= _BAR_MIN_INTERVAL_S:
+                    _set_bar(pct)
+                else:
+                    _pending_pct[0] = pct
+                    if not _bar_timer.isActive():
+                        _bar_timer.start()
 
         from typing import Optional
 
@@ -1099,21 +1433,19 @@ def main():
                 # Proceso exitoso: barra verde y mensaje claro
                 append_log("OK", message)
                 append_log("INFO", "✅ Revise la sección 'Resultados' para acceder a los archivos generados.")
-                if hasattr(w, "lblStatus"): 
-                    w.lblStatus.setText("✅ Proceso completado con éxito")
-                    w.lblStatus.setStyleSheet("")
+                w.lblStatus.setText("✅ Proceso completado con éxito")
+                w.lblStatus.setStyleSheet("")
                 set_progress_bar_success_state()
             else:
                 # Proceso con errores: barra roja y mensaje con instrucciones
                 append_log("ERROR", message)
-                if hasattr(w, "lblStatus"): 
-                    w.lblStatus.setText("❌ Ejecución detenida por errores - Requiere revisión")
-                    w.lblStatus.setStyleSheet("color: #c0392b; font-weight: bold;")
+                w.lblStatus.setText("❌ Ejecución detenida por errores - Requiere revisión")
+                w.lblStatus.setStyleSheet("color: #c0392b; font-weight: bold;")
                 set_progress_bar_error_state()
                 append_log("INFO", "🔄 Para volver a procesar: revise los errores en el seguimiento (pestaña '📝 Detalles'), corrija los datos de entrada y haga clic en 'Limpiar' para reiniciar.")
 
             # 1) Normaliza/detecta el work_dir real
-            base_out_dir = Path(w.leOut.text().strip()) if hasattr(w, "leOut") and w.leOut.text().strip() else None
+            base_out_dir = Path(w.leOut.text().strip()) if w.leOut.text().strip() else None
             job_name = Path(zip_txt).stem
             wd = None
 
@@ -1131,14 +1463,16 @@ def main():
             # si aún no hay, no seguimos (evitamos rutas fantasma tipo "None\output\...")
             if not wd or not wd.exists():
                 w._last_work_dir = ""
+                w._resolved_dp = None
+                watch_output_dir(None)
                 # limpiar labels de resultado
                 for nm in ("lblDeploymentsPath","lblMediaPath","lblObservationsPath","lblDatapackagePath","lblZipPath"):
-                    if hasattr(w, nm): getattr(w, nm).setText("")
+                    getattr(w, nm).setText("")
                 # desactivar plantilla y botones
                 enable_result_buttons(False, False, None)
-                update_email_button_state(None)
-                if hasattr(w,"btnProcess"): w.btnProcess.setEnabled(True)
-                if hasattr(w,"btnClear"):   w.btnClear.setEnabled(True)
+                update_email_button_state()
+                w.btnProcess.setEnabled(True)
+                w.btnClear.setEnabled(True)
                 
                 # Solo mostrar mensaje genérico si NO es un error de datos conocido
                 msg_lower = message.lower()
@@ -1163,51 +1497,57 @@ def main():
             out = wd / "output"
             zip_name = f"WI2CamtrapDP_{job_name}.zip"
             def _set_path_label(lbl_name: str, p: Path | None):
-                if hasattr(w, lbl_name):
-                    getattr(w, lbl_name).setText(str(p) if p else "")
+                getattr(w, lbl_name).setText(str(p) if p else "")
 
             _set_path_label("lblDeploymentsPath",  out / "deployments.csv"   if out else None)
             _set_path_label("lblMediaPath",        out / "media.csv"         if out else None)
             _set_path_label("lblObservationsPath", out / "observations.csv"  if out else None)
             _set_path_label("lblDatapackagePath",  out / "datapackage.json"  if out else None)
-            if hasattr(w, "chkMakeZip") and w.chkMakeZip.isChecked():
+            if w.chkMakeZip.isChecked():
                 _set_path_label("lblZipPath", wd / zip_name)
             else:
                 _set_path_label("lblZipPath", None)
 
-            # oculta la fila "Log:" del panel de resultados (si existe)
-            for nm in ("labelLog", "lblLogPath"):
-                if hasattr(w, nm):
-                    getattr(w, nm).hide()
+            # oculta la fila "Log:" del panel de resultados
+            for nm in ("lblLog", "lblLogPath"):
+                getattr(w, nm).hide()
 
             # 3) Verificación real en disco + habilitar botones/plantilla
             dp_file = out / "datapackage.json"
             has_dp  = dp_file.exists()
+            w._resolved_dp = str(dp_file) if has_dp else None
             enable_result_buttons(True, has_dp, out)
-            update_email_button_state(wd)  # 1ª pasada
-            # 2ª pasada por si el FS tarda un instante
-            QtCore.QTimer.singleShot(150, lambda: update_email_button_state(wd))
+            update_email_button_state()
+            # si el FS tarda un instante en mostrar el archivo, el watcher
+            # habilita el botón cuando aparezca
+            watch_output_dir(out)
 
             # 4) Mostrar resultado de validación si no vino por log (mejora UX)
-            if hasattr(w, "lblValidateResult") and not (w.lblValidateResult.text() or "").strip():
+            if not (w.lblValidateResult.text() or "").strip():
                 # si existe dp.json damos por buena la ejecución; el processor ya validó si estaba marcado
                 w.lblValidateResult.setText("OK" if has_dp else "")
 
-            if ok and hasattr(w,"chkOpenFolder") and w.chkOpenFolder.isChecked() and out.exists():
+            if ok and w.chkOpenFolder.isChecked() and out.exists():
                 os.startfile(str(out))
-            if hasattr(w,"btnProcess"): w.btnProcess.setEnabled(True)
-            if hasattr(w,"btnClear"):   w.btnClear.setEnabled(True)
+            w.btnProcess.setEnabled(True)
+            w.btnClear.setEnabled(True)
 
 
-        worker.progress.connect(on_progress)
+        def on_progress_ready():
+            # Un aviso del Worker puede traer varios eventos; sus mensajes
+            # van a la cola de append_log y se pintan juntos
+            for pct, msg in worker.take_progress():
+                on_progress(pct, msg)
+
+        worker.progress_ready.connect(on_progress_ready)
         worker.finished.connect(on_finished)
         worker.finished.connect(th.quit)
         worker.finished.connect(worker.deleteLater)
         th.finished.connect(th.deleteLater)
         th.start(); set_busy(True)
 
-    if hasattr(w, "btnProcess"): w.btnProcess.clicked.connect(on_process)
-    if hasattr(w, "btnEmailTemplate"): w.btnEmailTemplate.clicked.connect(lambda: _open_email_template_dialog(w))
+    w.btnProcess.clicked.connect(on_process)
+    w.btnEmailTemplate.clicked.connect(lambda: _open_email_template_dialog(w))
 
     # Scroll wrapper + promoción de atributos
     def _make_scrollable_and_flexible(window: QtWidgets.QWidget):
@@ -1240,12 +1580,11 @@ def main():
     _promote_children_to_attrs(w)
 
     # Asegura que el botón “promocionado” tenga el slot conectado
-    if hasattr(w, "btnEmailTemplate"):
-        try:
-            w.btnEmailTemplate.clicked.disconnect()
-        except Exception:
-            pass
-        w.btnEmailTemplate.clicked.connect(lambda: _open_email_template_dialog(w))
+    try:
+        w.btnEmailTemplate.clicked.disconnect()
+    except Exception:
+        pass
+    w.btnEmailTemplate.clicked.connect(lambda: _open_email_template_dialog(w))
 
     # Mostrar ventana
     w.show()
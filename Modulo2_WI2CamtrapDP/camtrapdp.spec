@@ -1,10 +1,25 @@
 # camtrapdp.spec  (PyInstaller >= 6.x)
 # Compila con:  pyinstaller camtrapdp.spec
 
-from PyInstaller.utils.hooks import collect_submodules
-from PyInstaller.building.build_main import Analysis, PYZ, EXE
+from PyInstaller.utils.hooks import collect_submodules, copy_metadata
+from PyInstaller.building.build_main import Analysis, PYZ, EXE, COLLECT
+import os
 import sys
 
+from PyQt5 import uic
+
+# Precompila el .ui (equivale a: pyuic5 ui/camtrapdp.ui -o ui_camtrapdp.py).
+# app.py importa el módulo generado y el ejecutable no lee XML al arrancar.
+with open(os.path.join(SPECPATH, "ui_camtrapdp.py"), "w", encoding="utf-8") as _f:
+    uic.compileUi(os.path.join(SPECPATH, "ui", "camtrapdp.ui"), _f)
+
+# Empaqueta iconos y logo en un módulo de recursos Qt (equivale a:
+# pyrcc5 resources.qrc -o resources_rc.py); se leen desde memoria.
+from PyQt5.pyrcc_main import processResourceFile
+if not processResourceFile([os.path.join(SPECPATH, "resources.qrc")],
+                           os.path.join(SPECPATH, "resources_rc.py"), False):
+    raise SystemExit("No se pudo compilar resources.qrc")
+
 hiddenimports = (
     collect_submodules("frictionless")
     + ["PyQt5.QtPrintSupport", "tatsu"]
@@ -12,17 +27,17 @@ hiddenimports = (
 
 # <-- OJO: solo pares (src, dst); copiará carpetas completas
 datas = [
-    ("ui/camtrapdp.ui", "ui"),
-    ("assets", "assets"),
     ("camtrapdp/schemas", "camtrapdp/schemas"),
 ]
+# Metadatos de frictionless: app.py lee su versión con importlib.metadata
+datas += copy_metadata("frictionless")
 
 a = Analysis(
     ["app.py"],
     pathex=["."],
     binaries=[],
     datas=datas,
-    hiddenimports=hiddenimports,
+    hiddenimports=hiddenimports + ["ui_camtrapdp", "resources_rc"],
     hookspath=[],
     runtime_hooks=[],
     excludes=[],
@@ -31,12 +46,12 @@ a = Analysis(
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=None)
 
+# Salida en carpeta (onedir): evita descomprimir el runtime en cada arranque
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
+    [],
+    exclude_binaries=True,
     name="WI2CamtrapDP",
     debug=False,
     bootloader_ignore_signals=False,
@@ -46,4 +61,12 @@ exe = EXE(
     icon="assets/app_icon.ico" if sys.platform.startswith("win") else None,
 )
 
-# Si prefieres salida en carpeta (onedir), cambia a COLLECT.
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=True,
+    name="WI2CamtrapDP",
+)
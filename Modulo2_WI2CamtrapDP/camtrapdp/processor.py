@@ -176,13 +176,122 @@ def include_if_any(df: pd.DataFrame, col: str, series_like):
         pass
 
 
+# Formato de fecha de Wildlife Insights (día/mes/año) y formato de salida
+_WI_TS_FORMAT = "%d/%m/%Y %H:%M"
+_ISO_UTC_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def to_iso_utc_series(values, tz_hint="America/Bogota") -> pd.Series:
+    """
+    Convierte una columna de timestamps a formato ISO 8601 UTC (terminado en 'Z').
+    
+    La columna completa se parsea con una sola llamada a pd.to_datetime y se
+    localiza/convierte por grupos de zona horaria, en lugar de pagar el parser
+    de pandas fila por fila.
+    
+    Args:
+        values: Serie (o secuencia) de valores a convertir
+        tz_hint: Zona horaria para timestamps naive; un string para toda la
+                 columna o una Serie/secuencia alineada (una zona por fila)
+        
+    Returns:
+        pd.Series: Strings "YYYY-MM-DDTHH:MM:SSZ" (dtype object) con pd.NA
+                   donde el valor es inválido o vacío; conserva el índice
+                   de values si es una Serie
+                   
+    Note:
+        - Primero se intenta el formato día/mes/año de WI y luego ISO 8601;
+          los valores restantes se infieren uno a uno (por valor único)
+        - Timestamps naive se asumen en la zona horaria tz_hint; si no se
+          puede aplicar (o es NaN/pd.NA) se asume UTC; con zona None el
+          resultado es pd.NA
+        - Strings vacíos, "nan" y horas ambiguas retornan pd.NA
+    """
+    src = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    n = len(src)
+    out = pd.Series(pd.NA, index=range(n), dtype=object)
+    if n == 0:
+        out.index = src.index
+        return out
+
+    txt = src.astype(str).str.strip().reset_index(drop=True)
+    empty = (src.isna().to_numpy() | txt.eq("").to_numpy() | txt.str.lower().eq("nan").to_numpy())
+    txt = txt.mask(empty)
+
+    # 1) Formato de WI para toda la columna
+    naive = pd.to_datetime(txt, format=_WI_TS_FORMAT, errors="coerce").to_numpy(copy=True)
+
+    # 2) ISO 8601 sin zona (el otro formato habitual), también vectorizado
+    aware = {}
+    pending = np.flatnonzero(pd.isna(naive) & ~empty)
+    if len(pending):
+        try:
+            iso = pd.to_datetime(txt.iloc[pending], format="ISO8601", errors="coerce")
+        except Exception:
+            iso = None
+        if iso is not None and iso.dtype.kind == "M" and iso.dt.tz is None:
+            iso_vals = iso.to_numpy()
+            hit = ~pd.isna(iso_vals)
+            naive[pending[hit]] = iso_vals[hit]
+            pending = pending[~hit]
+
+    # 3) Inferencia valor a valor para el resto; los timestamps con zona
+    #    propia se convierten directamente
+    if len(pending):
+        parsed = {}
+        for pos in pending:
+            v = txt.iat[pos]
+            if v not in parsed:
+                parsed[v] = pd.to_datetime(v, utc=False, errors="coerce", dayfirst=False)
+            ts = parsed[v]
+            if pd.isna(ts):
+                continue
+            try:
+                if ts.tzinfo is None:
+                    naive[pos] = ts.to_datetime64()
+                else:
+                    aware[pos] = ts.tz_convert("UTC")
+            except Exception:
+                continue
+
+    # 4) Localización por zona horaria y conversión a UTC. Zona NaN/pd.NA
+    #    (p. ej. deployment sin timezone) -> se asume UTC; zona None -> pd.NA
+    ok = ~pd.isna(naive)
+    if ok.any():
+        dt = pd.Series(naive)
+        if isinstance(tz_hint, str):
+            tzs = pd.Series(tz_hint, index=dt.index, dtype=object)
+        else:
+            tzs = pd.Series(list(tz_hint), dtype=object)
+        is_none = np.fromiter((t is None for t in tzs), dtype=bool, count=n)
+        tzs[tzs.isna().to_numpy() & ~is_none] = "UTC"
+        ok &= ~is_none
+        for tz in tzs[ok].unique():
+            sel = ok & (tzs == tz).to_numpy()
+            sub = dt[sel]
+            try:
+                utc = (sub.dt.tz_localize(tz, nonexistent="shift_forward", ambiguous="NaT")
+                       .dt.tz_convert("UTC"))
+            except Exception:
+                # Fallback: asumir UTC si falla la localización
+                utc = sub.dt.tz_localize("UTC")
+            iso = utc.dt.strftime(_ISO_UTC_FORMAT).astype(object)
+            # Horas ambiguas (cambio de horario) quedan en NaT -> pd.NA
+            out[sel] = iso.where(utc.notna().to_numpy(), pd.NA).to_numpy(dtype=object)
+
+    for pos, ts in aware.items():
+        out.iat[pos] = ts.strftime(_ISO_UTC_FORMAT)
+
+    out.index = src.index
+    return out
+
+
 def to_iso_utc(value, tz_hint: str = "America/Bogota"):
     """
-    Convierte timestamps a formato ISO 8601 UTC (terminado en 'Z').
+    Convierte un timestamp a formato ISO 8601 UTC (terminado en 'Z').
     
-    Normaliza diferentes formatos de fecha/hora a un formato estándar ISO 8601
-    en zona horaria UTC. Maneja timestamps naive (sin zona horaria) localizándolos
-    con la zona horaria sugerida antes de convertir a UTC.
+    Envoltorio escalar de to_iso_utc_series, mantenido por compatibilidad
+    con código externo; dentro del módulo se convierten columnas completas.
     
     Args:
         value: Valor a convertir (string, datetime, etc.)
@@ -195,43 +304,8 @@ def to_iso_utc(value, tz_hint: str = "America/Bogota"):
     Example:
         >>> to_iso_utc("2024-01-15 14:30:00", "America/Bogota")
         '2024-01-15T19:30:00Z'
-        
-    Note:
-        - Timestamps naive se asumen en la zona horaria tz_hint
-        - Strings vacíos o "nan" retornan pd.NA
-        - Errores de conversión retornan pd.NA sin lanzar excepciones
     """
-    if value is None:
-        return pd.NA
-    try:
-        s = str(value).strip()
-        if s == "" or s.lower() == "nan":
-            return pd.NA
-        
-        # Intento de parseo directo
-        # Wildlife Insights usa formato día/mes/año (internacional)
-        # Intentar primero con formato día/mes/año, luego con formato mes/día/año
-        dt = pd.to_datetime(s, format="%d/%m/%Y %H:%M", utc=False, errors="coerce")
-        if pd.isna(dt):
-            # Si falla, intentar sin especificar formato (pandas inferirá)
-            dt = pd.to_datetime(s, utc=False, errors="coerce", dayfirst=False)
-        if pd.isna(dt):
-            return pd.NA
-        
-        # Si es 'naive' (sin zona horaria), localizar con tz_hint
-        if dt.tzinfo is None or str(dt.tzinfo) == "None":
-            try:
-                # Localizar con zona horaria sugerida
-                dt = dt.tz_localize(tz_hint, nonexistent="shift_forward", ambiguous="NaT")
-            except Exception:
-                # Fallback: asumir UTC si falla la localización
-                dt = dt.tz_localize("UTC")
-        
-        # Convertir a UTC
-        dt = dt.tz_convert("UTC")
-        return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-    except Exception:
-        return pd.NA
+    return to_iso_utc_series(pd.Series([value], dtype=object), [tz_hint]).iat[0]
 
 
 def ext_to_mediatype(name: str) -> str:
@@ -1174,12 +1248,13 @@ def process_zip(
     # 2. Conversión de timestamps de deployment a ISO UTC
     # ------------------------------------------------------------------------
     # Normalizar fechas de inicio/fin de despliegues a formato estándar ISO 8601 UTC
-    deploys["deploymentStart"] = [
-        to_iso_utc(a, tz_hint=b) for a, b in zip(deploys.get("start_date", ""), deploys["timezone"])
-    ]
-    deploys["deploymentEnd"] = [
-        to_iso_utc(a, tz_hint=b) for a, b in zip(deploys.get("end_date", ""), deploys["timezone"])
-    ]
+    _no_dates = pd.Series(pd.NA, index=deploys.index, dtype=object)
+    deploys["deploymentStart"] = to_iso_utc_series(
+        deploys["start_date"] if "start_date" in deploys.columns else _no_dates, deploys["timezone"]
+    )
+    deploys["deploymentEnd"] = to_iso_utc_series(
+        deploys["end_date"] if "end_date" in deploys.columns else _no_dates, deploys["timezone"]
+    )
 
     # ------------------------------------------------------------------------
     # 3. Timestamps ISO por imagen según zona horaria del deployment
@@ -1190,10 +1265,14 @@ def process_zip(
         dep_tz = deploys.set_index("deployment_id")["timezone"].to_dict()
     
     # Convertir timestamp de cada imagen usando la zona horaria de su deployment
-    images["timestamp_iso"] = images.apply(
-        lambda r: to_iso_utc(r.get("timestamp"),
-                             tz_hint=dep_tz.get(r.get("deployment_id"), timezone_hint)),
-        axis=1
+    if "deployment_id" in images.columns:
+        img_tz = images["deployment_id"].map(lambda d: dep_tz.get(d, timezone_hint))
+    else:
+        img_tz = timezone_hint
+    images["timestamp_iso"] = to_iso_utc_series(
+        images["timestamp"] if "timestamp" in images.columns
+        else pd.Series(pd.NA, index=images.index, dtype=object),
+        img_tz,
     )
 
     # ------------------------------------------------------------------------
@@ -1859,23 +1938,24 @@ def process_zip(
     has_start = "start_time" in img_for_obs.columns
     has_end = "end_time" in img_for_obs.columns
 
-    def _to_evt_iso(row):
-        tz_hint = dep_tz_map.get(row.get("deployment_id"), timezone_hint)
-        if has_start:
-            start_raw = row.get("start_time")
-            start_iso = to_iso_utc(start_raw, tz_hint=tz_hint) if (start_raw not in [None, ""] and str(start_raw).strip() != "") else row.get("timestamp_iso")
-        else:
-            start_iso = row.get("timestamp_iso")
-        if has_end:
-            end_raw = row.get("end_time")
-            end_iso = to_iso_utc(end_raw, tz_hint=tz_hint) if (end_raw not in [None, ""] and str(end_raw).strip() != "") else row.get("timestamp_iso")
-        else:
-            end_iso = row.get("timestamp_iso")
-        return start_iso, end_iso
-
-    _evt = img_for_obs.apply(lambda r: _to_evt_iso(r), axis=1, result_type="expand")
-    obs_out["eventStart"] = _evt[0]
-    obs_out["eventEnd"] = _evt[1]
+    # Zona horaria por fila según su deployment
+    if "deployment_id" in img_for_obs.columns:
+        obs_tz = img_for_obs["deployment_id"].map(lambda d: dep_tz_map.get(d, timezone_hint))
+    else:
+        obs_tz = timezone_hint
+    ts_iso = (img_for_obs["timestamp_iso"] if "timestamp_iso" in img_for_obs.columns
+              else pd.Series(None, index=img_for_obs.index, dtype=object))
+
+    def _evt_iso(col: str, has_col: bool) -> pd.Series:
+        # Valores None o en blanco usan el timestamp de la imagen
+        if not has_col:
+            return ts_iso
+        raw = img_for_obs[col]
+        blank = raw.map(lambda v: v is None or str(v).strip() == "")
+        return to_iso_utc_series(raw, obs_tz).where(~blank, ts_iso)
+
+    obs_out["eventStart"] = _evt_iso("start_time", has_start)
+    obs_out["eventEnd"] = _evt_iso("end_time", has_end)
 
     obs_out["observationLevel"] = "media"
     
@@ -0,0 +1,6 @@
+"""Hace importable el paquete camtrapdp al ejecutar `pytest tests/`."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,48 @@
+"""Pruebas de normalización de timestamps a ISO 8601 UTC."""
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+
+from camtrapdp.processor import to_iso_utc, to_iso_utc_series
+
+
+def test_formato_wi_se_localiza_con_la_zona_del_deployment():
+    """'15/01/2024 14:30' en Bogotá (UTC-5) -> 19:30 UTC."""
+    res = to_iso_utc_series(["15/01/2024 14:30"], "America/Bogota")
+    assert res.tolist() == ["2024-01-15T19:30:00Z"]
+
+
+@pytest.mark.parametrize("tz", [np.nan, pd.NA])
+def test_zona_ausente_se_asume_utc(tz):
+    """Deployment sin timezone: el timestamp se conserva como UTC (no pd.NA)."""
+    res = to_iso_utc_series(["2024-01-15 14:30:00"], [tz])
+    assert res.tolist() == ["2024-01-15T14:30:00Z"]
+
+
+def test_zona_none_da_na():
+    res = to_iso_utc_series(["2024-01-15 14:30:00"], [None])
+    assert res.iat[0] is pd.NA
+
+
+def test_vacios_y_horas_ambiguas_son_pd_na():
+    """Selección no contigua: los faltantes deben seguir siendo pd.NA, no NaN."""
+    res = to_iso_utc_series(["2024-11-03 01:30:00", "", "2024-01-15 14:30:00"],
+                            "America/New_York")
+    assert res.iat[0] is pd.NA
+    assert res.iat[1] is pd.NA
+    assert res.iat[2] == "2024-01-15T19:30:00Z"
+
+
+def test_conserva_el_indice():
+    values = pd.Series(["15/01/2024 14:30", None], index=["a", "b"])
+    res = to_iso_utc_series(values, pd.Series(["UTC", "UTC"], index=["a", "b"]))
+    assert list(res.index) == ["a", "b"]
+    assert res.tolist()[0] == "2024-01-15T14:30:00Z"
+    assert res.iat[1] is pd.NA
+
+
+def test_to_iso_utc_escalar():
+    assert to_iso_utc("2024-01-15 14:30:00", "America/Bogota") == "2024-01-15T19:30:00Z"
+    assert to_iso_utc("", "America/Bogota") is pd.NA
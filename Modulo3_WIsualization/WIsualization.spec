@@ -32,10 +32,9 @@ pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    name='WIsualization',       # ejecutable único para distribución fácil
+    [],
+    exclude_binaries=True,
+    name='WIsualization',       # onedir: dist/WIsualization/ (arranque sin extracción)
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
@@ -43,3 +42,13 @@ exe = EXE(
     console=False,             # GUI (sin consola)
     icon='src/humboldt_viz/resources/icons/app.ico',
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=True,
+    name='WIsualization',
+)